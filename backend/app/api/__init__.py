@@ -7,7 +7,9 @@ from .routes import (
     challenges,
     config,
     couples,
+    geo,
     health,
+    leaderboard,
     map as map_routes,
     planner,
     recommendations,
@@ -20,6 +22,7 @@ api_router = APIRouter()
 api_router.include_router(health.router, tags=["health"])
 api_router.include_router(config.router, prefix="/config", tags=["config"])
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
+api_router.include_router(geo.router, prefix="/geo", tags=["geo"])
 api_router.include_router(map_routes.router, prefix="/map", tags=["map"])
 api_router.include_router(recommendations.router, prefix="/recommendations", tags=["recommendations"])
 api_router.include_router(planner.router, prefix="/planner", tags=["planner"])
@@ -28,4 +31,5 @@ api_router.include_router(visits.router, prefix="/visits", tags=["visits"])
 api_router.include_router(challenges.router, prefix="/challenges", tags=["challenges"])
 api_router.include_router(reports.router, prefix="/reports", tags=["reports"])
 api_router.include_router(couples.router, prefix="/couples", tags=["couples"])
+api_router.include_router(leaderboard.router, prefix="/leaderboard", tags=["leaderboard"])
 api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from ...core.auth import get_current_user
@@ -11,8 +11,12 @@ from ...schemas import (
     ChallengePlaceCreate,
     ChallengePlaceOut,
     ChallengePlaceUpdate,
+    ChallengeRuleCreate,
+    ChallengeRuleOut,
+    ChallengeRuleUpdate,
     UserPublic,
 )
+from ...services.catalog_cache import bump_catalog_version
 from ...services.challenge_categories import (
     create_challenge_category,
     delete_challenge_category,
@@ -27,6 +31,9 @@ from ...services.challenge_places import (
     list_challenge_places,
     update_challenge_place,
 )
+from ...services.challenge_rules import create_rule, delete_rule, list_rules, update_rule
+from ...services.llm import llm_router
+from ...services.llm_metrics import llm_metrics
 
 router = APIRouter()
 
@@ -50,6 +57,7 @@ async def create_challenge_place_endpoint(
 ) -> ChallengePlaceOut:
     """챌린지 장소 생성"""
     doc = await create_challenge_place(db, payload.model_dump())
+    await bump_catalog_version()
     return ChallengePlaceOut(**doc)
 
 
@@ -88,6 +96,7 @@ async def update_challenge_place_endpoint(
     """챌린지 장소 수정"""
     update_data = payload.model_dump(exclude_none=True)
     doc = await update_challenge_place(db, place_id, update_data)
+    await bump_catalog_version()
     return ChallengePlaceOut(**doc)
 
 
@@ -99,6 +108,7 @@ async def delete_challenge_place_endpoint(
 ) -> dict:
     """챌린지 장소 삭제 (active=False로 설정)"""
     await delete_challenge_place(db, place_id)
+    await bump_catalog_version()
     return {"message": "챌린지 장소가 삭제되었습니다."}
 
 
@@ -111,6 +121,7 @@ async def create_challenge_category_endpoint(
 ) -> ChallengeCategoryOut:
     """챌린지 카테고리 생성"""
     doc = await create_challenge_category(db, payload.model_dump())
+    await bump_catalog_version()
     return ChallengeCategoryOut(**doc)
 
 
@@ -148,6 +159,7 @@ async def update_challenge_category_endpoint(
     """챌린지 카테고리 수정"""
     update_data = payload.model_dump(exclude_none=True)
     doc = await update_challenge_category(db, category_id, update_data)
+    await bump_catalog_version()
     return ChallengeCategoryOut(**doc)
 
 
@@ -159,9 +171,76 @@ async def delete_challenge_category_endpoint(
 ) -> dict:
     """챌린지 카테고리 삭제 (active=False로 설정)"""
     await delete_challenge_category(db, category_id)
+    await bump_catalog_version()
     return {"message": "챌린지 카테고리가 삭제되었습니다."}
 
 
+# 챌린지 규칙 엔드포인트
+@router.post("/challenge-rules", response_model=ChallengeRuleOut)
+async def create_challenge_rule_endpoint(
+    payload: ChallengeRuleCreate,
+    current_user: UserPublic = Depends(check_admin),
+    db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+) -> ChallengeRuleOut:
+    """챌린지 규칙 생성 (코드 수정 없이 시즌 챌린지 등을 추가)"""
+    doc = await create_rule(db, payload.model_dump())
+    return ChallengeRuleOut(**doc)
+
 
+@router.get("/challenge-rules", response_model=list[ChallengeRuleOut])
+async def list_challenge_rules_endpoint(
+    active_only: bool = False,
+    current_user: UserPublic = Depends(check_admin),
+    db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+) -> list[ChallengeRuleOut]:
+    """챌린지 규칙 목록 조회"""
+    rules = await list_rules(db, active_only=active_only)
+    return [ChallengeRuleOut(**r) for r in rules]
 
 
+@router.put("/challenge-rules/{rule_id}", response_model=ChallengeRuleOut)
+async def update_challenge_rule_endpoint(
+    rule_id: str,
+    payload: ChallengeRuleUpdate,
+    current_user: UserPublic = Depends(check_admin),
+    db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+) -> ChallengeRuleOut:
+    """챌린지 규칙 수정 (조건/기간 변경 시 진행도는 다음 조회 때 다시 계산)"""
+    doc = await update_rule(db, rule_id, payload.model_dump(exclude_none=True))
+    return ChallengeRuleOut(**doc)
+
+
+@router.delete("/challenge-rules/{rule_id}")
+async def delete_challenge_rule_endpoint(
+    rule_id: str,
+    current_user: UserPublic = Depends(check_admin),
+    db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+) -> dict:
+    """챌린지 규칙 삭제 (active=False로 설정)"""
+    await delete_rule(db, rule_id)
+    return {"message": "챌린지 규칙이 삭제되었습니다."}
+
+
+# LLM 운영 지표
+@router.get("/llm/metrics")
+async def get_llm_metrics(
+    current_user: UserPublic = Depends(check_admin),
+) -> dict:
+    """
+    LLM 운영 지표
+
+    - providers: 공급자별 지연/오류율 EWMA, 지연 분포, 게이트의 실행 중 호출 수·대기열 길이·거절 수
+    - calls: 프롬프트 종류별 결과(ok/parse_error/...), 캐시 적중률, 지연·토큰 수 분포
+    """
+    return {"providers": llm_router.snapshot(), "calls": llm_metrics.snapshot()}
+
+
+@router.get("/llm/samples")
+async def get_llm_samples(
+    limit: int = Query(default=50, ge=1, le=500),
+    kind: str | None = Query(default=None, description="itinerary / report"),
+    outcome: str | None = Query(default=None, description="ok / parse_error / format_error / empty / error"),
+    current_user: UserPublic = Depends(check_admin),
+) -> dict:
+    """최근 LLM 호출 샘플 (프롬프트/응답, 토큰 수, 지연, 결과). 실패한 호출은 항상 포함됩니다."""
+    return {"samples": llm_metrics.recent_samples(limit=limit, kind=kind, outcome=outcome)}
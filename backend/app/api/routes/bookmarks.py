@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query, Response
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from ...core.auth import get_current_user
@@ -6,17 +6,23 @@ from ...dependencies import get_mongo_db
 from ...schemas import BookmarkCreate, BookmarkOut, UserPublic
 from ...services.bookmarks import add_bookmark, list_bookmarks, remove_bookmark
 from ...services.couples import get_or_create_couple
+from ...services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
 
 router = APIRouter()
 
 
 @router.get("/", response_model=list[BookmarkOut])
 async def get_bookmarks(
+    response: Response,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None, description=f"이전 응답의 {NEXT_CURSOR_HEADER} 헤더 값"),
     current_user: UserPublic = Depends(get_current_user),
     db: AsyncIOMotorDatabase = Depends(get_mongo_db),
 ) -> list[BookmarkOut]:
     couple = await get_or_create_couple(db, current_user.id)
-    bookmarks = await list_bookmarks(db, str(couple["_id"]))
+    bookmarks, next_cursor = await list_bookmarks(db, str(couple["_id"]), limit, cursor)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return [BookmarkOut(**b) for b in bookmarks]
 
 
@@ -1,5 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import DuplicateKeyError
 
 from ...core.auth import get_current_user
 from ...dependencies import get_mongo_db
@@ -9,13 +12,19 @@ from ...schemas import (
     ChallengeStatus,
     LocationVerifyRequest,
     LocationVerifyResponse,
+    NearbyChallengePlace,
+    TraceVerifyRequest,
+    TraceVerifyResponse,
     UserPublic,
 )
-from ...services.challenge_categories import list_challenge_categories
-from ...services.challenge_places import get_challenge_place_by_id, list_challenge_places
+from ...services.catalog_cache import challenge_catalog
+from ...services.challenge_places import list_nearby_challenge_places
 from ...services.challenges import get_progress
-from ...services.couples import calculate_tier, get_couple, get_or_create_couple
+from ...services.couples import calculate_tier, get_or_create_couple
 from ...services.geolocation import calculate_distance, is_within_radius
+from ...services.location_traces import verify_trace
+from ...services.visit_events import with_created_event
+from ...services.visits import get_challenge_visit_flags
 
 router = APIRouter()
 
@@ -26,7 +35,7 @@ async def list_challenge_categories_endpoint(
     db: AsyncIOMotorDatabase = Depends(get_mongo_db),
 ) -> list[ChallengeCategoryOut]:
     """챌린지 카테고리 목록 조회 (일반 사용자용)"""
-    categories = await list_challenge_categories(db, active_only=True)
+    categories = await challenge_catalog.categories(db, active_only=True)
     return [ChallengeCategoryOut(**c) for c in categories]
 
 
@@ -40,6 +49,47 @@ async def get_challenge_progress(
     return [ChallengeProgress(**p) for p in progress]
 
 
+@router.get("/nearby", response_model=list[NearbyChallengePlace])
+async def list_nearby_challenges(
+    latitude: float = Query(..., ge=-90, le=90, description="현재 위치 위도"),
+    longitude: float = Query(..., ge=-180, le=180, description="현재 위치 경도"),
+    radius_meters: float = Query(default=3000, gt=0, le=50000, description="조회 반경 (m)"),
+    limit: int = Query(default=50, ge=1, le=200),
+    current_user: UserPublic = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+) -> list[NearbyChallengePlace]:
+    """반경 내 활성 챌린지 장소를 가까운 순으로 조회 (커플별 위치 인증/리뷰 완료 여부 포함)"""
+    couple = await get_or_create_couple(db, current_user.id)
+    places, categories, visit_flags = await asyncio.gather(
+        list_nearby_challenge_places(db, latitude, longitude, radius_meters, limit),
+        challenge_catalog.categories(db, active_only=True),
+        get_challenge_visit_flags(db, str(couple["_id"])),
+    )
+    category_map = {category["id"]: category for category in categories}
+
+    results = []
+    for place in places:
+        category_info = category_map.get(place.get("category_id"), {})
+        results.append(
+            NearbyChallengePlace(
+                id=place["id"],
+                name=place["name"],
+                description=place["description"],
+                latitude=place["latitude"],
+                longitude=place["longitude"],
+                category_id=place.get("category_id"),
+                category_name=category_info.get("name", "기타"),
+                category_icon=category_info.get("icon"),
+                category_color=category_info.get("color"),
+                badge_reward=place["badge_reward"],
+                points_reward=place["points_reward"],
+                distance_meters=round(place["distance_meters"], 2),
+                **visit_flags.get(place["id"], {}),
+            )
+        )
+    return results
+
+
 @router.post("/verify-location", response_model=LocationVerifyResponse)
 async def verify_location(
     payload: LocationVerifyRequest,
@@ -50,7 +100,7 @@ async def verify_location(
     from bson import ObjectId
     from datetime import datetime
     
-    challenge_place = await get_challenge_place_by_id(db, payload.challenge_place_id)
+    challenge_place = await challenge_catalog.place(db, payload.challenge_place_id)
     if not challenge_place:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -121,7 +171,11 @@ async def verify_location(
                 "created_at": now,
                 "updated_at": now,
             }
-            await db[VISITS_COL].insert_one(visit_doc)
+            try:
+                await db[VISITS_COL].insert_one(with_created_event(visit_doc, now))
+            except DuplicateKeyError:
+                # 동시에 다른 요청(궤적 인증 등)이 같은 장소의 기록을 먼저 만듦 (그 기록도 위치 인증됨)
+                pass
     else:
         message = f"위치 인증 실패. 챌린지 장소로부터 {distance:.0f}m 떨어져 있습니다. (필요: 1km 이내)"
     
@@ -132,53 +186,57 @@ async def verify_location(
     )
 
 
+@router.post("/verify-trace", response_model=TraceVerifyResponse)
+async def verify_location_trace(
+    payload: TraceVerifyRequest,
+    current_user: UserPublic = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+) -> TraceVerifyResponse:
+    """
+    GPS 궤적 일괄 위치 인증
+
+    데이트 중 기록한 궤적을 한 번에 보내면 모든 활성 챌린지 장소의 1km 반경과 비교해
+    반경에 들어온 장소를 모두 위치 인증합니다. (방문 기록은 한 번의 bulk_write로 반영)
+    """
+    couple = await get_or_create_couple(db, current_user.id)
+    places = await challenge_catalog.places(db, active_only=True)
+    points = [point.model_dump() for point in payload.points]
+    verified = await verify_trace(db, str(couple["_id"]), current_user.id, places, points)
+    return TraceVerifyResponse(checked_points=len(points), verified=verified)
+
+
 @router.get("/status", response_model=ChallengeStatus)
 async def get_challenge_status(
     current_user: UserPublic = Depends(get_current_user),
     db: AsyncIOMotorDatabase = Depends(get_mongo_db),
 ) -> ChallengeStatus:
-    """챌린지 상태 조회: 포인트, 배지, 각 챌린지 장소별 진행 상태"""
-    from bson import ObjectId
-    
+    """
+    챌린지 상태 조회: 포인트, 배지, 각 챌린지 장소별 진행 상태
+
+    장소 수와 관계없이 커플 조회 1회 + 방문 집계 1회로 처리합니다. (장소·카테고리는 카탈로그 캐시에서 조회)
+    """
     couple = await get_or_create_couple(db, current_user.id)
     couple_id = str(couple["_id"])
     
-    # 커플의 포인트와 배지 조회
-    couple_doc = await get_couple(db, couple_id)
-    points = couple_doc.get("points", 0) if couple_doc else 0
-    badges = couple_doc.get("badges", []) if couple_doc else []
+    # 커플의 포인트와 배지
+    points = couple.get("points", 0)
+    badges = couple.get("badges", [])
     badge_count = len(badges)
     
     # 티어 계산
     tier_info = calculate_tier(badge_count)
     
-    # 모든 활성 챌린지 장소와 카테고리 정보 조회
-    challenge_places = await list_challenge_places(db, active_only=True)
-    categories = await list_challenge_categories(db, active_only=True)
+    # 활성 챌린지 장소, 카테고리, 장소별 방문 상태를 동시에 조회
+    challenge_places, categories, visit_flags = await asyncio.gather(
+        challenge_catalog.places(db, active_only=True),
+        challenge_catalog.categories(db, active_only=True),
+        get_challenge_visit_flags(db, couple_id),
+    )
     category_map = {category["id"]: category for category in categories}
     
-    # 각 챌린지 장소별 완료 여부 확인
-    VISITS_COL = "visits"
     challenge_statuses = []
-    
     for place in challenge_places:
-        place_obj_id = ObjectId(place["id"])
-        couple_obj_id = ObjectId(couple_id)
-        
-        # 해당 챌린지를 완료했는지 확인
-        completed_visit = await db[VISITS_COL].find_one({
-            "couple_id": couple_obj_id,
-            "challenge_place_id": place_obj_id,
-            "review_completed": True
-        })
-        
-        # 위치 인증만 완료했는지 확인
-        location_verified_visit = await db[VISITS_COL].find_one({
-            "couple_id": couple_obj_id,
-            "challenge_place_id": place_obj_id,
-            "location_verified": True
-        })
-        
+        flags = visit_flags.get(place["id"], {})
         category_id = place.get("category_id")
         category_info = category_map.get(category_id, {})
         
@@ -194,8 +252,8 @@ async def get_challenge_status(
             "category_color": category_info.get("color"),
             "badge_reward": place["badge_reward"],
             "points_reward": place["points_reward"],
-            "location_verified": bool(location_verified_visit),
-            "review_completed": bool(completed_visit),
+            "location_verified": flags.get("location_verified", False),
+            "review_completed": flags.get("review_completed", False),
         }
         challenge_statuses.append(status_info)
     
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, Query
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ...dependencies import get_mongo_db
+from ...schemas import AutocompleteResponse, AutocompleteSuggestion
+from ...services.autocomplete import MAX_SUGGESTIONS, autocomplete_index
+
+router = APIRouter()
+
+
+@router.get("/autocomplete", response_model=AutocompleteResponse)
+async def autocomplete_location(
+    q: str = Query(..., min_length=1, max_length=50, description="입력 중인 지역명/장소명 (예: '강나', '광교')"),
+    limit: int = Query(default=8, ge=1, le=MAX_SUGGESTIONS),
+    db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+) -> AutocompleteResponse:
+    """
+    location_desc 입력용 자동완성
+
+    키 입력마다 호출되므로 인증/DB 조회 없이 메모리 색인만 사용합니다.
+    색인이 오래되었으면 백그라운드 재구성을 예약하고 현재 색인으로 바로 응답합니다.
+    """
+    autocomplete_index.ensure_fresh(db)
+    entries = autocomplete_index.search(q, limit)
+    return AutocompleteResponse(
+        query=q,
+        suggestions=[AutocompleteSuggestion(**entry.to_dict()) for entry in entries],
+    )
@@ -0,0 +1,73 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ...core.auth import get_current_user
+from ...dependencies import get_mongo_db
+from ...schemas import LeaderboardEntry, LeaderboardResponse, UserPublic
+from ...services.couples import get_or_create_couple
+from ...services.leaderboard import around, board_key, board_size, rank_of, top
+
+router = APIRouter()
+
+SCOPE_QUERY = Query(default="global", pattern="^(global|region|month)$", description="global / region / month")
+REGION_QUERY = Query(default=None, max_length=30, description="지역 보드의 시/군 이름 (예: '수원시')")
+MONTH_QUERY = Query(default=None, pattern=r"^\d{4}-\d{2}$", description="월별 보드의 월 (YYYY-MM)")
+
+
+def _key(scope: str, region: str | None, month: str | None) -> str:
+    try:
+        return board_key(scope, region=region, month=month)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+def _mark(entries: list[dict], couple_id: str) -> list[LeaderboardEntry]:
+    return [LeaderboardEntry(**entry, is_me=entry["couple_id"] == couple_id) for entry in entries]
+
+
+@router.get("/", response_model=LeaderboardResponse)
+async def get_leaderboard(
+    scope: str = SCOPE_QUERY,
+    region: str | None = REGION_QUERY,
+    month: str | None = MONTH_QUERY,
+    limit: int = Query(default=10, ge=1, le=100),
+    current_user: UserPublic = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+) -> LeaderboardResponse:
+    """상위 순위와 내 커플의 순위 (전체 / 지역별 / 월별)"""
+    key = _key(scope, region, month)
+    couple_id = str((await get_or_create_couple(db, current_user.id))["_id"])
+    entries = await top(key, limit)
+    me = await rank_of(key, couple_id)
+    return LeaderboardResponse(
+        scope=scope,
+        region=region,
+        month=month,
+        total=await board_size(key),
+        entries=_mark(entries, couple_id),
+        me=LeaderboardEntry(**me, is_me=True) if me else None,
+    )
+
+
+@router.get("/me", response_model=LeaderboardResponse)
+async def get_my_leaderboard_position(
+    scope: str = SCOPE_QUERY,
+    region: str | None = REGION_QUERY,
+    month: str | None = MONTH_QUERY,
+    radius: int = Query(default=2, ge=0, le=20, description="앞뒤로 함께 보여줄 순위 수"),
+    current_user: UserPublic = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+) -> LeaderboardResponse:
+    """내 커플 주변 순위 (예: 수원시 123위와 앞뒤 2팀)"""
+    key = _key(scope, region, month)
+    couple_id = str((await get_or_create_couple(db, current_user.id))["_id"])
+    entries = await around(key, couple_id, radius)
+    me = next((entry for entry in entries if entry["couple_id"] == couple_id), None)
+    return LeaderboardResponse(
+        scope=scope,
+        region=region,
+        month=month,
+        total=await board_size(key),
+        entries=_mark(entries, couple_id),
+        me=LeaderboardEntry(**me, is_me=True) if me else None,
+    )
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query, Response
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from ...core.auth import get_current_user
 from ...dependencies import get_mongo_db
 from ...schemas import PlanCreate, PlanOut, PlanUpdate, UserPublic
 from ...services.couples import get_or_create_couple
+from ...services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
 from ...services.planner import create_plan, delete_plan, list_plans, update_plan
 
 router = APIRouter()
@@ -12,11 +13,16 @@ router = APIRouter()
 
 @router.get("/plans", response_model=list[PlanOut])
 async def list_my_plans(
+    response: Response,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None, description=f"이전 응답의 {NEXT_CURSOR_HEADER} 헤더 값"),
     current_user: UserPublic = Depends(get_current_user),
     db: AsyncIOMotorDatabase = Depends(get_mongo_db),
 ) -> list[PlanOut]:
     couple = await get_or_create_couple(db, current_user.id)
-    plans = await list_plans(db, str(couple["_id"]))
+    plans, next_cursor = await list_plans(db, str(couple["_id"]), limit, cursor)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return [PlanOut(**plan) for plan in plans]
 
 
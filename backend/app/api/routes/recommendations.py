@@ -7,8 +7,10 @@ from fastapi import APIRouter, Depends, Query
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from ...core.auth import get_current_user
+from ...core.config import settings
 from ...dependencies import get_mongo_db, get_redis_client
 from ...schemas.user import UserPublic
+from ...services.course_templates import build_template_courses, race_llm_with_template
 from ...services.geocoding import get_coordinates_from_location
 from ...services.llm import generate_itinerary_suggestions
 from ...services.recommendations import (
@@ -104,19 +106,19 @@ async def get_smart_recommendations(
         "budget": budget_label,
         "additional_context": f"추천 장소: {', '.join([p.get('place_name', '') for p in top_places[:5]])}"
     }    
-    try:
-        ai_suggestions = await generate_itinerary_suggestions(llm_payload)
-    except Exception:
-        # AI 실패 시 기본 제안
-        ai_suggestions = [
-            {
-                "title": "주변 추천 코스",
-                "description": "선택하신 조건에 맞는 장소들을 찾았습니다.",
-                "suggested_places": [p.get("place_name", "") for p in top_places[:3]],
-                "tips": weather_suggestions["tips"],
-                "estimated_total_cost": 0
-            }
-        ]
+    # LLM이 마감 시간 안에 응답하지 않으면 규칙 기반 템플릿 코스를 반환 (LLM은 백그라운드에서 계속 실행)
+    template_courses = build_template_courses(
+        top_places,
+        weather_suggestions,
+        budget_label,
+        location=location_desc,
+        emotion=emotion,
+    )
+    ai_suggestions, course_source = await race_llm_with_template(
+        generate_itinerary_suggestions(llm_payload),
+        template_courses,
+        settings.recommend_llm_deadline_seconds,
+    )
     
     # 6. 응답 구성
     return {
@@ -133,6 +135,7 @@ async def get_smart_recommendations(
         },
         "recommended_places": top_places,
         "ai_course_suggestions": ai_suggestions,
+        "course_source": course_source,
         "summary": {
             "total_places_found": len(nearby_places),
             "after_filtering": len(budget_filtered),
@@ -1,17 +1,28 @@
+import json
+from collections.abc import AsyncIterator
 from datetime import datetime
 
 from bson import ObjectId
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from redis.asyncio import Redis
 
 from ...core.auth import get_current_user
-from ...dependencies import get_mongo_db
-from ...schemas import ReportResponse, SavedReport, UserPublic
+from ...dependencies import get_mongo_db, get_redis_client
+from ...schemas import ReportJobOut, ReportResponse, SavedReport, UserPublic
 from ...services.couples import get_or_create_couple
-from ...services.reports import build_monthly_report
+from ...services.reports import (
+    SAVED_REPORTS_COL,
+    get_or_build_monthly_report,
+    normalize_saved_report,
+    save_report,
+)
+from ...services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, paginate
+from ...services.report_jobs import TERMINAL_STATUSES, events_channel, get_job, submit_report_job
 
 router = APIRouter()
-REPORTS_COL = "saved_reports"
+REPORTS_COL = SAVED_REPORTS_COL
 
 
 @router.get("/monthly", response_model=ReportResponse)
@@ -21,86 +32,140 @@ async def get_monthly_report(
     db: AsyncIOMotorDatabase = Depends(get_mongo_db),
 ) -> ReportResponse:
     couple = await get_or_create_couple(db, current_user.id)
-    report = await build_monthly_report(db, str(couple["_id"]), month, include_summary=False)
+    report = await get_or_build_monthly_report(db, str(couple["_id"]), month, include_summary=False)
     return ReportResponse(**report)
 
 
-@router.post("/monthly/summary", response_model=ReportResponse)
+@router.post("/monthly/summary", response_model=ReportJobOut, status_code=status.HTTP_202_ACCEPTED)
 async def generate_monthly_summary(
     month: str = Query(default_factory=lambda: datetime.utcnow().strftime("%Y-%m")),
     current_user: UserPublic = Depends(get_current_user),
     db: AsyncIOMotorDatabase = Depends(get_mongo_db),
-) -> ReportResponse:
+    redis: Redis = Depends(get_redis_client),
+) -> ReportJobOut:
+    """AI 요약 생성을 작업 큐에 등록 (결과는 GET /jobs/{job_id}의 result)"""
     couple = await get_or_create_couple(db, current_user.id)
-    report = await build_monthly_report(db, str(couple["_id"]), month, include_summary=True)
-    return ReportResponse(**report)
+    job = await submit_report_job(redis, str(couple["_id"]), month)
+    return ReportJobOut(**job)
 
 
-@router.post("/monthly/save", response_model=SavedReport)
+@router.post("/monthly/save", response_model=SavedReport | ReportJobOut)
 async def save_monthly_report(
+    response: Response,
     month: str = Query(default_factory=lambda: datetime.utcnow().strftime("%Y-%m")),
     current_user: UserPublic = Depends(get_current_user),
     db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+    redis: Redis = Depends(get_redis_client),
     report_data: ReportResponse | None = Body(None),
     name: str | None = Body(None),
-) -> SavedReport:
+) -> SavedReport | ReportJobOut:
+    """
+    월간 리포트 저장
+
+    요약이 포함된 리포트 데이터를 받으면 바로 저장해 SavedReport를 반환하고,
+    요약이 없으면 요약 생성과 저장을 작업 큐에 등록해 202와 작업을 반환합니다. (완료 시 saved_report_id)
+    """
     couple = await get_or_create_couple(db, current_user.id)
     couple_id = str(couple["_id"])
-    
+
     # 리포트 데이터가 제공되고 summary가 있으면 재사용 (LLM 호출 방지)
     if report_data and report_data.summary:
-        report_data_dict = report_data.model_dump()
-    else:
-        # 리포트 데이터가 없거나 summary가 없으면 새로 생성
-        report_data_dict = await build_monthly_report(db, couple_id, month, include_summary=True)
-    
-    # 이름이 제공되면 추가, 없으면 기본값 사용
-    if name is not None:
-        report_data_dict["name"] = name
-    elif "name" not in report_data_dict:
-        report_data_dict["name"] = f"{month} 리포트"
-    
-    now = datetime.utcnow()
-    # 날짜별로 여러 리포트를 저장할 수 있도록 항상 새로 생성
-    # (같은 날짜에 여러 리포트를 저장하고 싶은 경우를 위해)
-    doc = {
-        "couple_id": ObjectId(couple_id),
-        **report_data_dict,
-        "created_at": now,
-        "updated_at": now,
-    }
-    result = await db[REPORTS_COL].insert_one(doc)
-    saved_doc = await db[REPORTS_COL].find_one({"_id": result.inserted_id})
-    
-    saved_doc["_id"] = str(saved_doc["_id"])
-    saved_doc["couple_id"] = str(saved_doc["couple_id"])
-    # id 필드를 명시적으로 추가하여 프론트엔드에서 사용할 수 있도록 함
-    saved_doc["id"] = saved_doc["_id"]
-    return SavedReport(**saved_doc)
+        saved_doc = await save_report(db, couple_id, month, report_data.model_dump(), name)
+        return SavedReport(**saved_doc)
+
+    job = await submit_report_job(redis, couple_id, month, save=True, name=name)
+    response.status_code = status.HTTP_202_ACCEPTED
+    return ReportJobOut(**job)
+
+
+@router.post("/jobs", response_model=ReportJobOut, status_code=status.HTTP_202_ACCEPTED)
+async def submit_monthly_summary_job(
+    month: str = Query(default_factory=lambda: datetime.utcnow().strftime("%Y-%m")),
+    save: bool = Query(default=False, description="완료 시 saved_reports에 저장할지 여부"),
+    name: str | None = Body(None, embed=True),
+    current_user: UserPublic = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+    redis: Redis = Depends(get_redis_client),
+) -> ReportJobOut:
+    """
+    AI 요약 리포트 생성을 비동기 작업으로 등록
+
+    LLM 호출을 기다리지 않고 job_id를 바로 반환합니다.
+    결과는 GET /jobs/{job_id}로 조회하거나 GET /jobs/{job_id}/events(SSE)로 구독합니다.
+    """
+    couple = await get_or_create_couple(db, current_user.id)
+    job = await submit_report_job(redis, str(couple["_id"]), month, save=save, name=name)
+    return ReportJobOut(**job)
+
+
+async def _get_owned_job(redis: Redis, db: AsyncIOMotorDatabase, job_id: str, user_id: str) -> dict:
+    couple = await get_or_create_couple(db, user_id)
+    job = await get_job(redis, job_id)
+    if not job or job["couple_id"] != str(couple["_id"]):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="작업을 찾을 수 없습니다.")
+    return job
+
+
+@router.get("/jobs/{job_id}", response_model=ReportJobOut)
+async def get_monthly_summary_job(
+    job_id: str,
+    current_user: UserPublic = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+    redis: Redis = Depends(get_redis_client),
+) -> ReportJobOut:
+    """비동기 요약 작업 상태/결과 조회 (폴링용)"""
+    job = await _get_owned_job(redis, db, job_id, current_user.id)
+    return ReportJobOut(**job)
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_monthly_summary_job(
+    job_id: str,
+    current_user: UserPublic = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+    redis: Redis = Depends(get_redis_client),
+) -> StreamingResponse:
+    """비동기 요약 작업 상태 변경을 Server-Sent Events로 구독 (완료/실패 시 스트림 종료)"""
+    await _get_owned_job(redis, db, job_id, current_user.id)
+
+    async def event_stream() -> AsyncIterator[str]:
+        pubsub = redis.pubsub()
+        await pubsub.subscribe(events_channel(job_id))
+        try:
+            # 구독 이후 현재 상태를 먼저 보내 구독 전에 끝난 작업도 놓치지 않도록 한다
+            job = await get_job(redis, job_id)
+            while job is not None:
+                yield f"data: {ReportJobOut(**job).model_dump_json()}\n\n"
+                if job["status"] in TERMINAL_STATUSES:
+                    break
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=15.0)
+                # 이벤트가 없으면 현재 상태를 다시 보내 연결을 유지한다
+                job = json.loads(message["data"]) if message else await get_job(redis, job_id)
+        finally:
+            await pubsub.unsubscribe(events_channel(job_id))
+            await pubsub.close()
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 
 @router.get("/saved", response_model=list[SavedReport])
 async def get_saved_reports(
+    response: Response,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None, description=f"이전 응답의 {NEXT_CURSOR_HEADER} 헤더 값"),
     current_user: UserPublic = Depends(get_current_user),
     db: AsyncIOMotorDatabase = Depends(get_mongo_db),
 ) -> list[SavedReport]:
     couple = await get_or_create_couple(db, current_user.id)
     couple_id = str(couple["_id"])
     
-    cursor = db[REPORTS_COL].find(
-        {"couple_id": ObjectId(couple_id)}
-    ).sort("created_at", -1)
+    docs, next_cursor = await paginate(
+        db[REPORTS_COL], {"couple_id": ObjectId(couple_id)}, "created_at", -1, limit, cursor
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     
-    reports = []
-    async for doc in cursor:
-        doc["_id"] = str(doc["_id"])
-        doc["couple_id"] = str(doc["couple_id"])
-        # id 필드를 명시적으로 추가하여 프론트엔드에서 사용할 수 있도록 함
-        doc["id"] = doc["_id"]
-        # name 필드가 없으면 기본값 설정
-        if "name" not in doc or not doc["name"]:
-            doc["name"] = f"{doc.get('month', '')} 리포트"
-        reports.append(SavedReport(**doc))
+    reports = [SavedReport(**normalize_saved_report(doc)) for doc in docs]
     
     return reports
 
@@ -125,14 +190,7 @@ async def get_saved_report(
     if not doc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="리포트를 찾을 수 없습니다.")
     
-    doc["_id"] = str(doc["_id"])
-    doc["couple_id"] = str(doc["couple_id"])
-    # id 필드를 명시적으로 추가하여 프론트엔드에서 사용할 수 있도록 함
-    doc["id"] = doc["_id"]
-    # name 필드가 없으면 기본값 설정
-    if "name" not in doc or not doc["name"]:
-        doc["name"] = f"{doc.get('month', '')} 리포트"
-    return SavedReport(**doc)
+    return SavedReport(**normalize_saved_report(doc))
 
 
 @router.delete("/saved/{report_id}")
@@ -1,22 +1,28 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from ...core.auth import get_current_user
 from ...dependencies import get_mongo_db
-from ...schemas import UserPublic, VisitCreate, VisitOut
+from ...schemas import UserPublic, VisitBulkRequest, VisitBulkResponse, VisitBulkResult, VisitCreate, VisitOut
 from ...services.couples import get_or_create_couple
-from ...services.visits import add_visit, list_visits
+from ...services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from ...services.visits import add_visit, add_visits_bulk, list_visits
 
 router = APIRouter()
 
 
 @router.get("/", response_model=list[VisitOut])
 async def get_recent_visits(
+    response: Response,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None, description=f"이전 응답의 {NEXT_CURSOR_HEADER} 헤더 값"),
     current_user: UserPublic = Depends(get_current_user),
     db: AsyncIOMotorDatabase = Depends(get_mongo_db),
 ) -> list[VisitOut]:
     couple = await get_or_create_couple(db, current_user.id)
-    visits = await list_visits(db, str(couple["_id"]))
+    visits, next_cursor = await list_visits(db, str(couple["_id"]), limit, cursor)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return [VisitOut(**v) for v in visits]
 
 
@@ -29,3 +35,21 @@ async def add_visit_record(
     couple = await get_or_create_couple(db, current_user.id)
     visit = await add_visit(db, str(couple["_id"]), current_user.id, payload.model_dump(exclude_none=True))
     return VisitOut(**visit)
+
+
+@router.post("/checkin/bulk", response_model=VisitBulkResponse)
+async def add_visit_records_bulk(
+    payload: VisitBulkRequest,
+    current_user: UserPublic = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+) -> VisitBulkResponse:
+    """
+    여러 방문 기록 일괄 등록 (오프라인 동기화)
+
+    항목별 client_key로 재전송을 구분하며, 항목마다 처리 결과(created/reviewed/duplicate/rejected)를 돌려줍니다.
+    일부 항목이 거절되어도 나머지는 저장됩니다.
+    """
+    couple = await get_or_create_couple(db, current_user.id)
+    items = [item.model_dump(exclude_none=True) for item in payload.items]
+    results = await add_visits_bulk(db, str(couple["_id"]), current_user.id, items)
+    return VisitBulkResponse(results=[VisitBulkResult(**result) for result in results])
@@ -38,7 +38,77 @@ class Settings(BaseSettings):
     # Google Gemini API 설정
     gemini_api_key: str = Field(default="", description="Google Gemini API 키 (환경 변수: GEMINI_API_KEY)")
     gemini_model: str = Field(default="gemini-3-pro-preview")
+    gemini_base_url: str = Field(default="https://generativelanguage.googleapis.com")
+    gemini_timeout_seconds: float = Field(default=60.0)
+
+    # 가짜 LLM 서버(backend/scripts/fake_llm_server.py) 설정: GEMINI_BASE_URL을 이 서버로 지정해 오프라인 부하 테스트
+    # 지연 분포(fixed/uniform/lognormal), 중앙값(ms), 퍼짐 정도, 오류/깨진 응답 비율, 난수 시드
+    fake_llm_latency_distribution: str = Field(default="lognormal")
+    fake_llm_latency_ms: float = Field(default=800.0)
+    fake_llm_latency_spread: float = Field(default=0.5)
+    fake_llm_error_rate: float = Field(default=0.0)
+    fake_llm_malformed_rate: float = Field(default=0.0)
+    fake_llm_seed: int | None = Field(default=None)
+    fake_llm_port: int = Field(default=8100)
+
+    # LLM 동시성 제한: 동시 호출 수, 대기열 길이, 대기 시간 상한(초)
+    llm_max_concurrency: int = Field(default=4)
+    llm_max_queue: int = Field(default=32)
+    llm_queue_timeout_seconds: float = Field(default=20.0)
+
+    # 로컬 Ollama 공급자: 요청 타임아웃(초), 동시 호출 수, 대기열 길이
+    ollama_timeout_seconds: float = Field(default=120.0)
+    ollama_max_concurrency: int = Field(default=1)
+    ollama_max_queue: int = Field(default=8)
+
+    # 프롬프트 종류별 LLM 공급자 후보 (쉼표 구분, 앞쪽 우선: gemini / ollama)
+    llm_route_itinerary: str = Field(default="gemini")
+    llm_route_report: str = Field(default="gemini")
+    # 첫 공급자가 이 시간(초) 안에 응답하지 않으면 두 번째 공급자에도 요청 (0이면 헤징 안 함)
+    llm_hedge_after_seconds: float = Field(default=0.0)
+
+    # LLM 호출 샘플 로그: 정상 호출 보관 비율(실패는 항상 보관), 링버퍼 크기, 프롬프트/응답 최대 보관 길이
+    llm_sample_rate: float = Field(default=0.05)
+    llm_sample_buffer_size: int = Field(default=200)
+    llm_sample_max_chars: int = Field(default=4000)
+
+    # 코스 추천에서 LLM 응답을 기다리는 최대 시간(초), 초과 시 템플릿 코스 반환
+    recommend_llm_deadline_seconds: float = Field(default=3.0)
+
+    # LLM 응답 캐시: TTL(초)과 키별로 모아 둘 응답 변형 수
+    llm_cache_enabled: bool = Field(default=True)
+    llm_cache_ttl_seconds: int = Field(default=60 * 60 * 24)
+    llm_cache_itinerary_variants: int = Field(default=3)
+    llm_cache_report_variants: int = Field(default=1)
     
+    # lifespan 백그라운드 워커 풀 실행 여부 (테스트/TestClient에서는 끔)
+    background_workers_enabled: bool = Field(default=True)
+
+    # 리포트 AI 요약 비동기 작업: 워커 수(0이면 비활성), 최대 시도 횟수, 재시도 백오프(초)
+    report_job_workers: int = Field(default=2)
+    report_job_max_attempts: int = Field(default=3)
+    report_job_retry_backoff_seconds: float = Field(default=5.0)
+    report_job_visibility_timeout_seconds: int = Field(default=300)
+    report_job_ttl_seconds: int = Field(default=60 * 60 * 24)
+    # 처리 중 목록에서 멈춘 작업을 확인하는 주기(초)
+    report_job_requeue_check_seconds: float = Field(default=60.0)
+
+    # 지난 달 리포트 일괄 사전 생성 배치: 동시 실행 수, 분당 LLM 호출 수
+    report_pregen_concurrency: int = Field(default=4)
+    report_pregen_rate_per_minute: float = Field(default=30.0)
+
+    # 지역명 자동완성 색인 재구성 주기 (초)
+    autocomplete_refresh_seconds: int = Field(default=600)
+
+    # 챌린지 카탈로그(장소·카테고리) 캐시: Redis 버전 확인 주기(초), 버전과 무관한 최대 보관 시간(초)
+    challenge_catalog_check_seconds: float = Field(default=5.0)
+    challenge_catalog_max_age_seconds: float = Field(default=600.0)
+
+    # 방문 이벤트(outbox) 소비 워커: 워커 수(0이면 비활성), 대기열이 비었을 때 확인 주기(초), 문서 임대 시간(초)
+    visit_event_workers: int = Field(default=1)
+    visit_event_poll_seconds: float = Field(default=1.0)
+    visit_event_lease_seconds: float = Field(default=30.0)
+
     admin_email: str = Field(default="")  # 관리자 이메일 (관리자 API 접근용)
 
     @property
@@ -0,0 +1,61 @@
+"""
+프로세스 내 경량 메트릭 유틸리티
+
+외부 메트릭 백엔드 없이 관리자 API로 노출할 수 있도록 히스토그램을 메모리에 유지합니다.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Sequence
+from typing import Any
+
+# 지연 시간(초) 기본 버킷
+LATENCY_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Histogram:
+    """
+    누적 버킷 히스토그램
+
+    버킷 카운트는 전체 기간을, p50/p95/p99는 최근 `window`개 관측값을 기준으로 계산합니다.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS, window: int = 1024) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._recent: deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self.buckets, value)] += 1
+        self._recent.append(value)
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def _quantile(self, ordered: list[float], q: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def snapshot(self) -> dict[str, Any]:
+        ordered = sorted(self._recent)
+        cumulative = 0
+        buckets: dict[str, int] = {}
+        for bound, count in zip(self.buckets, self._counts):
+            cumulative += count
+            buckets[f"le_{bound:g}"] = cumulative
+        buckets["le_inf"] = self.count
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "avg": round(self.total / self.count, 6) if self.count else 0.0,
+            "max": round(self.max, 6),
+            "p50": round(self._quantile(ordered, 0.50), 6),
+            "p95": round(self._quantile(ordered, 0.95), 6),
+            "p99": round(self._quantile(ordered, 0.99), 6),
+            "buckets": buckets,
+        }
@@ -6,7 +6,42 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 async def ensure_indexes(db: AsyncIOMotorDatabase) -> None:
     await db["users"].create_index("email", unique=True)
     await db["couples"].create_index("invite_code", unique=True)
-    await db["bookmarks"].create_index([("couple_id", 1), ("created_at", -1)])
-    await db["plans"].create_index([("couple_id", 1), ("date", 1)])
-    await db["visits"].create_index([("couple_id", 1), ("visited_at", -1)])
+    # 목록 커서 페이지네이션: 정렬 키 + _id(동점 처리)까지 인덱스로 정렬
+    await db["bookmarks"].create_index([("couple_id", 1), ("created_at", -1), ("_id", -1)])
+    await db["plans"].create_index([("couple_id", 1), ("date", 1), ("_id", 1)])
+    await db["visits"].create_index([("couple_id", 1), ("visited_at", -1), ("_id", -1)])
+    # verify_location / add_visit / 챌린지 상태 집계 (앞쪽 필드만으로도 사용됨)
+    await db["visits"].create_index(
+        [("couple_id", 1), ("challenge_place_id", 1), ("location_verified", 1), ("review_completed", 1)]
+    )
+    # 챌린지 장소별 방문 기록은 커플당 하나 (궤적 인증의 upsert가 동시에 실행돼도 중복 생성되지 않음)
+    await db["visits"].create_index(
+        [("couple_id", 1), ("challenge_place_id", 1)],
+        unique=True,
+        partialFilterExpression={"challenge_place_id": {"$type": "objectId"}},
+    )
+    # 월별 리포트 (커플별 created_at 범위 조회)
+    await db["visits"].create_index([("couple_id", 1), ("created_at", 1)])
+    # 리포트 일괄 생성 (해당 월에 방문 기록이 있는 커플 목록)
+    await db["visits"].create_index([("created_at", 1), ("couple_id", 1)])
+    # 일괄 체크인 재전송 방지 (client_key가 있는 기록만)
+    await db["visits"].create_index(
+        [("couple_id", 1), ("client_key", 1)],
+        unique=True,
+        partialFilterExpression={"client_key": {"$exists": True}},
+    )
+    # 방문 이벤트 소비 (처리할 이벤트가 남은 문서만)
+    await db["visits"].create_index(
+        [("outbox_pending", 1), ("outbox_lease_until", 1)],
+        partialFilterExpression={"outbox_pending": True},
+    )
+    await db["saved_reports"].create_index([("couple_id", 1), ("created_at", -1), ("_id", -1)])
+    await db["challenge_places"].create_index([("active", 1), ("created_at", 1)])
+    await db["challenge_places"].create_index([("active", 1), ("category_id", 1), ("created_at", 1)])
+    # /challenges/nearby ($geoNear)
+    await db["challenge_places"].create_index([("location", "2dsphere")])
+    await db["challenge_categories"].create_index([("active", 1), ("created_at", 1)])
+    await db["challenge_rules"].create_index([("active", 1), ("created_at", 1)])
     await db["places"].create_index([("location", "2dsphere")])
+    await db["challenge_rule_progress"].create_index([("couple_id", 1)])
+    await db["report_snapshots"].create_index([("couple_id", 1), ("month", 1)], unique=True)
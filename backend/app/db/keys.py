@@ -0,0 +1,21 @@
+"""
+MongoDB 필드 이름 이스케이프
+
+사용자 입력(태그, 감정 등)을 문서의 필드 이름으로 쓸 때 `.`과 `$`가 경로/연산자로
+해석되지 않도록 퍼센트 인코딩합니다. (`%` 자체도 인코딩하여 되돌릴 수 있게 함)
+"""
+from __future__ import annotations
+
+_ESCAPES = (("%", "%25"), (".", "%2E"), ("$", "%24"))
+
+
+def escape_key(key: str) -> str:
+    for raw, escaped in _ESCAPES:
+        key = key.replace(raw, escaped)
+    return key
+
+
+def unescape_key(key: str) -> str:
+    for raw, escaped in reversed(_ESCAPES):
+        key = key.replace(escaped, raw)
+    return key
@@ -13,6 +13,10 @@ from .core.config import settings
 from .db.init import ensure_indexes
 from .db.mongo import MongoConnectionManager
 from .db.redis import RedisConnectionManager
+from .services.llm import GeminiClientManager, OllamaClientManager
+from .services.pagination import NEXT_CURSOR_HEADER
+from .services.report_jobs import report_job_workers
+from .services.visit_event_workers import visit_event_workers
 
 logger = logging.getLogger(__name__)
 
@@ -26,9 +30,15 @@ async def lifespan(app: FastAPI):
         logger.info("MongoDB/Redis 커넥션 초기화 및 인덱스 보장 완료")
     except Exception as exc:  # pragma: no cover
         logger.error("DB 초기화 실패: %s", exc)
+    report_job_workers.start()
+    visit_event_workers.start()
     yield
+    await visit_event_workers.stop()
+    await report_job_workers.stop()
     await MongoConnectionManager.close()
     await RedisConnectionManager.close()
+    await GeminiClientManager.close()
+    await OllamaClientManager.close()
 
 
 app = FastAPI(title=settings.project_name, lifespan=lifespan)
@@ -39,6 +49,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(api_router, prefix=settings.api_prefix)
@@ -6,15 +6,29 @@ from .challenge_categories import (
     ChallengeCategoryUpdate,
 )
 from .challenge_places import ChallengePlaceCreate, ChallengePlaceOut, ChallengePlaceUpdate
-from .challenges import ChallengeProgress, LocationVerifyRequest, LocationVerifyResponse
+from .challenges import (
+    ChallengeProgress,
+    ChallengeRuleCreate,
+    ChallengeRuleOut,
+    ChallengeRuleUpdate,
+    LocationVerifyRequest,
+    LocationVerifyResponse,
+    NearbyChallengePlace,
+    TracePoint,
+    TraceVerifiedPlace,
+    TraceVerifyRequest,
+    TraceVerifyResponse,
+)
 from .couples import CouplePreferences, CoupleSummary, InviteResponse, JoinRequest, PreferenceUpdate
+from .geo import AutocompleteResponse, AutocompleteSuggestion
+from .leaderboard import LeaderboardEntry, LeaderboardResponse
 from .map import MapSuggestionRequest, MapSuggestionResponse
 from .planner import PlanCreate, PlanOut, PlanStop, PlanUpdate
 from .place import Place
-from .reports import ReportResponse, SavedReport
+from .reports import ReportJobOut, ReportResponse, SavedReport
 from .rewards import ChallengeStatus
 from .user import UserCreate, UserLogin, UserPublic
-from .visits import VisitCreate, VisitOut
+from .visits import VisitBulkItem, VisitBulkRequest, VisitBulkResponse, VisitBulkResult, VisitCreate, VisitOut
 
 __all__ = [
     "LoginResponse",
@@ -30,14 +44,26 @@ __all__ = [
     "ChallengePlaceOut",
     "ChallengePlaceUpdate",
     "ChallengeProgress",
+    "ChallengeRuleCreate",
+    "ChallengeRuleOut",
+    "ChallengeRuleUpdate",
     "ChallengeStatus",
     "LocationVerifyRequest",
     "LocationVerifyResponse",
+    "NearbyChallengePlace",
+    "TracePoint",
+    "TraceVerifiedPlace",
+    "TraceVerifyRequest",
+    "TraceVerifyResponse",
     "CouplePreferences",
     "CoupleSummary",
     "InviteResponse",
     "JoinRequest",
     "PreferenceUpdate",
+    "AutocompleteResponse",
+    "AutocompleteSuggestion",
+    "LeaderboardEntry",
+    "LeaderboardResponse",
     "MapSuggestionRequest",
     "MapSuggestionResponse",
     "PlanCreate",
@@ -45,11 +71,16 @@ __all__ = [
     "PlanStop",
     "PlanUpdate",
     "Place",
+    "ReportJobOut",
     "ReportResponse",
     "SavedReport",
     "UserCreate",
     "UserLogin",
     "UserPublic",
+    "VisitBulkItem",
+    "VisitBulkRequest",
+    "VisitBulkResponse",
+    "VisitBulkResult",
     "VisitCreate",
     "VisitOut",
 ]
@@ -1,4 +1,7 @@
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
 
 
 class ChallengeProgress(BaseModel):
@@ -21,4 +24,79 @@ class LocationVerifyRequest(BaseModel):
 class LocationVerifyResponse(BaseModel):
     verified: bool
     distance_meters: float
-    message: str
\ No newline at end of file
+    message: str
+
+class TracePoint(BaseModel):
+    latitude: float = Field(ge=-90, le=90)
+    longitude: float = Field(ge=-180, le=180)
+    recorded_at: datetime
+
+
+class TraceVerifyRequest(BaseModel):
+    points: list[TracePoint] = Field(min_length=1, max_length=5000)
+
+
+class TraceVerifiedPlace(BaseModel):
+    challenge_place_id: str
+    name: str
+    distance_meters: float  # 궤적 중 가장 가까웠던 거리
+    verified_at: datetime  # 인증 반경에 처음 들어온 시각
+    newly_verified: bool  # 이번 요청으로 처음 인증되었는지 여부
+
+
+class TraceVerifyResponse(BaseModel):
+    checked_points: int
+    verified: list[TraceVerifiedPlace]
+
+
+class NearbyChallengePlace(BaseModel):
+    id: str
+    name: str
+    description: str
+    latitude: float
+    longitude: float
+    category_id: str | None = None
+    category_name: str = "기타"
+    category_icon: str | None = None
+    category_color: str | None = None
+    badge_reward: str
+    points_reward: int
+    distance_meters: float
+    location_verified: bool = False
+    review_completed: bool = False
+
+
+class ChallengeRuleCreate(BaseModel):
+    id: str  # 규칙 식별자 (예: "spring_cafe")
+    title: str
+    description: str = ""
+    badge_icon: str = "🏅"
+    # {"tag"|"emotion"|"category"|"place": ..., "count": n} 또는 {"all"|"any": [하위 조건...]}
+    criteria: dict[str, Any]
+    starts_at: datetime | None = None  # 이 시각 이후 생성된 방문만 집계
+    ends_at: datetime | None = None  # 이 시각 이전 생성된 방문만 집계
+    active: bool = True
+
+
+class ChallengeRuleUpdate(BaseModel):
+    title: str | None = None
+    description: str | None = None
+    badge_icon: str | None = None
+    criteria: dict[str, Any] | None = None
+    starts_at: datetime | None = None
+    ends_at: datetime | None = None
+    active: bool | None = None
+
+
+class ChallengeRuleOut(BaseModel):
+    id: str
+    title: str
+    description: str = ""
+    badge_icon: str = ""
+    criteria: dict[str, Any]
+    starts_at: datetime | None = None
+    ends_at: datetime | None = None
+    active: bool
+    revision: int
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+
+class AutocompleteSuggestion(BaseModel):
+    name: str
+    kind: str = Field(..., description="region(지명 사전) / challenge(챌린지 장소) / place(장소)")
+    latitude: float | None = None
+    longitude: float | None = None
+    address: str | None = None
+
+
+class AutocompleteResponse(BaseModel):
+    query: str
+    suggestions: list[AutocompleteSuggestion]
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    couple_id: str
+    score: int
+    is_me: bool = False
+
+
+class LeaderboardResponse(BaseModel):
+    scope: str = Field(..., description="global / region / month")
+    region: str | None = None
+    month: str | None = None
+    total: int = Field(..., description="보드에 오른 커플 수")
+    entries: list[LeaderboardEntry]
+    me: LeaderboardEntry | None = None
@@ -31,3 +31,17 @@ class SavedReport(BaseModel):
     summary: str
     created_at: datetime
     updated_at: datetime
+
+
+class ReportJobOut(BaseModel):
+    job_id: str
+    status: str = Field(..., description="queued / running / retrying / succeeded / failed")
+    month: str
+    save: bool = False
+    name: str | None = None
+    attempts: int = 0
+    error: str | None = None
+    result: ReportResponse | None = None
+    saved_report_id: str | None = None
+    created_at: str | None = None
+    updated_at: str | None = None
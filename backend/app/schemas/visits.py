@@ -22,3 +22,22 @@ class VisitOut(VisitCreate):
     user_id: str
     review_completed: bool = False  # 리뷰 및 별점 작성 완료 여부
     created_at: datetime | None = None
+
+
+class VisitBulkItem(VisitCreate):
+    client_key: str = Field(..., min_length=1, max_length=64, description="클라이언트가 생성한 멱등 키 (재전송 시 같은 값)")
+
+
+class VisitBulkRequest(BaseModel):
+    items: list[VisitBulkItem] = Field(..., min_length=1, max_length=100)
+
+
+class VisitBulkResult(BaseModel):
+    client_key: str
+    status: str = Field(..., description="created / reviewed / duplicate / rejected")
+    detail: str | None = None
+    visit: VisitOut | None = None
+
+
+class VisitBulkResponse(BaseModel):
+    results: list[VisitBulkResult]
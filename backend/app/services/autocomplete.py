@@ -0,0 +1,306 @@
+"""
+지역명/장소명 자동완성 서비스
+
+지명 사전(GAZETTEER)과 places / challenge_places 컬렉션의 장소명을 메모리 내 prefix trie에 적재하고,
+키 입력마다 인기도 순으로 정렬된 후보를 반환합니다.
+
+- 한글은 자모 단위로 분해하여 색인하므로 "강나", "강남ㅇ" 처럼 음절이 덜 완성된 입력도 매칭됩니다.
+- 각 trie 노드가 인기도 상위 후보를 미리 들고 있으므로 조회 비용은 입력 길이에만 비례합니다.
+- 색인은 주기적으로 백그라운드에서 재구성되며, 재구성 중에도 이전 색인으로 응답합니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PLACES_COL = "places"
+CHALLENGE_PLACES_COL = "challenge_places"
+VISITS_COL = "visits"
+
+# 노드별로 보관할 상위 후보 수 (응답 limit의 상한)
+MAX_SUGGESTIONS = 10
+
+# 지명 사전: (이름, 위도, 경도, 기본 인기도)
+GAZETTEER: list[tuple[str, float, float, int]] = [
+    ("서울", 37.5665, 126.9780, 100),
+    ("강남역", 37.4979, 127.0276, 95),
+    ("홍대입구역", 37.5572, 126.9245, 95),
+    ("성수동", 37.5446, 127.0557, 90),
+    ("잠실역", 37.5133, 127.1001, 90),
+    ("여의도", 37.5219, 126.9245, 85),
+    ("명동", 37.5636, 126.9869, 85),
+    ("이태원", 37.5345, 126.9946, 80),
+    ("연남동", 37.5660, 126.9250, 80),
+    ("익선동", 37.5742, 126.9897, 75),
+    ("한남동", 37.5347, 127.0017, 70),
+    ("신촌역", 37.5551, 126.9368, 75),
+    ("건대입구역", 37.5404, 127.0692, 75),
+    ("압구정로데오역", 37.5274, 127.0404, 70),
+    ("가로수길", 37.5208, 127.0230, 70),
+    ("삼청동", 37.5841, 126.9823, 70),
+    ("북촌한옥마을", 37.5826, 126.9836, 70),
+    ("종로", 37.5704, 126.9921, 65),
+    ("을지로", 37.5660, 126.9910, 65),
+    ("망원동", 37.5556, 126.9019, 65),
+    ("합정역", 37.5495, 126.9139, 65),
+    ("서울숲", 37.5444, 127.0374, 65),
+    ("한강공원", 37.5284, 126.9336, 60),
+    ("남산서울타워", 37.5512, 126.9882, 60),
+    ("광화문", 37.5759, 126.9768, 60),
+    ("수원", 37.2636, 127.0286, 90),
+    ("수원역", 37.2656, 127.0000, 85),
+    ("수원화성", 37.2871, 127.0119, 85),
+    ("행궁동", 37.2826, 127.0157, 80),
+    ("광교역", 37.3020, 127.0443, 80),
+    ("광교호수공원", 37.2833, 127.0653, 75),
+    ("경기대", 37.3004, 127.0352, 70),
+    ("인계동", 37.2650, 127.0317, 70),
+    ("영통", 37.2514, 127.0714, 65),
+    ("성균관대역", 37.3003, 126.9710, 60),
+    ("분당", 37.3827, 127.1189, 70),
+    ("판교역", 37.3947, 127.1112, 75),
+    ("정자동", 37.3670, 127.1085, 60),
+    ("용인", 37.2411, 127.1776, 55),
+    ("인천", 37.4563, 126.7052, 70),
+    ("송도", 37.3826, 126.6566, 65),
+    ("부산", 35.1796, 129.0756, 70),
+    ("해운대", 35.1587, 129.1604, 70),
+    ("광안리", 35.1532, 129.1186, 65),
+    ("대구", 35.8714, 128.6014, 55),
+    ("대전", 36.3504, 127.3845, 55),
+    ("광주", 35.1595, 126.8526, 55),
+    ("제주", 33.4996, 126.5312, 65),
+    ("강릉", 37.7519, 128.8761, 60),
+    ("전주한옥마을", 35.8151, 127.1530, 60),
+]
+
+# 한글 음절 분해 테이블 (호환 자모)
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = [
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+    "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ",
+]
+_JONGSEONG = [
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ",
+    "ㄹㅂ", "ㄹㅅ", "ㄹㅌ", "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ",
+    "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+# 단독으로 입력된 겹모음/겹받침 자모도 키 입력 단위로 분해
+_COMPAT_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+
+
+def decompose(text: str) -> str:
+    """
+    문자열을 키 입력 단위(자모)로 분해합니다.
+
+    "강남" → "ㄱㅏㅇㄴㅏㅁ", "과" → "ㄱㅗㅏ". 공백은 제거하고 영문은 소문자로 통일합니다.
+    """
+    out: list[str] = []
+    for ch in text.lower():
+        if ch.isspace():
+            continue
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            offset = code - _HANGUL_BASE
+            out.append(_CHOSEONG[offset // 588])
+            out.append(_JUNGSEONG[(offset % 588) // 28])
+            out.append(_JONGSEONG[offset % 28])
+        else:
+            out.append(_COMPAT_JAMO.get(ch, ch))
+    return "".join(out)
+
+
+@dataclass
+class AutocompleteEntry:
+    name: str
+    kind: str
+    popularity: float
+    latitude: float | None = None
+    longitude: float | None = None
+    address: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "address": self.address,
+        }
+
+
+@dataclass
+class _TrieNode:
+    children: dict[str, "_TrieNode"] = field(default_factory=dict)
+    top: list[int] = field(default_factory=list)
+
+
+class PrefixTrie:
+    """자모 단위 prefix trie. 각 노드는 인기도 상위 MAX_SUGGESTIONS개의 엔트리 인덱스를 보관합니다."""
+
+    def __init__(self, entries: list[AutocompleteEntry]) -> None:
+        self.entries = entries
+        self._root = _TrieNode()
+        self._exact: dict[str, int] = {}
+        # 인기도 내림차순으로 삽입하면 각 노드의 top 리스트는 추가 정렬 없이 채워진다
+        order = sorted(range(len(entries)), key=lambda i: (-entries[i].popularity, entries[i].name))
+        for idx in order:
+            entry = entries[idx]
+            self._exact.setdefault(decompose(entry.name), idx)
+            for key in self._index_keys(entry.name):
+                self._insert(key, idx)
+
+    @staticmethod
+    def _index_keys(name: str) -> set[str]:
+        # 전체 이름 + 공백으로 구분된 각 단어 시작점 ("수원 남문시장" → "남문시장"으로도 검색)
+        words = name.split()
+        return {decompose(" ".join(words[i:])) for i in range(len(words))} or {decompose(name)}
+
+    def _insert(self, key: str, idx: int) -> None:
+        node = self._root
+        for ch in key:
+            node = node.children.setdefault(ch, _TrieNode())
+            if len(node.top) < MAX_SUGGESTIONS and idx not in node.top:
+                node.top.append(idx)
+
+    def search(self, query: str, limit: int = MAX_SUGGESTIONS) -> list[AutocompleteEntry]:
+        key = decompose(query)
+        if not key:
+            return []
+        node = self._root
+        for ch in key:
+            next_node = node.children.get(ch)
+            if next_node is None:
+                return []
+            node = next_node
+        return [self.entries[i] for i in node.top[:limit]]
+
+    def lookup(self, name: str) -> AutocompleteEntry | None:
+        """이름이 정확히 일치하는 엔트리 (공백/대소문자 무시)"""
+        idx = self._exact.get(decompose(name))
+        return self.entries[idx] if idx is not None else None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+def _gazetteer_entries() -> list[AutocompleteEntry]:
+    return [
+        AutocompleteEntry(name=name, kind="region", popularity=float(weight), latitude=lat, longitude=lon)
+        for name, lat, lon, weight in GAZETTEER
+    ]
+
+
+async def _visit_counts_by_name(db: AsyncIOMotorDatabase) -> dict[str, int]:
+    pipeline = [
+        {"$match": {"place_name": {"$type": "string", "$ne": ""}}},
+        {"$group": {"_id": "$place_name", "count": {"$sum": 1}}},
+    ]
+    counts: dict[str, int] = {}
+    async for row in db[VISITS_COL].aggregate(pipeline):
+        counts[row["_id"]] = row["count"]
+    return counts
+
+
+async def load_entries(db: AsyncIOMotorDatabase) -> list[AutocompleteEntry]:
+    """지명 사전 + DB 장소명으로 색인 대상 엔트리를 구성합니다. 인기도는 방문 횟수 기반입니다."""
+    visit_counts = await _visit_counts_by_name(db)
+    entries = _gazetteer_entries()
+    seen = {decompose(e.name) for e in entries}
+
+    def _add(entry: AutocompleteEntry) -> None:
+        key = decompose(entry.name)
+        if key and key not in seen:
+            seen.add(key)
+            entries.append(entry)
+
+    cursor = db[CHALLENGE_PLACES_COL].find(
+        {"active": True}, {"name": 1, "latitude": 1, "longitude": 1, "address": 1}
+    )
+    async for doc in cursor:
+        name = doc.get("name") or ""
+        _add(
+            AutocompleteEntry(
+                name=name,
+                kind="challenge",
+                popularity=50 + visit_counts.get(name, 0),
+                latitude=doc.get("latitude"),
+                longitude=doc.get("longitude"),
+                address=doc.get("address"),
+            )
+        )
+
+    cursor = db[PLACES_COL].find({}, {"name": 1, "location": 1, "address": 1, "rating": 1})
+    async for doc in cursor:
+        name = doc.get("name") or ""
+        coords = (doc.get("location") or {}).get("coordinates") or [None, None]
+        _add(
+            AutocompleteEntry(
+                name=name,
+                kind="place",
+                popularity=visit_counts.get(name, 0) + float(doc.get("rating") or 0),
+                latitude=coords[1],
+                longitude=coords[0],
+                address=doc.get("address"),
+            )
+        )
+    return entries
+
+
+class AutocompleteIndex:
+    """프로세스 내 자동완성 색인. 만료 시 백그라운드에서 재구성하고 그동안은 이전 색인으로 응답합니다."""
+
+    def __init__(self) -> None:
+        self._trie = PrefixTrie(_gazetteer_entries())
+        self._built_at = 0.0
+        self._refresh_task: asyncio.Task | None = None
+
+    @property
+    def trie(self) -> PrefixTrie:
+        return self._trie
+
+    async def rebuild(self, db: AsyncIOMotorDatabase) -> None:
+        started = time.perf_counter()
+        entries = await load_entries(db)
+        self._trie = PrefixTrie(entries)
+        self._built_at = time.monotonic()
+        logger.info("자동완성 색인 재구성: %d건 (%.0fms)", len(entries), (time.perf_counter() - started) * 1000)
+
+    async def _safe_rebuild(self, db: AsyncIOMotorDatabase) -> None:
+        try:
+            await self.rebuild(db)
+        except Exception as exc:
+            logger.warning("자동완성 색인 재구성 실패: %s", exc)
+            # 실패 시에도 다음 주기까지 재시도를 미룬다
+            self._built_at = time.monotonic()
+
+    def ensure_fresh(self, db: AsyncIOMotorDatabase) -> None:
+        if self._refresh_task and not self._refresh_task.done():
+            return
+        if self._built_at and time.monotonic() - self._built_at < settings.autocomplete_refresh_seconds:
+            return
+        self._refresh_task = asyncio.create_task(self._safe_rebuild(db))
+
+    def search(self, query: str, limit: int = MAX_SUGGESTIONS) -> list[AutocompleteEntry]:
+        return self._trie.search(query, limit)
+
+    def lookup(self, name: str) -> AutocompleteEntry | None:
+        return self._trie.lookup(name)
+
+
+autocomplete_index = AutocompleteIndex()
@@ -6,6 +6,8 @@ from bson import ObjectId
 from fastapi import HTTPException, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from .pagination import DEFAULT_PAGE_SIZE, paginate
+
 BOOKMARKS_COL = "bookmarks"
 
 
@@ -34,12 +36,14 @@ async def add_bookmark(db: AsyncIOMotorDatabase, couple_id: str, user_id: str, p
     return _normalize(doc)
 
 
-async def list_bookmarks(db: AsyncIOMotorDatabase, couple_id: str) -> list[dict]:
-    cursor = db[BOOKMARKS_COL].find({"couple_id": ObjectId(couple_id)}).sort("created_at", -1)
-    items: list[dict] = []
-    async for doc in cursor:
-        items.append(_normalize(doc))
-    return items
+async def list_bookmarks(
+    db: AsyncIOMotorDatabase, couple_id: str, limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+) -> tuple[list[dict], str | None]:
+    """북마크 한 페이지 (최신순)와 다음 페이지 커서"""
+    docs, next_cursor = await paginate(
+        db[BOOKMARKS_COL], {"couple_id": ObjectId(couple_id)}, "created_at", -1, limit, cursor
+    )
+    return [_normalize(doc) for doc in docs], next_cursor
 
 
 async def remove_bookmark(db: AsyncIOMotorDatabase, bookmark_id: str, couple_id: str) -> None:
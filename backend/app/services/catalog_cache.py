@@ -0,0 +1,118 @@
+"""
+챌린지 카탈로그(장소·카테고리) 프로세스 내 캐시
+
+challenge_places / challenge_categories는 관리자 API로만 바뀌므로, 전체를 메모리에 올려 두고
+요청 경로에서는 메모리 조회만 합니다.
+
+- 관리자 쓰기는 Redis의 `challenge_catalog:version`을 INCR 합니다. (`bump_catalog_version`)
+- 각 파드는 최대 CHALLENGE_CATALOG_CHECK_SECONDS마다 버전을 확인하고, 바뀌었을 때만 다시 적재합니다.
+- Redis를 읽을 수 없거나 DB를 직접 수정한 경우에도 CHALLENGE_CATALOG_MAX_AGE_SECONDS가 지나면 다시 적재합니다.
+
+반환되는 dict는 캐시와 공유되므로 호출부에서 수정하면 안 됩니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ..core.config import settings
+from ..db.redis import RedisConnectionManager
+from .challenge_categories import list_challenge_categories
+from .challenge_places import list_challenge_places
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION_KEY = "challenge_catalog:version"
+
+
+async def _remote_version() -> str | None:
+    try:
+        return await RedisConnectionManager.get_client().get(CATALOG_VERSION_KEY)
+    except Exception as exc:
+        logger.warning("챌린지 카탈로그 버전 조회 실패: %s", exc)
+        return None
+
+
+class ChallengeCatalog:
+    def __init__(self) -> None:
+        self._places: list[dict] = []
+        self._places_by_id: dict[str, dict] = {}
+        self._categories: list[dict] = []
+        self._version: str | None = None
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+        self._stale = True
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        """다음 조회 때 버전 확인 없이 다시 적재하도록 표시합니다."""
+        self._stale = True
+
+    async def reload(self, db: AsyncIOMotorDatabase, version: str | None) -> None:
+        # 버전을 먼저 읽고 데이터를 적재하므로, 적재 도중 바뀐 내용은 다음 확인 때 다시 반영된다
+        # (적재 중 invalidate()가 호출되면 _stale이 다시 True가 되어 다음 조회 때 재적재)
+        self._stale = False
+        try:
+            places, categories = await asyncio.gather(
+                list_challenge_places(db, active_only=False),
+                list_challenge_categories(db, active_only=False),
+            )
+        except Exception:
+            self._stale = True
+            raise
+        self._places = places
+        self._places_by_id = {place["id"]: place for place in places}
+        self._categories = categories
+        self._version = version
+        self._loaded_at = self._checked_at = time.monotonic()
+        logger.info("챌린지 카탈로그 적재: 장소 %d건, 카테고리 %d건 (버전 %s)", len(places), len(categories), version)
+
+    async def ensure_fresh(self, db: AsyncIOMotorDatabase) -> None:
+        now = time.monotonic()
+        if not self._stale and now - self._checked_at < settings.challenge_catalog_check_seconds:
+            return
+        async with self._lock:
+            # 대기하는 동안 다른 요청이 이미 갱신했으면 그대로 사용
+            now = time.monotonic()
+            if not self._stale and now - self._checked_at < settings.challenge_catalog_check_seconds:
+                return
+            version = await _remote_version()
+            expired = now - self._loaded_at >= settings.challenge_catalog_max_age_seconds
+            if version is None and not self._stale and not expired:
+                # Redis 장애(또는 아직 버전 키 없음): 최대 보관 시간까지 기존 카탈로그로 응답
+                self._checked_at = now
+            elif self._stale or expired or version != self._version:
+                await self.reload(db, version)
+            else:
+                self._checked_at = now
+
+    async def places(self, db: AsyncIOMotorDatabase, active_only: bool = True) -> list[dict]:
+        await self.ensure_fresh(db)
+        if active_only:
+            return [place for place in self._places if place.get("active", True)]
+        return list(self._places)
+
+    async def place(self, db: AsyncIOMotorDatabase, place_id: str) -> dict | None:
+        await self.ensure_fresh(db)
+        return self._places_by_id.get(place_id)
+
+    async def categories(self, db: AsyncIOMotorDatabase, active_only: bool = True) -> list[dict]:
+        await self.ensure_fresh(db)
+        if active_only:
+            return [category for category in self._categories if category.get("active", True)]
+        return list(self._categories)
+
+
+challenge_catalog = ChallengeCatalog()
+
+
+async def bump_catalog_version() -> None:
+    """카탈로그가 바뀌었음을 모든 파드에 알립니다. (현재 파드는 즉시 무효화)"""
+    challenge_catalog.invalidate()
+    try:
+        await RedisConnectionManager.get_client().incr(CATALOG_VERSION_KEY)
+    except Exception as exc:
+        logger.warning("챌린지 카탈로그 버전 갱신 실패: %s", exc)
@@ -0,0 +1,115 @@
+"""
+커플별 태그/감정 누적 카운터
+
+`challenge_counters` 컬렉션에 커플마다 문서 하나를 두고, 방문 기록 이벤트(visit_events)를 받을 때마다
+변경 전후 차이만큼 `$inc`로 갱신합니다. 챌린지 진행도는 방문 기록 수와 관계없이 이 문서 한 번만 읽습니다.
+
+    {_id: couple_id, tags: {<태그>: n}, emotions: {<감정>: n}, applied_events: [<event_id>], updated_at}
+
+카운터 문서가 없는 커플(기능 도입 이전 데이터)은 처음 읽을 때 방문 기록을 집계해 만들고,
+`backend/scripts/rebuild_challenge_counters.py`로 전체를 다시 만들 수 있습니다.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ..db.keys import escape_key, unescape_key
+from .visit_events import applied_guard, facet_event_ids, pending_events_facet
+
+COUNTERS_COL = "challenge_counters"
+VISITS_COL = "visits"
+
+
+def _visit_counts(visit: dict | None) -> Counter[str]:
+    counts: Counter[str] = Counter()
+    if not visit:
+        return counts
+    for tag in visit.get("tags") or []:
+        counts[f"tags.{escape_key(tag)}"] += 1
+    if visit.get("emotion"):
+        counts[f"emotions.{escape_key(visit['emotion'])}"] += 1
+    return counts
+
+
+def counter_delta(before: dict | None, after: dict | None) -> dict[str, int]:
+    """방문 기록 변경 전후의 태그/감정 차이를 `$inc` 문서로 변환 (변화 없는 키는 제외)"""
+    delta = _visit_counts(after)
+    delta.subtract(_visit_counts(before))
+    return {key: value for key, value in delta.items() if value}
+
+
+async def record_visit_change(
+    db: AsyncIOMotorDatabase,
+    couple_id: str | ObjectId,
+    before: dict | None,
+    after: dict | None,
+    event_id: ObjectId | None = None,
+) -> None:
+    """
+    방문 기록 생성(before=None)/수정 시 카운터를 갱신합니다.
+
+    event_id가 주어지면 이미 반영한 이벤트는 다시 반영하지 않습니다. (이벤트 재전달 대비)
+    카운터 문서가 아직 없으면 갱신하지 않습니다. 이 경우 다음 조회 때 방문 기록 전체를
+    집계해 만들며, 방문 기록은 이미 저장된 뒤이므로 이번 변경도 포함됩니다.
+    """
+    delta = counter_delta(before, after)
+    if not delta:
+        return
+    guard, push = applied_guard(event_id)
+    update: dict = {"$inc": delta, "$set": {"updated_at": datetime.utcnow()}}
+    if push:
+        update["$push"] = push
+    await db[COUNTERS_COL].update_one({"_id": ObjectId(couple_id), **guard}, update)
+
+
+async def rebuild_counters(db: AsyncIOMotorDatabase, couple_id: str | ObjectId) -> dict:
+    """
+    커플의 방문 기록 전체를 집계해 카운터 문서를 새로 만듭니다.
+
+    집계한 방문 문서의 아직 처리되지 않은 이벤트는 결과에 이미 들어 있으므로 처리한 것으로 기록합니다.
+    """
+    couple_obj_id = ObjectId(couple_id)
+    applied_events: list[ObjectId] = []
+    tags: Counter[str] = Counter()
+    emotions: Counter[str] = Counter()
+    pipeline = [
+        {"$match": {"couple_id": couple_obj_id}},
+        {
+            "$facet": {
+                "tags": [{"$unwind": "$tags"}, {"$group": {"_id": "$tags", "n": {"$sum": 1}}}],
+                "emotions": [
+                    {"$match": {"emotion": {"$nin": [None, ""]}}},
+                    {"$group": {"_id": "$emotion", "n": {"$sum": 1}}},
+                ],
+                **pending_events_facet(),
+            }
+        },
+    ]
+    async for facet in db[VISITS_COL].aggregate(pipeline):
+        tags.update({doc["_id"]: doc["n"] for doc in facet["tags"]})
+        emotions.update({doc["_id"]: doc["n"] for doc in facet["emotions"]})
+        applied_events = facet_event_ids(facet)
+
+    doc = {
+        "tags": {escape_key(k): v for k, v in tags.items()},
+        "emotions": {escape_key(k): v for k, v in emotions.items()},
+        "applied_events": applied_events,
+        "updated_at": datetime.utcnow(),
+    }
+    await db[COUNTERS_COL].replace_one({"_id": couple_obj_id}, doc, upsert=True)
+    return {"_id": couple_obj_id, **doc}
+
+
+async def get_counters(db: AsyncIOMotorDatabase, couple_id: str | ObjectId) -> dict[str, Counter[str]]:
+    """커플의 태그/감정 카운터 조회 (없으면 방문 기록에서 생성)"""
+    doc = await db[COUNTERS_COL].find_one({"_id": ObjectId(couple_id)})
+    if doc is None:
+        doc = await rebuild_counters(db, couple_id)
+    return {
+        "tags": Counter({unescape_key(k): v for k, v in (doc.get("tags") or {}).items()}),
+        "emotions": Counter({unescape_key(k): v for k, v in (doc.get("emotions") or {}).items()}),
+    }
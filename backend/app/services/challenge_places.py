@@ -10,9 +10,16 @@ CHALLENGE_PLACES_COL = "challenge_places"
 CHALLENGE_CATEGORIES_COL = "challenge_categories"
 
 
+def _location(latitude: float, longitude: float) -> dict:
+    """2dsphere 색인용 GeoJSON Point (좌표 순서는 [경도, 위도])"""
+    return {"type": "Point", "coordinates": [longitude, latitude]}
+
+
 def _normalize(doc: dict) -> dict:
     doc = {**doc}
     doc["id"] = str(doc.pop("_id"))
+    # 위경도는 latitude/longitude 필드로 그대로 내보내므로 색인용 location은 제외
+    doc.pop("location", None)
     # category_id를 ObjectId에서 문자열로 변환
     if "category_id" in doc and isinstance(doc["category_id"], ObjectId):
         doc["category_id"] = str(doc["category_id"])
@@ -50,6 +57,7 @@ async def create_challenge_place(db: AsyncIOMotorDatabase, payload: dict) -> dic
         "description": payload["description"],
         "latitude": payload["latitude"],
         "longitude": payload["longitude"],
+        "location": _location(payload["latitude"], payload["longitude"]),
         "address": payload["address"],
         "category_id": category_obj_id,  # ObjectId로 저장
         "tags": payload.get("tags", []),
@@ -102,6 +110,46 @@ async def list_challenge_places(
     return items
 
 
+async def list_nearby_challenge_places(
+    db: AsyncIOMotorDatabase,
+    latitude: float,
+    longitude: float,
+    radius_meters: float,
+    limit: int = 50,
+) -> list[dict]:
+    """반경 내 활성 챌린지 장소를 가까운 순으로 조회 (각 항목에 distance_meters 포함)"""
+    pipeline = [
+        {
+            "$geoNear": {
+                "near": _location(latitude, longitude),
+                "key": "location",
+                "distanceField": "distance_meters",
+                "maxDistance": radius_meters,
+                "query": {"active": True},
+                "spherical": True,
+            }
+        },
+        {"$limit": limit},
+    ]
+    items: list[dict] = []
+    async for doc in db[CHALLENGE_PLACES_COL].aggregate(pipeline):
+        items.append(_normalize(doc))
+    return items
+
+
+async def backfill_challenge_place_locations(db: AsyncIOMotorDatabase) -> int:
+    """latitude/longitude만 있는 기존 문서에 GeoJSON location을 채웁니다. (수정된 문서 수 반환)"""
+    result = await db[CHALLENGE_PLACES_COL].update_many(
+        {
+            "location": {"$exists": False},
+            "latitude": {"$type": "number"},
+            "longitude": {"$type": "number"},
+        },
+        [{"$set": {"location": {"type": "Point", "coordinates": ["$longitude", "$latitude"]}}}],
+    )
+    return result.modified_count
+
+
 async def update_challenge_place(db: AsyncIOMotorDatabase, place_id: str, payload: dict) -> dict:
     """챌린지 장소 수정"""
     try:
@@ -132,6 +180,16 @@ async def update_challenge_place(db: AsyncIOMotorDatabase, place_id: str, payloa
         # ObjectId로 변환하여 저장
         update_data["category_id"] = category_obj_id
     
+    # 위경도 중 하나만 바뀌어도 location을 함께 갱신
+    if "latitude" in update_data or "longitude" in update_data:
+        current = await db[CHALLENGE_PLACES_COL].find_one({"_id": obj_id}, {"latitude": 1, "longitude": 1})
+        if not current:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="챌린지 장소를 찾을 수 없습니다.")
+        update_data["location"] = _location(
+            update_data.get("latitude", current["latitude"]),
+            update_data.get("longitude", current["longitude"]),
+        )
+    
     if not update_data:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="수정할 데이터가 없습니다.")
     
@@ -0,0 +1,496 @@
+"""
+선언형 챌린지 규칙 엔진
+
+규칙은 `challenge_rules` 컬렉션에 저장되며 코드 수정 없이 추가/수정할 수 있습니다.
+
+    {
+        _id: "spring_cafe", title, description, badge_icon, active, revision,
+        starts_at: 2025-03-01, ends_at: 2025-06-01,          # 선택: 이 기간에 생성된 방문만 집계
+        criteria: {"all": [{"tag": "카페", "count": 3},
+                           {"any": [{"emotion": "설렘"}, {"category": "<카테고리 ID>", "count": 2}]}]}
+    }
+
+- 조건(leaf): tag / emotion / category / place 중 하나 이상을 모두 만족하는 방문 수가 count(기본 1) 이상
+  (category / place 조건은 리뷰까지 완료한 챌린지 장소 방문만 집계)
+- 조합: all(모두 달성) / any(하나라도 달성), 중첩 가능
+- 기간이 없는 단일 tag/emotion 조건은 커플별 누적 카운터(challenge_counters)를 그대로 사용하고,
+  나머지 조건은 규칙별 진행 문서(challenge_rule_progress)에 방문 이벤트(visit_events)마다 `$inc`로 누적합니다.
+- 진행 문서가 없거나 규칙이 수정되어 revision이 다르면 조회 시 집계 파이프라인으로 다시 계산합니다.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from bson import ObjectId
+from fastapi import HTTPException, status
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+from .challenge_counters import get_counters
+from .visit_events import applied_guard, facet_event_ids, pending_events_facet
+
+logger = logging.getLogger(__name__)
+
+RULES_COL = "challenge_rules"
+RULE_PROGRESS_COL = "challenge_rule_progress"
+VISITS_COL = "visits"
+CHALLENGE_PLACES_COL = "challenge_places"
+
+LEAF_FIELDS = ("tag", "emotion", "category", "place")
+
+# 규칙 컬렉션이 비어 있을 때 넣는 기본 규칙
+CHALLENGE_DEFINITIONS = [
+    {
+        "id": "night_explorer",
+        "title": "밤의 탐험가",
+        "description": "야경 태그 장소 3곳 방문",
+        "criteria": {"tag": "야경", "count": 3},
+        "badge_icon": "🌃",
+    },
+    {
+        "id": "coffee_holic",
+        "title": "카페 매니아",
+        "description": "카페 태그 장소 5곳 방문",
+        "criteria": {"tag": "카페", "count": 5},
+        "badge_icon": "☕",
+    },
+    {
+        "id": "healing_master",
+        "title": "힐링 마스터",
+        "description": "감정 '힐링' 리뷰 4회 이상",
+        "criteria": {"emotion": "힐링", "count": 4},
+        "badge_icon": "🌿",
+    },
+]
+
+
+@dataclass(frozen=True)
+class Leaf:
+    key: str
+    count: int
+    tag: str | None = None
+    emotion: str | None = None
+    category: ObjectId | None = None
+    place: ObjectId | None = None
+
+    @property
+    def counter_source(self) -> str | None:
+        """누적 카운터로 바로 읽을 수 있는 단일 tag/emotion 조건이면 카운터 종류를 반환"""
+        if self.category is None and self.place is None:
+            if self.tag is not None and self.emotion is None:
+                return "tags"
+            if self.emotion is not None and self.tag is None:
+                return "emotions"
+        return None
+
+    def matches(self, visit: dict | None, category_id: ObjectId | None) -> bool:
+        """방문 이벤트마다 평가하는 증분 조건"""
+        if not visit:
+            return False
+        if self.tag is not None and self.tag not in (visit.get("tags") or []):
+            return False
+        if self.emotion is not None and visit.get("emotion") != self.emotion:
+            return False
+        if self.place is not None or self.category is not None:
+            if not visit.get("review_completed"):
+                return False
+            if self.place is not None and visit.get("challenge_place_id") != self.place:
+                return False
+            if self.category is not None and category_id != self.category:
+                return False
+        return True
+
+    def expr(self) -> dict[str, Any]:
+        """백필 집계 파이프라인에서 사용하는 같은 조건의 $expr 표현"""
+        conditions: list[dict[str, Any]] = []
+        if self.tag is not None:
+            conditions.append({"$in": [self.tag, {"$ifNull": ["$tags", []]}]})
+        if self.emotion is not None:
+            conditions.append({"$eq": ["$emotion", self.emotion]})
+        if self.place is not None or self.category is not None:
+            conditions.append({"$eq": ["$review_completed", True]})
+        if self.place is not None:
+            conditions.append({"$eq": ["$challenge_place_id", self.place]})
+        if self.category is not None:
+            conditions.append({"$eq": ["$_category_id", self.category]})
+        return {"$and": conditions}
+
+
+@dataclass(frozen=True)
+class Node:
+    op: str  # "all" / "any" / "leaf"
+    children: tuple["Node", ...] = ()
+    leaf: Leaf | None = None
+
+
+@dataclass
+class CompiledRule:
+    id: str
+    title: str
+    description: str
+    badge_icon: str
+    revision: int
+    root: Node
+    leaves: list[Leaf]
+    starts_at: datetime | None = None
+    ends_at: datetime | None = None
+    # 규칙별 진행 문서로 집계하는 조건 (누적 카운터로 읽을 수 없는 조건)
+    tracked: list[Leaf] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        windowed = self.starts_at is not None or self.ends_at is not None
+        self.tracked = [leaf for leaf in self.leaves if windowed or leaf.counter_source is None]
+
+    @property
+    def needs_category(self) -> bool:
+        return any(leaf.category is not None for leaf in self.tracked)
+
+    def in_window(self, created_at: datetime | None) -> bool:
+        if self.starts_at is None and self.ends_at is None:
+            return True
+        if created_at is None:
+            return False
+        if self.starts_at is not None and created_at < self.starts_at:
+            return False
+        if self.ends_at is not None and created_at >= self.ends_at:
+            return False
+        return True
+
+
+def _object_id(value: Any, label: str) -> ObjectId:
+    try:
+        return ObjectId(str(value))
+    except Exception as exc:
+        raise ValueError(f"{label} 조건의 ID 형식이 올바르지 않습니다: {value}") from exc
+
+
+def compile_criteria(criteria: Any) -> tuple[Node, list[Leaf]]:
+    """criteria 문서를 평가 트리와 조건 목록으로 변환합니다. 잘못된 정의는 ValueError"""
+    leaves: list[Leaf] = []
+
+    def build(node: Any) -> Node:
+        if not isinstance(node, dict) or not node:
+            raise ValueError("조건은 비어 있지 않은 객체여야 합니다.")
+        ops = [op for op in ("all", "any") if op in node]
+        if ops:
+            if len(node) != 1:
+                raise ValueError("all / any 조건에는 다른 키를 함께 쓸 수 없습니다.")
+            children = node[ops[0]]
+            if not isinstance(children, list) or not children:
+                raise ValueError(f"{ops[0]} 조건에는 하위 조건 목록이 필요합니다.")
+            return Node(op=ops[0], children=tuple(build(child) for child in children))
+
+        unknown = set(node) - set(LEAF_FIELDS) - {"count"}
+        if unknown:
+            raise ValueError(f"알 수 없는 조건 키: {', '.join(sorted(unknown))}")
+        if not any(node.get(name) for name in LEAF_FIELDS):
+            raise ValueError("조건에는 tag / emotion / category / place 중 하나 이상이 필요합니다.")
+        count = node.get("count", 1)
+        if not isinstance(count, int) or isinstance(count, bool) or count < 1:
+            raise ValueError("count는 1 이상의 정수여야 합니다.")
+        leaf = Leaf(
+            key=f"l{len(leaves)}",
+            count=count,
+            tag=node.get("tag") or None,
+            emotion=node.get("emotion") or None,
+            category=_object_id(node["category"], "category") if node.get("category") else None,
+            place=_object_id(node["place"], "place") if node.get("place") else None,
+        )
+        leaves.append(leaf)
+        return Node(op="leaf", leaf=leaf)
+
+    return build(criteria), leaves
+
+
+def compile_rule(doc: dict) -> CompiledRule:
+    root, leaves = compile_criteria(doc.get("criteria"))
+    return CompiledRule(
+        id=str(doc["_id"]),
+        title=doc.get("title", ""),
+        description=doc.get("description", ""),
+        badge_icon=doc.get("badge_icon", ""),
+        revision=doc.get("revision", 1),
+        root=root,
+        leaves=leaves,
+        starts_at=doc.get("starts_at"),
+        ends_at=doc.get("ends_at"),
+    )
+
+
+def evaluate(node: Node, counts: dict[str, int]) -> tuple[int, int, bool]:
+    """(current, goal, completed) 계산. 조합 조건의 current는 각 조건을 목표치까지만 합산"""
+    if node.op == "leaf":
+        assert node.leaf is not None
+        current = counts.get(node.leaf.key, 0)
+        return current, node.leaf.count, current >= node.leaf.count
+
+    results = [evaluate(child, counts) for child in node.children]
+    if node.op == "all":
+        return (
+            sum(min(current, goal) for current, goal, _done in results),
+            sum(goal for _current, goal, _done in results),
+            all(done for _current, _goal, done in results),
+        )
+    current, goal, done = max(results, key=lambda r: (r[2], min(r[0], r[1]) / r[1]))
+    return min(current, goal), goal, done
+
+
+def backfill_pipeline(rule: CompiledRule, couple_id: ObjectId) -> list[dict[str, Any]]:
+    """
+    규칙의 추적 조건별 방문 수를 한 번에 계산하는 집계 파이프라인
+
+    결과는 문서 하나: {counts: [{leaf key: n}], pending_events: [{event_ids}]}
+    """
+    match: dict[str, Any] = {"couple_id": couple_id}
+    window: dict[str, datetime] = {}
+    if rule.starts_at is not None:
+        window["$gte"] = rule.starts_at
+    if rule.ends_at is not None:
+        window["$lt"] = rule.ends_at
+    if window:
+        match["created_at"] = window
+
+    counts: list[dict[str, Any]] = []
+    if rule.needs_category:
+        counts += [
+            {
+                "$lookup": {
+                    "from": CHALLENGE_PLACES_COL,
+                    "localField": "challenge_place_id",
+                    "foreignField": "_id",
+                    "as": "_place",
+                }
+            },
+            {"$set": {"_category_id": {"$first": "$_place.category_id"}}},
+        ]
+    counts.append(
+        {
+            "$group": {
+                "_id": None,
+                **{leaf.key: {"$sum": {"$cond": [leaf.expr(), 1, 0]}} for leaf in rule.tracked},
+            }
+        }
+    )
+    return [{"$match": match}, {"$facet": {"counts": counts, **pending_events_facet()}}]
+
+
+def _progress_id(couple_id: ObjectId, rule_id: str) -> str:
+    return f"{couple_id}:{rule_id}"
+
+
+async def _backfill(db: AsyncIOMotorDatabase, rule: CompiledRule, couple_id: ObjectId) -> dict[str, int]:
+    counts = {leaf.key: 0 for leaf in rule.tracked}
+    applied_events: list[ObjectId] = []
+    async for doc in db[VISITS_COL].aggregate(backfill_pipeline(rule, couple_id)):
+        for group in doc["counts"]:
+            counts.update({leaf.key: group[leaf.key] for leaf in rule.tracked})
+        # 집계한 방문 문서의 아직 처리되지 않은 이벤트는 결과에 이미 들어 있으므로 처리한 것으로 기록
+        applied_events = facet_event_ids(doc)
+    await db[RULE_PROGRESS_COL].replace_one(
+        {"_id": _progress_id(couple_id, rule.id)},
+        {
+            "couple_id": couple_id,
+            "rule_id": rule.id,
+            "revision": rule.revision,
+            "leaves": counts,
+            "applied_events": applied_events,
+            "updated_at": datetime.utcnow(),
+        },
+        upsert=True,
+    )
+    return counts
+
+
+def _normalize(doc: dict) -> dict:
+    doc = {**doc}
+    doc["id"] = str(doc.pop("_id"))
+    return doc
+
+
+async def seed_default_rules(db: AsyncIOMotorDatabase) -> None:
+    now = datetime.utcnow()
+    for rule in CHALLENGE_DEFINITIONS:
+        fields = {k: v for k, v in rule.items() if k != "id"}
+        await db[RULES_COL].update_one(
+            {"_id": rule["id"]},
+            {"$setOnInsert": {**fields, "active": True, "revision": 1, "created_at": now, "updated_at": now}},
+            upsert=True,
+        )
+
+
+async def load_rules(db: AsyncIOMotorDatabase) -> list[CompiledRule]:
+    """활성 규칙을 컴파일해 반환 (규칙 컬렉션이 비어 있으면 기본 규칙을 먼저 넣음)"""
+    docs = [doc async for doc in db[RULES_COL].find({"active": True}).sort("created_at", 1)]
+    if not docs and await db[RULES_COL].estimated_document_count() == 0:
+        await seed_default_rules(db)
+        docs = [doc async for doc in db[RULES_COL].find({"active": True}).sort("created_at", 1)]
+
+    rules: list[CompiledRule] = []
+    for doc in docs:
+        try:
+            rules.append(compile_rule(doc))
+        except ValueError as exc:
+            logger.warning("챌린지 규칙 %s 컴파일 실패: %s", doc.get("_id"), exc)
+    return rules
+
+
+async def get_rule_progress(db: AsyncIOMotorDatabase, couple_id: str) -> list[dict]:
+    """활성 규칙별 진행도 (규칙 목록, 누적 카운터, 규칙별 진행 문서를 각각 한 번씩 조회)"""
+    couple_obj_id = ObjectId(couple_id)
+    rules = await load_rules(db)
+    counters = await get_counters(db, couple_obj_id)
+    stored = {
+        doc["rule_id"]: doc
+        async for doc in db[RULE_PROGRESS_COL].find(
+            {"_id": {"$in": [_progress_id(couple_obj_id, rule.id) for rule in rules if rule.tracked]}}
+        )
+    }
+
+    progress: list[dict] = []
+    for rule in rules:
+        counts: dict[str, int] = {}
+        for leaf in rule.leaves:
+            if leaf not in rule.tracked:
+                value = leaf.tag if leaf.counter_source == "tags" else leaf.emotion
+                counts[leaf.key] = counters[leaf.counter_source][value]
+        if rule.tracked:
+            doc = stored.get(rule.id)
+            if doc is None or doc.get("revision") != rule.revision:
+                counts.update(await _backfill(db, rule, couple_obj_id))
+            else:
+                counts.update(doc.get("leaves") or {})
+
+        current, goal, done = evaluate(rule.root, counts)
+        progress.append(
+            {
+                "id": rule.id,
+                "title": rule.title,
+                "description": rule.description,
+                "badge_icon": rule.badge_icon,
+                "current": current,
+                "goal": goal,
+                "completed": done,
+                "completed_at": datetime.utcnow().isoformat() if done else None,
+            }
+        )
+    return progress
+
+
+async def record_visit_change(
+    db: AsyncIOMotorDatabase,
+    couple_id: str | ObjectId,
+    before: dict | None,
+    after: dict | None,
+    event_id: ObjectId | None = None,
+) -> None:
+    """
+    방문 기록 생성/수정 시 규칙별 진행 문서를 `$inc`로 갱신합니다.
+
+    진행 문서가 없거나 revision이 다른 규칙은 갱신하지 않고, 다음 조회 때 다시 계산됩니다.
+    event_id가 주어지면 이미 반영한 이벤트는 진행 문서마다 다시 반영하지 않습니다.
+    """
+    rules = [rule for rule in await load_rules(db) if rule.tracked]
+    if not rules:
+        return
+    couple_obj_id = ObjectId(couple_id)
+    visit = after or before or {}
+
+    category_id = None
+    if visit.get("challenge_place_id") and any(rule.needs_category for rule in rules):
+        place = await db[CHALLENGE_PLACES_COL].find_one({"_id": visit["challenge_place_id"]}, {"category_id": 1})
+        category_id = (place or {}).get("category_id")
+
+    now = datetime.utcnow()
+    guard, push = applied_guard(event_id)
+    operations = []
+    for rule in rules:
+        inc: dict[str, int] = {}
+        for leaf in rule.tracked:
+            delta = int(rule.in_window((after or {}).get("created_at")) and leaf.matches(after, category_id)) - int(
+                rule.in_window((before or {}).get("created_at")) and leaf.matches(before, category_id)
+            )
+            if delta:
+                inc[f"leaves.{leaf.key}"] = delta
+        if inc:
+            update: dict[str, Any] = {"$inc": inc, "$set": {"updated_at": now}}
+            if push:
+                update["$push"] = push
+            operations.append(
+                UpdateOne({"_id": _progress_id(couple_obj_id, rule.id), "revision": rule.revision, **guard}, update)
+            )
+    if operations:
+        await db[RULE_PROGRESS_COL].bulk_write(operations, ordered=False)
+
+
+def _validate(payload: dict) -> None:
+    try:
+        compile_criteria(payload.get("criteria"))
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"잘못된 챌린지 규칙: {exc}") from exc
+    starts_at, ends_at = payload.get("starts_at"), payload.get("ends_at")
+    if starts_at and ends_at and starts_at >= ends_at:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="종료 시각은 시작 시각 이후여야 합니다.")
+
+
+async def list_rules(db: AsyncIOMotorDatabase, active_only: bool = False) -> list[dict]:
+    """챌린지 규칙 목록 조회"""
+    query = {"active": True} if active_only else {}
+    return [_normalize(doc) async for doc in db[RULES_COL].find(query).sort("created_at", 1)]
+
+
+async def create_rule(db: AsyncIOMotorDatabase, payload: dict) -> dict:
+    """챌린지 규칙 생성"""
+    _validate(payload)
+    now = datetime.utcnow()
+    doc = {
+        "_id": payload["id"],
+        "title": payload["title"],
+        "description": payload.get("description", ""),
+        "badge_icon": payload.get("badge_icon", ""),
+        "criteria": payload["criteria"],
+        "starts_at": payload.get("starts_at"),
+        "ends_at": payload.get("ends_at"),
+        "active": payload.get("active", True),
+        "revision": 1,
+        "created_at": now,
+        "updated_at": now,
+    }
+    try:
+        await db[RULES_COL].insert_one(doc)
+    except DuplicateKeyError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 존재하는 챌린지 규칙 ID입니다.") from exc
+    return _normalize(doc)
+
+
+async def update_rule(db: AsyncIOMotorDatabase, rule_id: str, payload: dict) -> dict:
+    """챌린지 규칙 수정 (조건이나 기간이 바뀌면 revision을 올려 진행도를 다시 계산)"""
+    current = await db[RULES_COL].find_one({"_id": rule_id})
+    if not current:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="챌린지 규칙을 찾을 수 없습니다.")
+
+    update_data = {k: v for k, v in payload.items() if v is not None}
+    if not update_data:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="수정할 데이터가 없습니다.")
+    _validate({**current, **update_data})
+
+    update: dict[str, Any] = {"$set": {**update_data, "updated_at": datetime.utcnow()}}
+    if any(key in update_data for key in ("criteria", "starts_at", "ends_at")):
+        update["$inc"] = {"revision": 1}
+    await db[RULES_COL].update_one({"_id": rule_id}, update)
+    doc = await db[RULES_COL].find_one({"_id": rule_id})
+    return _normalize(doc)
+
+
+async def delete_rule(db: AsyncIOMotorDatabase, rule_id: str) -> bool:
+    """챌린지 규칙 삭제 (실제 삭제 대신 active=False로 설정)"""
+    result = await db[RULES_COL].update_one(
+        {"_id": rule_id},
+        {"$set": {"active": False, "updated_at": datetime.utcnow()}},
+    )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="챌린지 규칙을 찾을 수 없습니다.")
+    return True
@@ -0,0 +1,102 @@
+"""
+규칙 기반 데이트 코스 생성기 및 LLM과의 마감 시간 경쟁
+
+LLM 응답이 늦을 때 바로 돌려줄 수 있도록, 이미 순위가 매겨진 상위 장소와 날씨 팁,
+예산 레이블만으로 세 가지 코스를 결정적으로 만듭니다. (외부 호출 없음)
+`race_llm_with_template`은 LLM을 마감 시간까지만 기다리고, 늦으면 템플릿 코스를 반환합니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable
+
+from .recommendations import estimate_place_budget
+
+logger = logging.getLogger(__name__)
+
+COURSE_SIZE = 3
+COURSE_THEMES = ("베스트", "날씨 맞춤", "여유로운")
+
+# 마감 이후에도 계속 실행 중인 LLM 작업 (GC로 사라지지 않도록 참조 유지)
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _place_name(place: dict) -> str:
+    return place.get("place_name") or place.get("name") or ""
+
+
+def build_template_courses(
+    top_places: list[dict],
+    weather_suggestions: dict[str, Any],
+    budget_label: str,
+    *,
+    location: str = "",
+    emotion: str = "",
+) -> list[dict[str, Any]]:
+    """
+    순위가 매겨진 장소를 세 코스로 나눠 LLM 제안과 같은 형식으로 반환합니다.
+
+    1위·4위·7위…처럼 번갈아 배분해 각 코스가 상위 장소를 하나씩 갖도록 하고,
+    장소가 부족하면 앞쪽 장소를 다시 사용합니다.
+    """
+    named = [p for p in top_places if _place_name(p)]
+    activities = weather_suggestions.get("recommended_activities") or []
+    tips = list(weather_suggestions.get("tips") or [])
+    area = location or "주변"
+    mood = f"{emotion} 기분에 맞춰 " if emotion else ""
+
+    courses: list[dict[str, Any]] = []
+    for index, theme in enumerate(COURSE_THEMES):
+        places = named[index::len(COURSE_THEMES)][:COURSE_SIZE]
+        if len(places) < COURSE_SIZE:
+            places += [p for p in named if p not in places][: COURSE_SIZE - len(places)]
+        if not places and courses:
+            break
+
+        activity = activities[index % len(activities)] if activities else "데이트"
+        courses.append(
+            {
+                "title": f"{area} {theme} 코스"[:40],
+                "description": f"{mood}{activity} 위주로 구성한 코스입니다. 1인 기준 {budget_label} 예산에 맞췄습니다.",
+                "suggested_places": [_place_name(p) for p in places],
+                "tips": tips,
+                "estimated_total_cost": sum(estimate_place_budget(p) for p in places),
+            }
+        )
+    return courses
+
+
+def _log_background_result(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc:
+        logger.info("마감 이후 완료된 LLM 코스 생성 실패: %s", getattr(exc, "detail", exc))
+
+
+async def race_llm_with_template(
+    llm_call: Awaitable[list[dict[str, Any]]],
+    template: list[dict[str, Any]],
+    deadline: float,
+) -> tuple[list[dict[str, Any]], str]:
+    """
+    LLM 코스를 deadline(초)까지 기다리고 (제안 목록, 출처)를 반환합니다. 출처는 "llm" 또는 "template".
+
+    마감이 지나도 LLM 호출은 취소하지 않고 백그라운드에서 끝까지 실행해
+    응답 캐시를 채우므로, 같은 조건의 다음 요청은 LLM 결과를 바로 받습니다.
+    """
+    task = asyncio.ensure_future(llm_call)
+    try:
+        suggestions = await asyncio.wait_for(asyncio.shield(task), timeout=deadline)
+    except asyncio.TimeoutError:
+        _background_tasks.add(task)
+        task.add_done_callback(_log_background_result)
+        return template, "template"
+    except Exception as exc:
+        logger.warning("LLM 코스 생성 실패, 템플릿 코스 사용: %s", getattr(exc, "detail", exc))
+        return template, "template"
+    if not suggestions:
+        return template, "template"
+    return suggestions, "llm"
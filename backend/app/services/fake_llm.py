@@ -0,0 +1,155 @@
+"""
+오프라인 부하 테스트용 가짜 LLM 서버 (Gemini REST 호환)
+
+`POST /v1beta/models/{model}:generateContent`를 Gemini와 같은 요청/응답 형식으로 흉내 냅니다.
+API 서버의 `GEMINI_BASE_URL`을 이 서버 주소로 바꾸면 네트워크나 실제 키 없이
+추천/리포트 경로 전체를 벤치마크할 수 있습니다. (`backend/scripts/fake_llm_server.py`로 실행)
+
+- 지연: fixed / uniform / lognormal 분포 (중앙값과 퍼짐 정도 설정)
+- 오류: error_rate 비율로 503(UNAVAILABLE) 또는 429(RESOURCE_EXHAUSTED) 응답
+- 깨진 응답: malformed_rate 비율로 JSON이 아닌 텍스트 반환 (파싱 실패 경로 확인용)
+- 정상 응답: 일정 추천 프롬프트에는 `_format_itinerary_prompt` 계약에 맞는 JSON 배열,
+  리포트 프롬프트에는 고정된 요약 문단을 반환
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import random
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from ..core.config import settings
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+
+REPORT_SUMMARY = (
+    "이번 달에도 두 사람이 **함께** 많은 곳을 다녀왔어요! 🎈 "
+    "좋아하는 장소를 꾸준히 찾아가는 모습이 정말 보기 좋아요. "
+    "새로운 장소에도 도전해 보면 더 즐거운 추억이 생길 거예요. "
+    "다음 데이트도 신나게 떠나 보아요, 야호!"
+)
+
+
+@dataclass
+class FakeLLMConfig:
+    latency_distribution: str = "lognormal"
+    latency_ms: float = 800.0  # 중앙값
+    latency_spread: float = 0.5  # lognormal은 sigma, uniform은 ±비율
+    error_rate: float = 0.0
+    malformed_rate: float = 0.0
+    seed: int | None = None
+
+    @classmethod
+    def from_settings(cls) -> "FakeLLMConfig":
+        return cls(
+            latency_distribution=settings.fake_llm_latency_distribution,
+            latency_ms=settings.fake_llm_latency_ms,
+            latency_spread=settings.fake_llm_latency_spread,
+            error_rate=settings.fake_llm_error_rate,
+            malformed_rate=settings.fake_llm_malformed_rate,
+            seed=settings.fake_llm_seed,
+        )
+
+    def __post_init__(self) -> None:
+        if self.latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"지원하지 않는 지연 분포입니다: {self.latency_distribution}")
+
+
+def sample_latency(config: FakeLLMConfig, rng: random.Random) -> float:
+    """설정된 분포에서 응답 지연(초)을 뽑습니다."""
+    median = max(config.latency_ms, 0.0) / 1000
+    if config.latency_distribution == "fixed":
+        return median
+    if config.latency_distribution == "uniform":
+        spread = median * config.latency_spread
+        return max(0.0, rng.uniform(median - spread, median + spread))
+    return rng.lognormvariate(math.log(median), config.latency_spread) if median > 0 else 0.0
+
+
+def _prompt_field(prompt: str, label: str) -> str:
+    match = re.search(rf"- {label}: (.*)", prompt)
+    return match.group(1).strip() if match else ""
+
+
+def build_itinerary_response(prompt: str) -> str:
+    """일정 추천 프롬프트의 입력값을 반영한 세 가지 제안(JSON 배열 문자열)"""
+    emotion = _prompt_field(prompt, "감정 상태") or "설렘"
+    location = _prompt_field(prompt, "지역 설명") or "근처"
+    tags = [t.strip() for t in _prompt_field(prompt, "선호 태그").split(",") if t.strip()] or ["산책"]
+    suggestions = []
+    for index, theme in enumerate(("산책", "맛집", "야경"), start=1):
+        tag = tags[(index - 1) % len(tags)]
+        suggestions.append(
+            {
+                "title": f"{location} {tag} 코스 {index}"[:20],
+                "description": f"{emotion} 기분에 맞춘 {theme} 중심 코스입니다. {tag} 취향을 반영했습니다.",
+                "suggested_places": [
+                    f"{location} {tag} 명소 - {tag}를 좋아하는 커플에게 추천",
+                    f"{location} {theme} 스팟 - 분위기가 좋아요",
+                    f"{location} 카페 - 마무리하기 좋은 곳",
+                ],
+                "tips": ["사람이 붐비기 전에 출발하세요", "편한 신발을 준비하세요"],
+            }
+        )
+    return json.dumps(suggestions, ensure_ascii=False)
+
+
+def build_response_text(prompt: str) -> str:
+    if "데이트 플래너" in prompt:
+        return build_itinerary_response(prompt)
+    return REPORT_SUMMARY
+
+
+def _error_response(rng: random.Random) -> JSONResponse:
+    code, status_name = rng.choice([(503, "UNAVAILABLE"), (429, "RESOURCE_EXHAUSTED")])
+    return JSONResponse(
+        status_code=code,
+        content={"error": {"code": code, "message": "fake llm injected error", "status": status_name}},
+    )
+
+
+def create_fake_llm_app(config: FakeLLMConfig | None = None) -> FastAPI:
+    config = config or FakeLLMConfig.from_settings()
+    rng = random.Random(config.seed)
+    app = FastAPI(title="Fake Gemini")
+    app.state.config = config
+    app.state.request_count = 0
+
+    @app.post("/v1beta/models/{model}:generateContent")
+    async def generate_content(model: str, request: Request) -> Any:
+        app.state.request_count += 1
+        body = await request.json()
+        prompt = "".join(
+            part.get("text", "")
+            for content in body.get("contents", [])
+            for part in content.get("parts", [])
+        )
+        await asyncio.sleep(sample_latency(config, rng))
+
+        if rng.random() < config.error_rate:
+            return _error_response(rng)
+        text = "죄송해요, 지금은 답변을 만들 수 없어요." if rng.random() < config.malformed_rate else build_response_text(prompt)
+        return {
+            "candidates": [
+                {"content": {"role": "model", "parts": [{"text": text}]}, "finishReason": "STOP"}
+            ],
+            "usageMetadata": {
+                # 실제 토크나이저 대신 대략적인 추정치 (한국어 약 2자당 1토큰)
+                "promptTokenCount": len(prompt) // 2,
+                "candidatesTokenCount": len(text) // 2,
+                "totalTokenCount": (len(prompt) + len(text)) // 2,
+            },
+            "modelVersion": model,
+        }
+
+    @app.get("/health")
+    async def health() -> dict[str, Any]:
+        return {"status": "ok", "requests": app.state.request_count}
+
+    return app
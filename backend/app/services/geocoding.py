@@ -7,6 +7,7 @@ from typing import Any
 import httpx
 
 from ..core.config import settings
+from .autocomplete import autocomplete_index
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +92,11 @@ async def get_coordinates_from_location(location_desc: str, fallback_lat: float
         except (ValueError, IndexError):
             pass
     
+    # 자동완성 색인에 좌표가 있는 이름이면 외부 API 호출 없이 바로 사용
+    entry = autocomplete_index.lookup(location_desc)
+    if entry and entry.latitude is not None and entry.longitude is not None:
+        return entry.latitude, entry.longitude
+    
     # 지역명으로부터 좌표 추출 시도
     result = await geocode_location_name(location_desc)
     if result:
@@ -1,10 +1,20 @@
 """
 위치 계산 유틸리티 함수
 Haversine 공식을 사용하여 두 좌표 간의 거리를 계산합니다.
+
+여러 좌표를 한 번에 다룰 때는 NumPy 배열 버전을 사용합니다.
+- haversine_one_to_many / haversine_matrix: 정확한 거리 (calculate_distance와 같은 공식)
+- equirectangular_one_to_many: 짧은 거리용 근사 (오차 범위는 함수 설명 참고)
+- bounding_box / bounding_box_mask: 반경 조회 전 후보를 줄이는 사각 범위 필터
 """
 
 import math
 
+import numpy as np
+
+# 지구 반경 (미터)
+EARTH_RADIUS_METERS = 6371000
+
 
 def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -19,8 +29,7 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         두 지점 간의 거리 (미터 단위)
     """
-    # 지구 반경 (미터)
-    R = 6371000
+    R = EARTH_RADIUS_METERS
     
     # 라디안으로 변환
     phi1 = math.radians(lat1)
@@ -62,3 +71,108 @@ def is_within_radius(
 
 
 
+
+
+def _wrap_longitude_delta(delta: np.ndarray) -> np.ndarray:
+    """경도 차이를 [-180, 180) 범위로 (날짜변경선을 넘는 경우 처리)"""
+    return (delta + 180.0) % 360.0 - 180.0
+
+
+def haversine_one_to_many(lat: float, lon: float, lats, lons) -> np.ndarray:
+    """
+    한 지점에서 여러 지점까지의 거리 (미터, Haversine)
+
+    Args:
+        lat, lon: 기준 지점
+        lats, lons: 대상 지점들의 위도/경도 (같은 길이의 배열)
+
+    Returns:
+        lats와 같은 모양의 거리 배열
+    """
+    phi1 = math.radians(lat)
+    phi2 = np.radians(np.asarray(lats, dtype=float))
+    delta_phi = phi2 - phi1
+    delta_lambda = np.radians(np.asarray(lons, dtype=float) - lon)
+    a = np.sin(delta_phi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(delta_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_METERS * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def haversine_matrix(lats1, lons1, lats2, lons2) -> np.ndarray:
+    """
+    두 지점 집합 사이의 모든 쌍 거리 (미터, Haversine)
+
+    Returns:
+        (len(lats1), len(lats2)) 모양의 거리 행렬
+    """
+    phi1 = np.radians(np.asarray(lats1, dtype=float))[:, None]
+    lambda1 = np.radians(np.asarray(lons1, dtype=float))[:, None]
+    phi2 = np.radians(np.asarray(lats2, dtype=float))[None, :]
+    lambda2 = np.radians(np.asarray(lons2, dtype=float))[None, :]
+    a = np.sin((phi2 - phi1) / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin((lambda2 - lambda1) / 2) ** 2
+    return 2 * EARTH_RADIUS_METERS * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def equirectangular_one_to_many(lat: float, lon: float, lats, lons) -> np.ndarray:
+    """
+    한 지점에서 여러 지점까지의 근사 거리 (미터, 등장방형 투영)
+
+    삼각함수 호출이 적어 Haversine보다 빠르지만 짧은 거리에서만 사용합니다.
+    위도 ±70° 이내, 거리 50km 이하에서 Haversine 대비 상대 오차는 3e-5 미만입니다.
+    (50km에서 1.5m 이하, 수도권 위도·10km 이하에서는 1cm 미만)
+    """
+    lats = np.asarray(lats, dtype=float)
+    x = np.radians(_wrap_longitude_delta(np.asarray(lons, dtype=float) - lon)) * np.cos(np.radians((lats + lat) / 2))
+    y = np.radians(lats - lat)
+    return EARTH_RADIUS_METERS * np.hypot(x, y)
+
+
+def _longitude_span(lat: float, radius_meters: float) -> float | None:
+    """반경 원이 걸치는 최대 경도 차이 (도). 원이 극점을 포함하면 None"""
+    sin_delta = math.sin(radius_meters / EARTH_RADIUS_METERS)
+    cos_lat = math.cos(math.radians(lat))
+    if sin_delta >= cos_lat:
+        return None
+    return math.degrees(math.asin(sin_delta / cos_lat))
+
+
+def bounding_box(lat: float, lon: float, radius_meters: float) -> tuple[float, float, float, float]:
+    """
+    반경 원을 모두 포함하는 위경도 사각 범위 (min_lat, min_lon, max_lat, max_lon)
+
+    극점을 포함하거나 날짜변경선에 걸치면 경도 범위는 -180~180 전체가 됩니다.
+    """
+    delta_lat = math.degrees(radius_meters / EARTH_RADIUS_METERS)
+    min_lat, max_lat = max(lat - delta_lat, -90.0), min(lat + delta_lat, 90.0)
+    delta_lon = _longitude_span(lat, radius_meters)
+    if delta_lon is None or lon - delta_lon < -180 or lon + delta_lon > 180:
+        return min_lat, -180.0, max_lat, 180.0
+    return min_lat, lon - delta_lon, max_lat, lon + delta_lon
+
+
+def bounding_box_mask(lat: float, lon: float, lats, lons, radius_meters: float) -> np.ndarray:
+    """반경 원의 사각 범위 안에 있는 지점 표시 (True인 지점만 정확한 거리를 계산하면 됨)"""
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    delta_lat = math.degrees(radius_meters / EARTH_RADIUS_METERS)
+    mask = np.abs(lats - lat) <= delta_lat
+    delta_lon = _longitude_span(lat, radius_meters)
+    if delta_lon is None:
+        return mask
+    return mask & (np.abs(_wrap_longitude_delta(lons - lon)) <= delta_lon)
+
+
+def within_radius_mask(lat: float, lon: float, lats, lons, radius_meters: float = 1000) -> np.ndarray:
+    """
+    여러 지점에 대한 is_within_radius (사각 범위로 후보를 거른 뒤 Haversine으로 확인)
+
+    같은 Haversine 공식과 `<=` 비교를 사용하므로 결과는 각 지점에 is_within_radius를 호출한 것과 같습니다.
+    (반경 경계에서 1e-9m 수준의 부동소수점 차이만 있을 수 있음)
+    """
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    mask = bounding_box_mask(lat, lon, lats, lons, radius_meters)
+    candidates = np.flatnonzero(mask)
+    if candidates.size:
+        distances = haversine_one_to_many(lat, lon, lats[candidates], lons[candidates])
+        mask[candidates] = distances <= radius_meters
+    return mask
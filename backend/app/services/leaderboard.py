@@ -0,0 +1,228 @@
+"""
+커플 리더보드 (Redis sorted set)
+
+- `leaderboard:global`: 커플 누적 포인트 (couples.points와 같은 값)
+- `leaderboard:region:<지역>`: 해당 지역 챌린지 장소에서 얻은 포인트 (지역은 장소 주소의 시/군 단위, 예: "수원시")
+- `leaderboard:month:<YYYY-MM>`: 해당 월에 얻은 포인트
+
+전체 보드는 보상 지급(`rewards.grant_rewards`) 직후 `record_total`로 couples.points 값을 그대로 쓰고,
+지역/월별 보드는 리뷰가 완료된 챌린지 방문 이벤트(visit_events)를 소비하며 `record_visit_points`로 더합니다.
+순위/주변 순위 조회는 ZREVRANK·ZREVRANGE만 사용합니다. (O(log n))
+Redis 데이터가 유실되거나 어긋나면 `backend/scripts/rebuild_leaderboards.py`로 MongoDB에서 다시 만듭니다.
+"""
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from datetime import datetime
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ..db.redis import RedisConnectionManager
+
+logger = logging.getLogger(__name__)
+
+LEADERBOARD_PREFIX = "leaderboard"
+SCOPES = ("global", "region", "month")
+MONTH_BOARD_TTL_SECONDS = 60 * 60 * 24 * 400  # 월별 보드는 약 13개월 보관
+# 반영한 방문 이벤트 표시 (보드 키와 접두사를 달리 해 재구성 시 함께 지워지지 않게 함)
+APPLIED_EVENT_PREFIX = "leaderboard-applied"
+APPLIED_EVENT_TTL_SECONDS = 60 * 60 * 24 * 7
+
+COUPLES_COL = "couples"
+VISITS_COL = "visits"
+CHALLENGE_PLACES_COL = "challenge_places"
+
+
+def region_of(address: str | None) -> str | None:
+    """주소에서 시/군 단위 지역명을 꺼냅니다. ("경기도 수원시 팔달구 ..." -> "수원시")"""
+    tokens = (address or "").split()
+    if not tokens:
+        return None
+    if tokens[0].endswith("도") and len(tokens) > 1:
+        return tokens[1]
+    return tokens[0]
+
+
+def month_of(when: datetime) -> str:
+    return when.strftime("%Y-%m")
+
+
+def applied_key(event_id: ObjectId | str) -> str:
+    return f"{APPLIED_EVENT_PREFIX}:{event_id}"
+
+
+def board_key(scope: str, region: str | None = None, month: str | None = None) -> str:
+    """보드 키 (지역/월 보드는 region/month가 필요, 없으면 ValueError)"""
+    if scope == "global":
+        return f"{LEADERBOARD_PREFIX}:global"
+    if scope == "region":
+        if not region:
+            raise ValueError("지역 리더보드는 region이 필요합니다.")
+        return f"{LEADERBOARD_PREFIX}:region:{region}"
+    if scope == "month":
+        if not month:
+            raise ValueError("월별 리더보드는 month(YYYY-MM)가 필요합니다.")
+        return f"{LEADERBOARD_PREFIX}:month:{month}"
+    raise ValueError(f"알 수 없는 리더보드 종류입니다: {scope}")
+
+
+async def record_total(couple_id: str, total_points: int) -> None:
+    """보상 지급 후 커플 누적 포인트를 전체 보드에 반영합니다. (Redis 장애 시 로그만 남기고 재구성 스크립트로 복구)"""
+    try:
+        # 늦게 도착한 이전 합계가 더 큰 최신 값을 덮어쓰지 않도록 커질 때만 갱신 (ZADD GT)
+        await RedisConnectionManager.get_client().zadd(board_key("global"), {couple_id: total_points}, gt=True)
+    except Exception as e:
+        logger.warning(f"리더보드 갱신 실패: {e}")
+
+
+async def record_visit_points(
+    couple_id: str,
+    points: int,
+    address: str | None,
+    when: datetime | None = None,
+    event_id: ObjectId | None = None,
+) -> bool:
+    """
+    리뷰를 완료한 챌린지 방문의 포인트를 지역/월별 보드에 더합니다. (방문 이벤트 소비자에서 호출)
+
+    when은 포인트가 지급된 시각(리뷰 완료 이벤트 시각)으로, 월별 보드를 고르는 데 씁니다.
+    event_id가 주어지면 같은 이벤트는 한 번만 반영하고, 이미 반영한 이벤트면 False를 반환합니다.
+    Redis 오류는 호출부로 전달되어 이벤트가 다시 전달됩니다.
+    """
+    redis_client = RedisConnectionManager.get_client()
+    marker = None
+    if event_id is not None:
+        marker = applied_key(event_id)
+        if not await redis_client.set(marker, 1, nx=True, ex=APPLIED_EVENT_TTL_SECONDS):
+            return False
+
+    month_key = board_key("month", month=month_of(when or datetime.utcnow()))
+    region = region_of(address)
+    try:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            if region:
+                pipe.zincrby(board_key("region", region=region), points, couple_id)
+            pipe.zincrby(month_key, points, couple_id)
+            pipe.expire(month_key, MONTH_BOARD_TTL_SECONDS)
+            await pipe.execute()
+    except Exception:
+        if marker:
+            await redis_client.delete(marker)
+        raise
+    return True
+
+
+def _entries(rows: list[tuple[str, float]], start_rank: int) -> list[dict]:
+    return [
+        {"rank": start_rank + offset, "couple_id": member, "score": int(score)}
+        for offset, (member, score) in enumerate(rows)
+    ]
+
+
+async def top(key: str, limit: int = 10) -> list[dict]:
+    """상위 limit개 (1위부터)"""
+    rows = await RedisConnectionManager.get_client().zrevrange(key, 0, limit - 1, withscores=True)
+    return _entries(rows, 1)
+
+
+async def rank_of(key: str, couple_id: str) -> dict | None:
+    """커플의 순위와 점수 (보드에 없으면 None)"""
+    redis_client = RedisConnectionManager.get_client()
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.zrevrank(key, couple_id)
+        pipe.zscore(key, couple_id)
+        rank, score = await pipe.execute()
+    if rank is None:
+        return None
+    return {"rank": rank + 1, "couple_id": couple_id, "score": int(score or 0)}
+
+
+async def around(key: str, couple_id: str, radius: int = 2) -> list[dict]:
+    """커플 앞뒤 radius개씩을 포함한 주변 순위 (보드에 없으면 빈 목록)"""
+    redis_client = RedisConnectionManager.get_client()
+    rank = await redis_client.zrevrank(key, couple_id)
+    if rank is None:
+        return []
+    start = max(rank - radius, 0)
+    rows = await redis_client.zrevrange(key, start, rank + radius, withscores=True)
+    return _entries(rows, start + 1)
+
+
+async def board_size(key: str) -> int:
+    return await RedisConnectionManager.get_client().zcard(key)
+
+
+async def rebuild_leaderboards(db: AsyncIOMotorDatabase) -> dict[str, int]:
+    """
+    MongoDB에서 모든 보드를 다시 만듭니다.
+
+    전체 보드는 couples.points, 지역/월별 보드는 리뷰까지 완료된 챌린지 방문 기록과
+    장소의 points_reward로 계산합니다. (월은 리뷰 완료로 보상이 지급된 시각 reviewed_at 기준,
+    reviewed_at이 없는 이전 기록은 방문 기록 생성 시각)
+    임시 키에 채운 뒤 RENAME으로 교체하므로 재구성 중에도 기존 보드로 응답합니다.
+
+    Returns:
+        {보드 키: 커플 수}
+    """
+    boards: dict[str, dict[str, float]] = defaultdict(dict)
+
+    global_key = board_key("global")
+    async for couple in db[COUPLES_COL].find({"points": {"$gt": 0}}, {"points": 1}):
+        boards[global_key][str(couple["_id"])] = couple["points"]
+
+    places: dict[ObjectId, dict] = {}
+    async for place in db[CHALLENGE_PLACES_COL].find({}, {"points_reward": 1, "address": 1}):
+        places[place["_id"]] = place
+
+    cursor = db[VISITS_COL].find(
+        {"challenge_place_id": {"$ne": None}, "review_completed": True},
+        {
+            "couple_id": 1,
+            "challenge_place_id": 1,
+            "reviewed_at": 1,
+            "created_at": 1,
+            "outbox_pending": 1,
+            "outbox.event_id": 1,
+        },
+    )
+    granted: set[tuple[ObjectId, ObjectId]] = set()
+    # 집계한 방문 문서의 아직 처리되지 않은 이벤트는 재구성 결과에 이미 들어 있으므로 반영한 것으로 표시
+    # (같은 조회에서 읽어야 그 사이 저장된 방문이 두 번 반영되지 않음)
+    pending_events: list[ObjectId] = []
+    async for visit in cursor:
+        if visit.get("outbox_pending"):
+            pending_events += [event["event_id"] for event in visit.get("outbox") or []]
+        place = places.get(visit["challenge_place_id"])
+        pair = (visit["couple_id"], visit["challenge_place_id"])
+        if not place or pair in granted:
+            continue
+        granted.add(pair)
+        couple_id = str(visit["couple_id"])
+        points = place.get("points_reward", 500)
+        granted_at = visit.get("reviewed_at") or visit.get("created_at") or datetime.utcnow()
+        keys = [board_key("month", month=month_of(granted_at))]
+        region = region_of(place.get("address"))
+        if region:
+            keys.append(board_key("region", region=region))
+        for key in keys:
+            boards[key][couple_id] = boards[key].get(couple_id, 0) + points
+
+    redis_client = RedisConnectionManager.get_client()
+    for event_id in pending_events:
+        await redis_client.set(applied_key(event_id), 1, ex=APPLIED_EVENT_TTL_SECONDS)
+    stale = {key async for key in redis_client.scan_iter(match=f"{LEADERBOARD_PREFIX}:*")}
+    for key, scores in boards.items():
+        tmp_key = f"{key}:rebuild"
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.delete(tmp_key)
+            pipe.zadd(tmp_key, scores)
+            pipe.rename(tmp_key, key)
+            if key.startswith(f"{LEADERBOARD_PREFIX}:month:"):
+                pipe.expire(key, MONTH_BOARD_TTL_SECONDS)
+            await pipe.execute()
+        stale.discard(key)
+    if stale:
+        await redis_client.delete(*stale)
+    return {key: len(scores) for key, scores in boards.items()}
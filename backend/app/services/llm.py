@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import asyncio
 import json
-from functools import lru_cache
 from typing import Any
 
+import httpx
 from fastapi import HTTPException, status
-from google import genai
 
 from ..core.config import settings
+from . import llm_cache
+from .llm_gate import LLMConcurrencyGate
+from .llm_metrics import current_call, llm_metrics, record_usage, timed
+from .llm_router import LLMProvider, LLMRouter
 
 
 def _format_itinerary_prompt(emotion: str, preferences: str, location: str, additional_context: str) -> str:
@@ -70,83 +72,230 @@ def _format_report_prompt(month: str, visit_count: int, top_tags: str, emotion_s
 """
 
 
-@lru_cache
-def get_gemini_client() -> genai.Client:
+class GeminiClientManager:
+    """Gemini REST API용 비동기 HTTP 클라이언트 (커넥션 풀 공유)"""
+
+    client: httpx.AsyncClient | None = None
+
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        if cls.client is None:
+            cls.client = httpx.AsyncClient(
+                base_url=settings.gemini_base_url,
+                timeout=settings.gemini_timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=settings.llm_max_concurrency,
+                    max_keepalive_connections=settings.llm_max_concurrency,
+                ),
+            )
+        return cls.client
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls.client:
+            await cls.client.aclose()
+            cls.client = None
+
+
+class OllamaClientManager:
+    """로컬 Ollama(`LLM_BASE_URL`)용 비동기 HTTP 클라이언트 (커넥션 풀 공유)"""
+
+    client: httpx.AsyncClient | None = None
+
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        if cls.client is None:
+            cls.client = httpx.AsyncClient(
+                base_url=settings.llm_base_url,
+                timeout=settings.ollama_timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=settings.ollama_max_concurrency,
+                    max_keepalive_connections=settings.ollama_max_concurrency,
+                ),
+            )
+        return cls.client
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls.client:
+            await cls.client.aclose()
+            cls.client = None
+
+
+gemini_gate = LLMConcurrencyGate(
+    "gemini",
+    max_concurrency=settings.llm_max_concurrency,
+    max_queue=settings.llm_max_queue,
+    queue_timeout=settings.llm_queue_timeout_seconds,
+)
+
+ollama_gate = LLMConcurrencyGate(
+    "ollama",
+    max_concurrency=settings.ollama_max_concurrency,
+    max_queue=settings.ollama_max_queue,
+    queue_timeout=settings.llm_queue_timeout_seconds,
+)
+
+
+def _extract_text(data: dict[str, Any]) -> str:
+    candidates = data.get("candidates") or []
+    if not candidates:
+        feedback = data.get("promptFeedback", {})
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Gemini 응답에 후보가 없습니다: {feedback}",
+        )
+    parts = (candidates[0].get("content") or {}).get("parts") or []
+    return "".join(part.get("text", "") for part in parts)
+
+
+async def _invoke_gemini(prompt: str) -> str:
+    """Google Gemini REST API를 비동기 HTTP로 호출합니다. (스레드 풀을 점유하지 않음)"""
     if not settings.gemini_api_key:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="GEMINI_API_KEY 환경 변수가 설정되지 않았습니다. .env 파일에 GEMINI_API_KEY를 추가하세요."
         )
+    client = GeminiClientManager.get_client()
     try:
-        return genai.Client(api_key=settings.gemini_api_key)
-    except Exception as exc:  # pragma: no cover
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=f"Gemini 클라이언트 초기화 실패: {str(exc)}") from exc
+        response = await client.post(
+            f"/v1beta/models/{settings.gemini_model}:generateContent",
+            headers={"x-goog-api-key": settings.gemini_api_key},
+            json={"contents": [{"role": "user", "parts": [{"text": prompt}]}]},
+        )
+        response.raise_for_status()
+        data = response.json()
+        usage = data.get("usageMetadata") or {}
+        record_usage(usage.get("promptTokenCount"), usage.get("candidatesTokenCount"))
+        return _extract_text(data)
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Gemini API 호출 실패: {str(exc)}"
+        ) from exc
 
 
-async def _invoke_gemini(prompt: str) -> str:
-    """Google Gemini API를 사용하여 프롬프트를 처리합니다."""
-    client = get_gemini_client()
+async def _invoke_ollama(prompt: str) -> str:
+    """로컬 Ollama `/api/generate`를 비동기 HTTP로 호출합니다."""
+    client = OllamaClientManager.get_client()
     try:
-        response = await asyncio.to_thread(
-            client.models.generate_content,
-            model=settings.gemini_model,
-            contents=prompt,
+        response = await client.post(
+            "/api/generate",
+            json={
+                "model": settings.llm_model,
+                "prompt": prompt,
+                "stream": False,
+                "options": {"temperature": settings.llm_temperature},
+            },
         )
-        if hasattr(response, "text"):
-            return response.text
-        elif hasattr(response, "candidates") and len(response.candidates) > 0:
-            candidate = response.candidates[0]
-            if hasattr(candidate, "content"):
-                if hasattr(candidate.content, "parts"):
-                    return "".join(part.text for part in candidate.content.parts if hasattr(part, "text"))
-        return str(response)
+        response.raise_for_status()
+        data = response.json()
+        record_usage(data.get("prompt_eval_count"), data.get("eval_count"))
+        return data.get("response", "")
     except Exception as exc:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Gemini API 호출 실패: {str(exc)}"
+            detail=f"Ollama 호출 실패: {str(exc)}"
         ) from exc
 
 
+# 백엔드 함수는 호출 시점에 모듈 전역에서 찾는다 (테스트의 monkeypatch가 그대로 적용되도록)
+llm_router = LLMRouter(
+    [
+        LLMProvider("gemini", settings.gemini_model, gemini_gate, lambda prompt: _invoke_gemini(prompt)),
+        LLMProvider("ollama", settings.llm_model, ollama_gate, lambda prompt: _invoke_ollama(prompt)),
+    ]
+)
+
+
+async def _invoke(prompt: str, kind: str) -> tuple[str, str]:
+    """
+    LLM 호출 진입점
+
+    kind("itinerary" / "report")별 라우팅 설정에 따라 공급자를 고르고, 공급자별 동시성 게이트에서
+    슬롯을 얻은 뒤 호출합니다. 대기열이 가득 차면 503으로 거절되고 다음 공급자로 넘어갑니다.
+
+    Returns:
+        (응답 텍스트, 실제로 응답한 모델)
+    """
+    call = current_call.get()
+    if call is not None:
+        call.prompt = prompt
+    with timed(call):
+        text, provider = await llm_router.invoke(prompt, kind)
+    if call is not None:
+        call.provider, call.model, call.output = provider.name, provider.model, text
+    return text, provider.model
+
+
 async def generate_itinerary_suggestions(payload: dict[str, Any]) -> list[dict[str, Any]]:
     emotion = payload.get("emotion", "")
     preferences = payload.get("preferences", "")
     location = payload.get("location", "")
     additional_context = payload.get("additional_context", "")
     
-    prompt = _format_itinerary_prompt(emotion, preferences, location, additional_context)
-    raw = await _invoke_gemini(prompt)
-    
-    # JSON 응답에서 코드 블록이나 마크다운 제거
-    raw = raw.strip()
-    if raw.startswith("```json"):
-        raw = raw[7:]
-    elif raw.startswith("```"):
-        raw = raw[3:]
-    if raw.endswith("```"):
-        raw = raw[:-3]
-    raw = raw.strip()
-    
-    try:
-        parsed = json.loads(raw)
-    except json.JSONDecodeError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=f"LLM 응답 파싱 실패: {str(exc)}, 원본 응답: {raw[:200]}") from exc
-
-    if not isinstance(parsed, list):
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="LLM 응답 형식 오류")
-
-    clean: list[dict[str, Any]] = []
-    for item in parsed:
-        if isinstance(item, dict):
-            clean.append(
-                {
-                    "title": str(item.get("title", ""))[:40],
-                    "description": str(item.get("description", "")),
-                    "suggested_places": [str(p) for p in item.get("suggested_places", [])],
-                    "tips": [str(t) for t in item.get("tips", [])],
-                    "estimated_total_cost": item.get("estimated_total_cost", 0),
-                }
-            )
-    return clean
+    # 같은 감정/취향/지역 조합은 캐시된 제안을 재사용 (취향 태그 순서는 무시)
+    model = llm_router.preferred_model("itinerary")
+    cache_key = llm_cache.make_key(
+        "itinerary",
+        model,
+        {
+            "emotion": emotion,
+            "preferences": ", ".join(sorted(p.strip() for p in str(preferences).split(",") if p.strip())),
+            "location": location,
+            "additional_context": additional_context,
+        },
+    )
+    variants = settings.llm_cache_itinerary_variants
+    with llm_metrics.track("itinerary") as call:
+        cached = await llm_cache.get_cached(cache_key, variants)
+        if cached is not None:
+            call.cache_hit = True
+            return cached
+        
+        prompt = _format_itinerary_prompt(emotion, preferences, location, additional_context)
+        raw, answered_by = await _invoke(prompt, "itinerary")
+        
+        # JSON 응답에서 코드 블록이나 마크다운 제거
+        raw = raw.strip()
+        if raw.startswith("```json"):
+            raw = raw[7:]
+        elif raw.startswith("```"):
+            raw = raw[3:]
+        if raw.endswith("```"):
+            raw = raw[:-3]
+        raw = raw.strip()
+        
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            call.outcome = "parse_error"
+            raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=f"LLM 응답 파싱 실패: {str(exc)}, 원본 응답: {raw[:200]}") from exc
+
+        if not isinstance(parsed, list):
+            call.outcome = "format_error"
+            raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="LLM 응답 형식 오류")
+
+        clean: list[dict[str, Any]] = []
+        for item in parsed:
+            if isinstance(item, dict):
+                clean.append(
+                    {
+                        "title": str(item.get("title", ""))[:40],
+                        "description": str(item.get("description", "")),
+                        "suggested_places": [str(p) for p in item.get("suggested_places", [])],
+                        "tips": [str(t) for t in item.get("tips", [])],
+                        "estimated_total_cost": item.get("estimated_total_cost", 0),
+                    }
+                )
+        if not clean:
+            call.outcome = "empty"
+        elif answered_by == model:
+            # 장애 조치/헤징으로 다른 모델이 응답했으면 선호 모델의 캐시에 섞지 않음
+            await llm_cache.store(cache_key, clean, variants)
+        return clean
 
 
 async def generate_report_summary(payload: dict[str, Any]) -> str:
@@ -178,9 +327,40 @@ async def generate_report_summary(payload: dict[str, Any]) -> str:
     plan_emotion_goals = payload.get("plan_emotion_goals", [])
     notes = payload.get("notes", "")
     
-    prompt = _format_report_prompt(
-        month, visit_count, top_tags, emotion_stats, challenge_progress,
-        couple_preference_tags, couple_emotion_goals, couple_budget, plan_emotion_goals, notes
+    # 같은 달의 통계가 바뀌지 않았다면 다시 요청해도 캐시된 요약을 반환
+    model = llm_router.preferred_model("report")
+    cache_key = llm_cache.make_key(
+        "report",
+        model,
+        {
+            "month": month,
+            "visit_count": visit_count,
+            "top_tags": top_tags,
+            "emotion_stats": emotion_stats,
+            "challenge_progress": challenge_progress,
+            "couple_preference_tags": couple_preference_tags,
+            "couple_emotion_goals": couple_emotion_goals,
+            "couple_budget": couple_budget,
+            "plan_emotion_goals": plan_emotion_goals,
+            "notes": notes,
+        },
     )
-    summary = await _invoke_gemini(prompt)
-    return summary.strip()
+    variants = settings.llm_cache_report_variants
+    with llm_metrics.track("report") as call:
+        cached = await llm_cache.get_cached(cache_key, variants)
+        if cached is not None:
+            call.cache_hit = True
+            return cached
+        
+        prompt = _format_report_prompt(
+            month, visit_count, top_tags, emotion_stats, challenge_progress,
+            couple_preference_tags, couple_emotion_goals, couple_budget, plan_emotion_goals, notes
+        )
+        summary, answered_by = await _invoke(prompt, "report")
+        summary = summary.strip()
+        if not summary:
+            call.outcome = "empty"
+        elif answered_by == model:
+            # 장애 조치/헤징으로 다른 모델이 응답했으면 선호 모델의 캐시에 섞지 않음
+            await llm_cache.store(cache_key, summary, variants)
+        return summary
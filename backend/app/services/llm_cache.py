@@ -0,0 +1,65 @@
+"""
+LLM 응답 캐시 (Redis)
+
+프롬프트 입력값 + 모델명을 정규화한 해시를 키로 파싱된 결과를 TTL과 함께 저장합니다.
+키마다 최대 `variants`개의 서로 다른 응답을 모아 두고, 다 모이기 전까지는 캐시 미스로 처리해
+새 응답을 생성합니다. 다 모인 뒤에는 그중 하나를 무작위로 돌려주므로 같은 조건에서도 다양성이 유지됩니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import random
+from typing import Any
+
+from ..core.config import settings
+from ..db.redis import RedisConnectionManager
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_PREFIX = "llm:cache"
+
+
+def make_key(kind: str, model: str, inputs: dict[str, Any]) -> str:
+    """프롬프트 종류/모델/입력값으로 정규화된 캐시 키를 만듭니다. (키 순서, 앞뒤 공백 무관)"""
+    normalized = {k: v.strip() if isinstance(v, str) else v for k, v in inputs.items()}
+    canonical = json.dumps(
+        {"kind": kind, "model": model, "inputs": normalized},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return f"{LLM_CACHE_PREFIX}:{kind}:{digest}"
+
+
+async def get_cached(key: str, variants: int = 1) -> Any | None:
+    """캐시된 응답 중 하나를 반환합니다. 저장된 변형이 `variants`개 미만이면 None (새로 생성)."""
+    if not settings.llm_cache_enabled:
+        return None
+    try:
+        redis_client = RedisConnectionManager.get_client()
+        count = await redis_client.llen(key)
+        if not count or count < variants:
+            return None
+        raw = await redis_client.lindex(key, random.randrange(count))
+        return json.loads(raw) if raw else None
+    except Exception as e:
+        logger.warning(f"LLM 캐시 조회 실패: {e}")
+        return None
+
+
+async def store(key: str, value: Any, variants: int = 1) -> None:
+    """응답을 변형 목록에 추가하고 최근 `variants`개만 남깁니다."""
+    if not settings.llm_cache_enabled:
+        return
+    try:
+        redis_client = RedisConnectionManager.get_client()
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.rpush(key, json.dumps(value, ensure_ascii=False))
+            pipe.ltrim(key, -max(1, variants), -1)
+            pipe.expire(key, settings.llm_cache_ttl_seconds)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"LLM 캐시 저장 실패: {e}")
@@ -0,0 +1,91 @@
+"""
+LLM 호출 동시성 게이트
+
+동시에 실행되는 LLM 호출 수를 세마포어로 제한하고, 대기열 길이에도 상한을 둡니다.
+대기열이 가득 차거나 대기 시간이 초과되면 즉시 503을 반환해 요청이 무한정 쌓이지 않도록 합니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from fastapi import HTTPException, status
+
+from ..core.metrics import Histogram
+
+
+class LLMConcurrencyGate:
+    def __init__(self, name: str, max_concurrency: int, max_queue: int, queue_timeout: float) -> None:
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = queue_timeout
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.in_flight = 0
+        self.waiting = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.wait_seconds = Histogram()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 세마포어는 이벤트 루프에 묶이므로 루프가 바뀌면(테스트의 asyncio.run 등) 새로 만든다
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    @property
+    def saturation(self) -> float:
+        """실행 중 + 대기 중 호출 수를 동시성 한도로 나눈 값 (1.0 이상이면 대기 발생)"""
+        return (self.in_flight + self.waiting) / self.max_concurrency
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        semaphore = self._get_semaphore()
+        if self.in_flight + self.waiting >= self.max_concurrency + self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="AI 요청이 많아 잠시 후 다시 시도해주세요.",
+            )
+
+        self.waiting += 1
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError as exc:
+            self.timed_out += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="AI 요청 대기 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+            ) from exc
+        finally:
+            self.waiting -= 1
+        self.wait_seconds.observe(time.perf_counter() - started)
+
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            semaphore.release()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "wait_seconds": self.wait_seconds.snapshot(),
+        }
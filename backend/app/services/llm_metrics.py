@@ -0,0 +1,168 @@
+"""
+LLM 호출 계측
+
+`generate_*` 함수의 호출 하나마다 LLMCall 레코드를 만들어 ContextVar에 두고,
+공급자 호출부(`_invoke_gemini` / `_invoke_ollama`)와 라우터가 같은 레코드에 토큰 수·모델·지연을 채웁니다.
+(헤징 태스크도 컨텍스트를 복사하므로 같은 레코드 객체를 공유합니다)
+
+- 종류별 히스토그램: LLM 지연(초), 프롬프트/응답 토큰 수
+- 종류별 결과 카운터: ok / parse_error / format_error / empty / error, 캐시 적중/미스
+- 샘플 링버퍼: LLM_SAMPLE_RATE 비율로 프롬프트·응답을 보관 (실패한 호출은 항상 보관)
+"""
+from __future__ import annotations
+
+import random
+import time
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any
+
+from ..core.config import settings
+from ..core.metrics import Histogram
+
+TOKEN_BUCKETS: tuple[float, ...] = (50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000)
+
+OUTCOMES = ("ok", "parse_error", "format_error", "empty", "error")
+
+
+def estimate_tokens(text: str) -> int:
+    """공급자가 토큰 수를 주지 않을 때의 대략적인 추정치 (한국어 기준 약 2자당 1토큰)"""
+    return (len(text) + 1) // 2
+
+
+@dataclass
+class LLMCall:
+    kind: str
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    provider: str | None = None
+    model: str | None = None
+    cache_hit: bool = False
+    prompt: str = ""
+    output: str = ""
+    prompt_tokens: int | None = None
+    output_tokens: int | None = None
+    tokens_estimated: bool = False
+    latency_seconds: float | None = None
+    outcome: str | None = None
+    error: str | None = None
+
+    def record_usage(self, prompt_tokens: int | None, output_tokens: int | None) -> None:
+        self.prompt_tokens = prompt_tokens
+        self.output_tokens = output_tokens
+
+    def summary(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["prompt_chars"] = len(self.prompt)
+        data["output_chars"] = len(self.output)
+        limit = settings.llm_sample_max_chars
+        data["prompt"] = self.prompt[:limit]
+        data["output"] = self.output[:limit]
+        return data
+
+
+current_call: ContextVar[LLMCall | None] = ContextVar("llm_current_call", default=None)
+
+
+def record_usage(prompt_tokens: int | None, output_tokens: int | None) -> None:
+    """공급자 응답의 토큰 사용량을 현재 호출 레코드에 기록합니다."""
+    call = current_call.get()
+    if call is not None:
+        call.record_usage(prompt_tokens, output_tokens)
+
+
+class _KindStats:
+    def __init__(self) -> None:
+        self.latency_seconds = Histogram()
+        self.prompt_tokens = Histogram(TOKEN_BUCKETS)
+        self.output_tokens = Histogram(TOKEN_BUCKETS)
+        self.outcomes: Counter[str] = Counter()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "outcomes": dict(self.outcomes),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "latency_seconds": self.latency_seconds.snapshot(),
+            "prompt_tokens": self.prompt_tokens.snapshot(),
+            "output_tokens": self.output_tokens.snapshot(),
+        }
+
+
+class LLMMetrics:
+    def __init__(self, sample_size: int) -> None:
+        self._kinds: dict[str, _KindStats] = {}
+        self.samples: deque[dict[str, Any]] = deque(maxlen=sample_size)
+
+    def _stats(self, kind: str) -> _KindStats:
+        return self._kinds.setdefault(kind, _KindStats())
+
+    @contextmanager
+    def track(self, kind: str) -> Iterator[LLMCall]:
+        """호출 레코드를 현재 컨텍스트에 두고, 블록이 끝나면 결과를 집계합니다."""
+        call = LLMCall(kind=kind)
+        token = current_call.set(call)
+        try:
+            yield call
+        except Exception as exc:
+            call.outcome = call.outcome or "error"
+            call.error = str(getattr(exc, "detail", exc))
+            raise
+        finally:
+            current_call.reset(token)
+            call.outcome = call.outcome or "ok"
+            self.observe(call)
+
+    def observe(self, call: LLMCall) -> None:
+        stats = self._stats(call.kind)
+        stats.outcomes[call.outcome or "ok"] += 1
+        if call.cache_hit:
+            stats.cache_hits += 1
+            return
+        stats.cache_misses += 1
+        if call.latency_seconds is not None:
+            stats.latency_seconds.observe(call.latency_seconds)
+        if call.prompt and call.prompt_tokens is None:
+            call.prompt_tokens = estimate_tokens(call.prompt)
+            call.tokens_estimated = True
+        if call.output and call.output_tokens is None:
+            call.output_tokens = estimate_tokens(call.output)
+            call.tokens_estimated = True
+        if call.prompt_tokens is not None:
+            stats.prompt_tokens.observe(call.prompt_tokens)
+        if call.output_tokens is not None:
+            stats.output_tokens.observe(call.output_tokens)
+
+        if call.outcome != "ok" or random.random() < settings.llm_sample_rate:
+            self.samples.append(call.summary())
+
+    def recent_samples(self, limit: int = 50, kind: str | None = None, outcome: str | None = None) -> list[dict[str, Any]]:
+        """최근 샘플을 최신순으로 반환합니다."""
+        matched = [
+            sample
+            for sample in reversed(self.samples)
+            if (kind is None or sample["kind"] == kind) and (outcome is None or sample["outcome"] == outcome)
+        ]
+        return matched[:limit]
+
+    def snapshot(self) -> dict[str, Any]:
+        return {kind: stats.snapshot() for kind, stats in self._kinds.items()}
+
+
+llm_metrics = LLMMetrics(settings.llm_sample_buffer_size)
+
+
+@contextmanager
+def timed(call: LLMCall | None) -> Iterator[None]:
+    """공급자 호출 구간의 지연 시간을 레코드에 기록합니다."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if call is not None:
+            call.latency_seconds = time.perf_counter() - started
@@ -0,0 +1,160 @@
+"""
+LLM 공급자 라우터
+
+프롬프트 종류(kind)별로 설정된 공급자 후보(`LLM_ROUTE_<KIND>`, 예: "ollama,gemini") 중
+관측된 지연 시간·오류율·대기열 포화도로 점수를 매겨 가장 유리한 공급자를 먼저 호출합니다.
+
+- 점수: 지연 EWMA × (1 + 게이트 포화도) ÷ (1 - 오류율 EWMA) × (1 + 0.5 × 설정 순위)
+  설정 순위 가중치 때문에 비슷한 조건이면 먼저 적은 공급자가 선택됩니다.
+- 장애 조치: 호출이 실패하면 다음 후보로 넘어갑니다.
+- 헤징: `LLM_HEDGE_AFTER_SECONDS` > 0 이면 첫 공급자가 그 시간 안에 응답하지 않을 때
+  두 번째 공급자에도 요청을 보내고 먼저 성공한 응답을 사용합니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from fastapi import HTTPException, status
+
+from ..core.config import settings
+from ..core.metrics import Histogram
+from .llm_gate import LLMConcurrencyGate
+
+logger = logging.getLogger(__name__)
+
+EWMA_ALPHA = 0.2
+# 관측값이 없을 때 가정하는 지연 시간(초)
+DEFAULT_LATENCY_SECONDS = 2.0
+RANK_PENALTY = 0.5
+
+
+class LLMProvider:
+    def __init__(
+        self,
+        name: str,
+        model: str,
+        gate: LLMConcurrencyGate,
+        call: Callable[[str], Awaitable[str]],
+    ) -> None:
+        self.name = name
+        self.model = model
+        self.gate = gate
+        self._call = call
+        self.latency_ewma: float | None = None
+        self.error_ewma = 0.0
+        self.calls = 0
+        self.errors = 0
+        self.latency_seconds = Histogram()
+
+    def _record(self, elapsed: float, failed: bool) -> None:
+        self.calls += 1
+        self.errors += int(failed)
+        self.error_ewma += EWMA_ALPHA * (float(failed) - self.error_ewma)
+        if not failed:
+            self.latency_seconds.observe(elapsed)
+            if self.latency_ewma is None:
+                self.latency_ewma = elapsed
+            else:
+                self.latency_ewma += EWMA_ALPHA * (elapsed - self.latency_ewma)
+
+    def score(self, rank: int) -> float:
+        latency = self.latency_ewma if self.latency_ewma is not None else DEFAULT_LATENCY_SECONDS
+        error_rate = min(self.error_ewma, 0.95)
+        return latency * (1 + self.gate.saturation) / (1 - error_rate) * (1 + RANK_PENALTY * rank)
+
+    async def invoke(self, prompt: str) -> str:
+        async with self.gate.slot():
+            started = time.perf_counter()
+            try:
+                result = await self._call(prompt)
+            except asyncio.CancelledError:
+                # 헤징으로 취소된 호출은 오류로 집계하지 않는다
+                raise
+            except Exception:
+                self._record(time.perf_counter() - started, failed=True)
+                raise
+            self._record(time.perf_counter() - started, failed=False)
+            return result
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "model": self.model,
+            "calls": self.calls,
+            "errors": self.errors,
+            "latency_ewma": round(self.latency_ewma, 6) if self.latency_ewma is not None else None,
+            "error_rate_ewma": round(self.error_ewma, 6),
+            "latency_seconds": self.latency_seconds.snapshot(),
+            "gate": self.gate.snapshot(),
+        }
+
+
+class LLMRouter:
+    def __init__(self, providers: list[LLMProvider]) -> None:
+        self.providers = {provider.name: provider for provider in providers}
+
+    def route(self, kind: str) -> list[str]:
+        """설정에 적힌 kind의 공급자 후보 (알 수 없는 이름은 무시)"""
+        configured = getattr(settings, f"llm_route_{kind}", "gemini")
+        names = [name.strip() for name in configured.split(",") if name.strip() in self.providers]
+        return names or ["gemini"]
+
+    def candidates(self, kind: str) -> list[LLMProvider]:
+        """점수가 낮은(유리한) 순서로 정렬된 공급자 목록"""
+        ranked = [(self.providers[name].score(rank), rank, self.providers[name]) for rank, name in enumerate(self.route(kind))]
+        return [provider for _score, _rank, provider in sorted(ranked, key=lambda item: item[:2])]
+
+    def preferred_model(self, kind: str) -> str:
+        """kind에 설정된 첫 번째 공급자의 모델 (응답 캐시 키에 사용)"""
+        return self.providers[self.route(kind)[0]].model
+
+    async def invoke(self, prompt: str, kind: str) -> tuple[str, LLMProvider]:
+        """응답 텍스트와 실제로 응답한 공급자를 반환합니다."""
+        candidates = self.candidates(kind)
+        hedge_after = settings.llm_hedge_after_seconds
+        if hedge_after > 0 and len(candidates) > 1:
+            try:
+                return await self._invoke_hedged(prompt, candidates[0], candidates[1], hedge_after)
+            except Exception as exc:
+                logger.warning("LLM 헤징 호출 실패 (%s): %s", kind, getattr(exc, "detail", exc))
+                candidates = candidates[2:]
+                last_error: Exception = exc
+        else:
+            last_error = HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="사용 가능한 AI 공급자가 없습니다.")
+
+        for provider in candidates:
+            try:
+                return await provider.invoke(prompt), provider
+            except Exception as exc:
+                logger.warning("LLM 공급자 %s 호출 실패 (%s): %s", provider.name, kind, getattr(exc, "detail", exc))
+                last_error = exc
+        raise last_error
+
+    async def _invoke_hedged(
+        self, prompt: str, primary: LLMProvider, secondary: LLMProvider, hedge_after: float
+    ) -> tuple[str, LLMProvider]:
+        tasks = {asyncio.create_task(primary.invoke(prompt)): primary}
+        try:
+            done, _pending = await asyncio.wait(tasks, timeout=hedge_after)
+            if not done or next(iter(done)).exception():
+                tasks[asyncio.create_task(secondary.invoke(prompt))] = secondary
+
+            last_error: BaseException | None = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result(), tasks[task]
+                    last_error = task.exception()
+            raise last_error  # type: ignore[misc]
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        return [provider.snapshot() for provider in self.providers.values()]
@@ -0,0 +1,171 @@
+"""
+GPS 궤적 일괄 위치 인증
+
+데이트 후 기록된 궤적(시각이 붙은 좌표 목록)을 한 번에 받아 모든 활성 챌린지 장소의 인증 반경과 비교합니다.
+
+- 챌린지 장소를 격자(위도 방향 한 칸 = 인증 반경)에 넣어 두고, 각 좌표는 주변 칸의 장소만 정확한 거리로 확인합니다.
+  (후보 장소들은 NumPy 배열 버전 within_radius_mask / haversine_one_to_many로 한 번에 계산)
+- 장소별로 반경 안에 처음 들어온 시각과 최소 거리를 기록합니다.
+- 방문 기록은 `/challenges/verify-location`과 같은 규칙으로 만들거나 갱신하되, `bulk_write` 한 번으로 반영합니다.
+  (새로 만드는 기록에는 생성 이벤트를 함께 담음, visit_events)
+  새 기록은 (couple_id, challenge_place_id) 고유 인덱스를 기준으로 upsert하므로 동시에 실행돼도 하나만 만들어집니다.
+"""
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import numpy as np
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from .geolocation import haversine_one_to_many, within_radius_mask
+from .visit_events import with_created_event
+
+VISITS_COL = "visits"
+VERIFY_RADIUS_METERS = 1000
+METERS_PER_DEGREE_LAT = 111_320
+
+
+@dataclass
+class TraceHit:
+    place: dict
+    first_seen_at: datetime
+    distance_meters: float
+
+
+class GeofenceGrid:
+    """장소 좌표를 격자 칸에 담아 반경 조회 후보를 좁히는 공간 색인"""
+
+    def __init__(self, places: list[dict], radius_meters: float) -> None:
+        self.radius_meters = radius_meters
+        self._cell_deg = radius_meters / METERS_PER_DEGREE_LAT
+        self._cells: dict[tuple[int, int], list[dict]] = defaultdict(list)
+        for place in places:
+            self._cells[self._cell(place["latitude"], place["longitude"])].append(place)
+
+    def _cell(self, latitude: float, longitude: float) -> tuple[int, int]:
+        return math.floor(latitude / self._cell_deg), math.floor(longitude / self._cell_deg)
+
+    def candidates(self, latitude: float, longitude: float) -> list[dict]:
+        row, col = self._cell(latitude, longitude)
+        # 경도 1도의 길이는 cos(위도)만큼 짧아지므로 경도 방향으로는 그만큼 더 넓게 확인
+        cos_lat = max(math.cos(math.radians(min(abs(latitude) + self._cell_deg, 90.0))), 1e-6)
+        col_span = math.ceil(1 / cos_lat)
+        found: list[dict] = []
+        for d_row in (-1, 0, 1):
+            for d_col in range(-col_span, col_span + 1):
+                found.extend(self._cells.get((row + d_row, col + d_col), ()))
+        return found
+
+    def within(self, latitude: float, longitude: float) -> list[tuple[dict, float]]:
+        """반경 안에 있는 (장소, 거리) 목록 (주변 칸 후보를 배열로 한 번에 확인)"""
+        candidates = self.candidates(latitude, longitude)
+        if not candidates:
+            return []
+        lats = np.fromiter((place["latitude"] for place in candidates), dtype=float, count=len(candidates))
+        lons = np.fromiter((place["longitude"] for place in candidates), dtype=float, count=len(candidates))
+        inside = np.flatnonzero(within_radius_mask(latitude, longitude, lats, lons, self.radius_meters))
+        if not inside.size:
+            return []
+        distances = haversine_one_to_many(latitude, longitude, lats[inside], lons[inside])
+        return [(candidates[index], float(distance)) for index, distance in zip(inside, distances)]
+
+
+def _utc_naive(value: datetime) -> datetime:
+    """다른 방문 기록과 같은 형식(UTC, 시간대 정보 없음)으로 맞춤"""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def match_trace(
+    places: list[dict], points: list[dict], radius_meters: float = VERIFY_RADIUS_METERS
+) -> dict[str, TraceHit]:
+    """궤적 좌표를 시간순으로 훑어 장소별 첫 진입 시각과 최소 거리를 구합니다."""
+    grid = GeofenceGrid(places, radius_meters)
+    hits: dict[str, TraceHit] = {}
+    timed = sorted(((_utc_naive(p["recorded_at"]), p) for p in points), key=lambda item: item[0])
+    for recorded_at, point in timed:
+        for place, distance in grid.within(point["latitude"], point["longitude"]):
+            hit = hits.get(place["id"])
+            if hit is None:
+                hits[place["id"]] = TraceHit(place, recorded_at, distance)
+            elif distance < hit.distance_meters:
+                hit.distance_meters = distance
+    return hits
+
+
+async def verify_trace(
+    db: AsyncIOMotorDatabase, couple_id: str, user_id: str, places: list[dict], points: list[dict]
+) -> list[dict]:
+    """
+    궤적으로 인증된 챌린지 장소의 방문 기록을 한 번에 반영합니다.
+
+    Returns:
+        [{challenge_place_id, name, distance_meters, verified_at, newly_verified}] (첫 진입 시각 순)
+    """
+    hits = match_trace(places, points)
+    if not hits:
+        return []
+
+    couple_obj_id = ObjectId(couple_id)
+    place_obj_ids = [ObjectId(place_id) for place_id in hits]
+    existing: dict[str, dict] = {}
+    cursor = db[VISITS_COL].find(
+        {"couple_id": couple_obj_id, "challenge_place_id": {"$in": place_obj_ids}},
+        {"challenge_place_id": 1, "location_verified": 1, "review_completed": 1},
+    )
+    async for doc in cursor:
+        existing.setdefault(str(doc["challenge_place_id"]), doc)
+
+    now = datetime.utcnow()
+    operations: list[UpdateOne] = []
+    results: list[dict] = []
+    for place_id, hit in sorted(hits.items(), key=lambda item: item[1].first_seen_at):
+        visit = existing.get(place_id)
+        newly_verified = visit is None or not (visit.get("location_verified") or visit.get("review_completed"))
+        if visit is None:
+            # 새 방문 기록 (동시에 다른 요청이 만들었으면 덮어쓰지 않음)
+            key = {"couple_id": couple_obj_id, "challenge_place_id": ObjectId(place_id)}
+            new_doc = with_created_event(
+                {
+                    **key,
+                    "user_id": ObjectId(user_id),
+                    "plan_id": None,
+                    "place_id": hit.place.get("place_id", ""),
+                    "place_name": hit.place.get("name", ""),
+                    "visited_at": hit.first_seen_at.isoformat(),
+                    "emotion": None,
+                    "tags": [],
+                    "memo": "",
+                    "rating": None,
+                    "location_verified": True,
+                    "review_completed": False,
+                    "created_at": now,
+                    "updated_at": now,
+                },
+                now,
+            )
+            set_on_insert = {name: value for name, value in new_doc.items() if name not in key}
+            operations.append(UpdateOne(key, {"$setOnInsert": set_on_insert}, upsert=True))
+        elif newly_verified:
+            operations.append(
+                UpdateOne({"_id": visit["_id"]}, {"$set": {"location_verified": True, "updated_at": now}})
+            )
+        results.append(
+            {
+                "challenge_place_id": place_id,
+                "name": hit.place.get("name", ""),
+                "distance_meters": round(hit.distance_meters, 2),
+                "verified_at": hit.first_seen_at,
+                "newly_verified": newly_verified,
+            }
+        )
+
+    if operations:
+        await db[VISITS_COL].bulk_write(operations, ordered=False)
+    return results
@@ -0,0 +1,197 @@
+"""
+커플별 월간 방문 집계 (monthly_rollups)
+
+월간 리포트에 필요한 방문 통계를 (커플, 월)마다 문서 하나로 유지합니다. 월은 방문 기록의 created_at 기준입니다.
+
+    {_id: "<couple_id>:<YYYY-MM>", couple_id, month, visit_count,
+     tags: {<태그>: n}, emotions: {<감정>: n}, notes: [{visit_id, memo}] (최근 NOTES_KEPT개),
+     applied_events: [<event_id>], updated_at}
+
+- 방문 이벤트(visit_events) 소비자가 이벤트마다 `$inc`로 갱신합니다. (`record_visit_change`)
+- 문서가 없는 달(기능 도입 이전 데이터 등)은 처음 읽을 때 방문 기록을 집계해 만들고,
+  `backend/scripts/rebuild_monthly_rollups.py`로 전체를 다시 만들 수 있습니다.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ..db.keys import escape_key, unescape_key
+from .challenge_counters import counter_delta
+from .visit_events import applied_guard, facet_event_ids, pending_events_facet
+
+MONTHLY_ROLLUPS_COL = "monthly_rollups"
+VISITS_COL = "visits"
+
+NOTES_KEPT = 5  # 요약 프롬프트에 넣는 최근 메모 수
+
+
+def month_of(when: datetime) -> str:
+    return when.strftime("%Y-%m")
+
+
+def month_range(month: str) -> tuple[datetime, datetime]:
+    """"YYYY-MM" 문자열을 [해당 월 1일, 다음 달 1일) 구간으로 변환"""
+    start = datetime.fromisoformat(f"{month}-01")
+    if start.month == 12:
+        end = start.replace(year=start.year + 1, month=1)
+    else:
+        end = start.replace(month=start.month + 1)
+    return start, end
+
+
+def rollup_id(couple_id: ObjectId, month: str) -> str:
+    return f"{couple_id}:{month}"
+
+
+def rollup_pipeline(couple_id: ObjectId, start: datetime, end: datetime) -> list[dict]:
+    """
+    한 달 방문 기록의 방문 수, 태그별 수, 감정별 수, 최근 메모를 한 번에 계산하는 집계 파이프라인
+
+    결과는 문서 하나: {count: [{n}], tags: [{_id, n}], emotions: [{_id, n}], notes: [{notes: [{visit_id, memo}]}],
+    pending_events: [{event_ids}]}
+    """
+    return [
+        {"$match": {"couple_id": couple_id, "created_at": {"$gte": start, "$lt": end}}},
+        # (couple_id, created_at) 인덱스 순서를 그대로 사용 (메모를 작성 순서대로 모음)
+        {"$sort": {"created_at": 1}},
+        {
+            "$facet": {
+                "count": [{"$count": "n"}],
+                "tags": [{"$unwind": "$tags"}, {"$group": {"_id": "$tags", "n": {"$sum": 1}}}],
+                "emotions": [
+                    {"$match": {"emotion": {"$nin": [None, ""]}}},
+                    {"$group": {"_id": "$emotion", "n": {"$sum": 1}}},
+                ],
+                "notes": [
+                    {"$match": {"memo": {"$nin": [None, ""]}}},
+                    {
+                        "$group": {
+                            "_id": None,
+                            "notes": {"$lastN": {"n": NOTES_KEPT, "input": {"visit_id": "$_id", "memo": "$memo"}}},
+                        }
+                    },
+                ],
+                **pending_events_facet(),
+            }
+        },
+    ]
+
+
+async def rebuild_rollup(db: AsyncIOMotorDatabase, couple_id: str | ObjectId, month: str) -> dict:
+    """
+    커플의 한 달 방문 기록을 집계해 집계 문서를 새로 만듭니다.
+
+    집계한 방문 문서의 아직 처리되지 않은 이벤트는 결과에 이미 들어 있으므로 처리한 것으로 기록합니다.
+    """
+    couple_obj_id = ObjectId(couple_id)
+    result: dict = {}
+    async for doc in db[VISITS_COL].aggregate(rollup_pipeline(couple_obj_id, *month_range(month))):
+        result = doc
+    count = result.get("count") or [{}]
+    notes = result.get("notes") or [{}]
+
+    doc = {
+        "couple_id": couple_obj_id,
+        "month": month,
+        "visit_count": count[0].get("n", 0),
+        "tags": {escape_key(item["_id"]): item["n"] for item in result.get("tags") or []},
+        "emotions": {escape_key(item["_id"]): item["n"] for item in result.get("emotions") or []},
+        "notes": notes[0].get("notes", []),
+        "applied_events": facet_event_ids(result),
+        "updated_at": datetime.utcnow(),
+    }
+    _id = rollup_id(couple_obj_id, month)
+    await db[MONTHLY_ROLLUPS_COL].replace_one({"_id": _id}, doc, upsert=True)
+    return {"_id": _id, **doc}
+
+
+async def rollup_targets(
+    db: AsyncIOMotorDatabase, couple_id: str | ObjectId | None = None, month: str | None = None
+) -> list[tuple[ObjectId, str]]:
+    """방문 기록이 있는 (커플, 월) 목록 (재생성 스크립트용)"""
+    match: dict = {"created_at": {"$type": "date"}}
+    if couple_id is not None:
+        match["couple_id"] = ObjectId(couple_id)
+    if month is not None:
+        start, end = month_range(month)
+        match["created_at"] = {"$gte": start, "$lt": end}
+    pipeline = [
+        {"$match": match},
+        {
+            "$group": {
+                "_id": {
+                    "couple_id": "$couple_id",
+                    "month": {"$dateToString": {"format": "%Y-%m", "date": "$created_at"}},
+                }
+            }
+        },
+        {"$sort": {"_id.couple_id": 1, "_id.month": 1}},
+    ]
+    return [(doc["_id"]["couple_id"], doc["_id"]["month"]) async for doc in db[VISITS_COL].aggregate(pipeline)]
+
+
+async def get_rollup(db: AsyncIOMotorDatabase, couple_id: str | ObjectId, month: str) -> dict:
+    """
+    커플의 월간 집계 조회 (없으면 방문 기록에서 생성)
+
+    Returns:
+        {visit_count, tags: Counter, emotions: Counter, notes: [메모]}
+    """
+    doc = await db[MONTHLY_ROLLUPS_COL].find_one({"_id": rollup_id(ObjectId(couple_id), month)})
+    if doc is None:
+        doc = await rebuild_rollup(db, couple_id, month)
+    return {
+        "visit_count": doc.get("visit_count", 0),
+        "tags": Counter({unescape_key(k): v for k, v in (doc.get("tags") or {}).items() if v > 0}),
+        "emotions": Counter({unescape_key(k): v for k, v in (doc.get("emotions") or {}).items() if v > 0}),
+        "notes": [note["memo"] for note in doc.get("notes") or []],
+    }
+
+
+async def record_visit_change(
+    db: AsyncIOMotorDatabase,
+    couple_id: str | ObjectId,
+    visit_id: ObjectId,
+    before: dict | None,
+    after: dict | None,
+    event_id: ObjectId | None = None,
+) -> None:
+    """
+    방문 기록 생성(before=None)/수정을 해당 월 집계 문서에 반영합니다.
+
+    집계 문서가 아직 없으면 갱신하지 않습니다. 이 경우 다음 조회 때 그 달의 방문 기록 전체를
+    집계해 만들며, 방문 기록은 이미 저장된 뒤이므로 이번 변경도 포함됩니다.
+    메모가 바뀌면 새 메모를 최근 메모 목록에 넣고, 같은 방문의 이전 메모는 뺍니다.
+    """
+    visit = after or before or {}
+    created_at = visit.get("created_at")
+    if not isinstance(created_at, datetime):
+        return
+
+    inc: dict[str, int] = counter_delta(before, after)
+    if before is None and after is not None:
+        inc["visit_count"] = 1
+    old_memo = (before or {}).get("memo") or ""
+    new_memo = (after or {}).get("memo") or ""
+    memo_changed = new_memo != old_memo
+    if not inc and not memo_changed:
+        return
+
+    _id = rollup_id(ObjectId(couple_id), month_of(created_at))
+    guard, push = applied_guard(event_id)
+    update: dict = {"$set": {"updated_at": datetime.utcnow()}}
+    if inc:
+        update["$inc"] = inc
+    if memo_changed and new_memo:
+        push = {**push, "notes": {"$each": [{"visit_id": visit_id, "memo": new_memo}], "$slice": -NOTES_KEPT}}
+    if push:
+        update["$push"] = push
+    await db[MONTHLY_ROLLUPS_COL].update_one({"_id": _id, **guard}, update)
+    if memo_changed and old_memo:
+        await db[MONTHLY_ROLLUPS_COL].update_one(
+            {"_id": _id}, {"$pull": {"notes": {"visit_id": visit_id, "memo": old_memo}}}
+        )
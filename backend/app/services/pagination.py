@@ -0,0 +1,107 @@
+"""
+커서(keyset) 페이지네이션
+
+목록을 정렬 키 + `_id`(동점 처리) 순서로 읽고, 마지막 항목의 두 값을 불투명한 커서 문자열로 돌려줍니다.
+다음 페이지는 skip 없이 "커서 이후" 조건으로 조회하므로 페이지가 깊어져도 비용이 같습니다.
+정렬 키와 `_id`를 포함한 복합 인덱스가 있어야 메모리 정렬 없이 동작합니다. (db/init.py)
+"""
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+from bson import ObjectId
+from fastapi import HTTPException, status
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+# 목록 응답 본문(배열)은 그대로 두고 다음 페이지 커서는 응답 헤더로 전달
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: Any, doc_id: ObjectId) -> str:
+    """정렬 키 값과 _id를 URL에 안전한 문자열로 인코딩"""
+    if isinstance(sort_value, datetime):
+        value: Any = {"d": sort_value.isoformat()}
+    else:
+        value = sort_value
+    raw = json.dumps([value, str(doc_id)], separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, ObjectId]:
+    """encode_cursor의 역변환 (형식이 잘못되면 400)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, doc_id = json.loads(raw)
+        if isinstance(value, dict):
+            value = datetime.fromisoformat(value["d"])
+        return value, ObjectId(doc_id)
+    except Exception as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 커서입니다.") from exc
+
+
+def _after_cursor(sort_field: str, direction: int, value: Any, doc_id: ObjectId) -> list[dict]:
+    """
+    (sort_field, _id) 순서에서 커서 다음에 오는 문서 조건
+
+    MongoDB 정렬에서 null/필드 없음은 다른 모든 값보다 앞(오름차순) 또는 뒤(내림차순)에 오지만
+    범위 조건($gt/$lt)은 null과 값을 비교하지 않으므로, null 구간은 따로 이어 붙입니다.
+    (플랜의 date처럼 정렬 키가 비어 있을 수 있는 목록)
+    """
+    op, op_or_equal = ("$gt", "$gte") if direction > 0 else ("$lt", "$lte")
+    if value is None:
+        same_null = {sort_field: None, "_id": {op: doc_id}}
+        if direction > 0:
+            # null 구간의 나머지 + 값이 있는 문서 전체
+            return [{"$or": [same_null, {sort_field: {"$ne": None}}]}]
+        # 내림차순에서는 null 구간이 마지막
+        return [same_null]
+
+    # 정렬 키 범위 조건을 따로 두어 인덱스 범위 스캔으로 시작하고, 동점은 _id로 구분
+    after = [
+        {sort_field: {op_or_equal: value}},
+        {"$or": [{sort_field: {op: value}}, {"_id": {op: doc_id}}]},
+    ]
+    if direction > 0:
+        return after
+    # 내림차순에서는 값이 있는 문서 다음에 null 구간이 이어짐
+    return [{"$or": [{"$and": after}, {sort_field: None}]}]
+
+
+async def paginate(
+    collection: AsyncIOMotorCollection,
+    query: dict,
+    sort_field: str,
+    direction: int,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> tuple[list[dict], str | None]:
+    """
+    query에 맞는 문서를 (sort_field, _id) 순서로 한 페이지 조회합니다.
+
+    Args:
+        direction: 1(오름차순) 또는 -1(내림차순)
+        limit: 페이지 크기 (1~MAX_PAGE_SIZE로 제한)
+        cursor: 이전 페이지가 돌려준 커서 (없으면 첫 페이지)
+
+    Returns:
+        (문서 목록, 다음 페이지 커서 — 마지막 페이지면 None)
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    if cursor:
+        value, doc_id = decode_cursor(cursor)
+        query = {"$and": [query, *_after_cursor(sort_field, direction, value, doc_id)]}
+
+    # 한 건 더 읽어 다음 페이지가 있는지 확인
+    docs = await collection.find(query).sort([(sort_field, direction), ("_id", direction)]).limit(limit + 1).to_list(
+        length=limit + 1
+    )
+    if len(docs) <= limit:
+        return docs, None
+    docs = docs[:limit]
+    last = docs[-1]
+    return docs, encode_cursor(last.get(sort_field), last["_id"])
@@ -6,6 +6,8 @@ from bson import ObjectId
 from fastapi import HTTPException, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from .pagination import DEFAULT_PAGE_SIZE, paginate
+
 PLANS_COL = "plans"
 
 
@@ -52,12 +54,12 @@ async def create_plan(db: AsyncIOMotorDatabase, couple_id: str, payload: dict) -
     return _normalize_plan(plan_doc)
 
 
-async def list_plans(db: AsyncIOMotorDatabase, couple_id: str) -> list[dict]:
-    cursor = db[PLANS_COL].find({"couple_id": ObjectId(couple_id)}).sort("date", 1)
-    plans: list[dict] = []
-    async for doc in cursor:
-        plans.append(_normalize_plan(doc))
-    return plans
+async def list_plans(
+    db: AsyncIOMotorDatabase, couple_id: str, limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+) -> tuple[list[dict], str | None]:
+    """데이트 일정 한 페이지 (날짜순)와 다음 페이지 커서"""
+    docs, next_cursor = await paginate(db[PLANS_COL], {"couple_id": ObjectId(couple_id)}, "date", 1, limit, cursor)
+    return [_normalize_plan(doc) for doc in docs], next_cursor
 
 
 async def get_plan(db: AsyncIOMotorDatabase, plan_id: str, couple_id: str) -> dict:
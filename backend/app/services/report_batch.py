@@ -0,0 +1,135 @@
+"""
+지난 달 월간 리포트(AI 요약 포함) 일괄 사전 생성
+
+월초에 커플들이 지난 달 리포트를 한꺼번에 열면 LLM 호출이 몰리므로, 월이 끝난 뒤
+배치로 해당 월에 방문 기록이 있는 모든 커플의 리포트를 미리 만들어 `report_snapshots`에 저장합니다.
+
+- 동시 실행 수(concurrency)와 분당 호출 수(rate_per_minute)로 Gemini 부하를 제한
+- 이미 스냅샷이 있는 커플은 건너뛰므로 중간에 끊겨도 다시 실행하면 이어서 진행
+- 진행 상황은 `batch_runs` 컬렉션의 `report_pregen:{YYYY-MM}` 문서에 기록
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from .monthly_rollups import month_range
+from .reports import REPORT_SNAPSHOTS_COL, VISITS_COL, build_monthly_report, store_report_snapshot
+
+logger = logging.getLogger(__name__)
+
+BATCH_RUNS_COL = "batch_runs"
+
+
+def batch_run_id(month: str) -> str:
+    return f"report_pregen:{month}"
+
+
+class RateLimiter:
+    """호출 간 최소 간격을 보장하는 단순 레이트 리미터 (rate_per_minute <= 0 이면 제한 없음)"""
+
+    def __init__(self, rate_per_minute: float) -> None:
+        self.interval = 60.0 / rate_per_minute if rate_per_minute > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def _pending_couple_ids(db: AsyncIOMotorDatabase, month: str) -> tuple[int, list[ObjectId]]:
+    """해당 월 방문 기록이 있는 커플 중 스냅샷이 아직 없는 커플 목록"""
+    start, end = month_range(month)
+    couple_ids = await db[VISITS_COL].distinct("couple_id", {"created_at": {"$gte": start, "$lt": end}})
+    done = set(await db[REPORT_SNAPSHOTS_COL].distinct("couple_id", {"month": month, "report.summary": {"$nin": [None, ""]}}))
+    return len(couple_ids), [cid for cid in couple_ids if cid not in done]
+
+
+async def pregenerate_monthly_reports(
+    db: AsyncIOMotorDatabase,
+    month: str,
+    *,
+    concurrency: int = 4,
+    rate_per_minute: float = 30.0,
+    on_progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """
+    `month`의 리포트를 일괄 생성하고 실행 결과(진행 문서)를 반환합니다.
+
+    실패한 커플은 failed 목록에 남기고 계속 진행하며, 다음 실행 때 다시 시도됩니다.
+    """
+    run_id = batch_run_id(month)
+    total, pending = await _pending_couple_ids(db, month)
+    now = datetime.utcnow()
+    await db[BATCH_RUNS_COL].update_one(
+        {"_id": run_id},
+        {
+            "$set": {
+                "kind": "report_pregen",
+                "month": month,
+                "status": "running",
+                "total": total,
+                "done": total - len(pending),
+                "failed": [],
+                "started_at": now,
+                "updated_at": now,
+                "finished_at": None,
+            }
+        },
+        upsert=True,
+    )
+    logger.info("리포트 사전 생성 시작 (%s): 대상 %d, 남은 커플 %d", month, total, len(pending))
+
+    queue: asyncio.Queue[ObjectId] = asyncio.Queue()
+    for couple_id in pending:
+        queue.put_nowait(couple_id)
+    limiter = RateLimiter(rate_per_minute)
+
+    async def report_progress(update: dict[str, Any]) -> None:
+        update.setdefault("$set", {})["updated_at"] = datetime.utcnow()
+        run = await db[BATCH_RUNS_COL].find_one_and_update({"_id": run_id}, update, return_document=ReturnDocument.AFTER)
+        if on_progress and run:
+            on_progress(run)
+
+    async def worker() -> None:
+        while True:
+            try:
+                couple_id = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await limiter.wait()
+            try:
+                report = await build_monthly_report(db, str(couple_id), month, include_summary=True)
+                if not report.get("summary"):
+                    raise RuntimeError("요약이 비어 있습니다.")
+                await store_report_snapshot(db, str(couple_id), month, report)
+            except Exception as exc:
+                logger.warning("리포트 사전 생성 실패 (couple=%s, %s): %s", couple_id, month, exc)
+                error = getattr(exc, "detail", None) or str(exc)
+                await report_progress({"$push": {"failed": {"couple_id": str(couple_id), "error": error}}})
+            else:
+                await report_progress({"$inc": {"done": 1}})
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+
+    run = await db[BATCH_RUNS_COL].find_one_and_update(
+        {"_id": run_id},
+        {"$set": {"status": "completed", "finished_at": datetime.utcnow(), "updated_at": datetime.utcnow()}},
+        return_document=ReturnDocument.AFTER,
+    )
+    logger.info("리포트 사전 생성 완료 (%s): %d/%d, 실패 %d", month, run["done"], run["total"], len(run["failed"]))
+    return run
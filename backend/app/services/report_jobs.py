@@ -0,0 +1,245 @@
+"""
+월간 리포트 AI 요약 비동기 작업 큐 (Redis)
+
+HTTP 요청은 작업을 등록하고 job_id만 돌려받으며, 워커 풀이 백그라운드에서
+`get_or_build_monthly_report(include_summary=True)`를 실행합니다.
+
+- 작업 상태: `jobs:report:{job_id}` 해시 (queued → running → succeeded / failed)
+- 대기열: `jobs:report:queue` 리스트, 처리 중 목록: `jobs:report:processing`
+  (워커가 죽어도 처리 중 목록에 남은 작업은 visibility timeout 이후 대기열로 복구.
+  종료 중 취소된 작업은 바로 대기열 맨 앞으로 되돌림)
+- 재시도: 실패 시 지수 백오프로 `jobs:report:delayed` sorted set에 넣었다가 다시 대기열로 이동
+- 중복 제거: 같은 (커플, 월, 저장 여부, 이름) 작업이 대기/실행 중이면 기존 job_id를 반환
+- 상태 변경은 `jobs:report:events:{job_id}` 채널로 발행되어 구독(SSE)할 수 있습니다.
+- save=True인 작업은 완료 시 결과를 saved_reports 컬렉션에 저장합니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import Any
+
+from redis.asyncio import Redis
+
+from ..core.config import settings
+from ..db.mongo import MongoConnectionManager
+from ..db.redis import RedisConnectionManager
+from .reports import get_or_build_monthly_report, save_report
+from .worker_pool import WorkerPool
+
+logger = logging.getLogger(__name__)
+
+JOB_KEY_PREFIX = "jobs:report"
+QUEUE_KEY = f"{JOB_KEY_PREFIX}:queue"
+PROCESSING_KEY = f"{JOB_KEY_PREFIX}:processing"
+DELAYED_KEY = f"{JOB_KEY_PREFIX}:delayed"
+
+PENDING_STATUSES = {"queued", "running", "retrying"}
+TERMINAL_STATUSES = {"succeeded", "failed"}
+
+
+def job_key(job_id: str) -> str:
+    return f"{JOB_KEY_PREFIX}:{job_id}"
+
+
+def events_channel(job_id: str) -> str:
+    return f"{JOB_KEY_PREFIX}:events:{job_id}"
+
+
+def _dedup_key(couple_id: str, month: str, save: bool, name: str | None) -> str:
+    return f"{JOB_KEY_PREFIX}:dedup:{couple_id}:{month}:{int(save)}:{name or ''}"
+
+
+def _decode_job(raw: dict[str, str]) -> dict[str, Any] | None:
+    if not raw:
+        return None
+    job: dict[str, Any] = dict(raw)
+    job["attempts"] = int(job.get("attempts", 0))
+    job["save"] = job.get("save") == "1"
+    job["result"] = json.loads(job["result"]) if job.get("result") else None
+    job["name"] = job.get("name") or None
+    job["error"] = job.get("error") or None
+    job["saved_report_id"] = job.get("saved_report_id") or None
+    return job
+
+
+async def get_job(redis_client: Redis, job_id: str) -> dict[str, Any] | None:
+    return _decode_job(await redis_client.hgetall(job_key(job_id)))
+
+
+async def _update_job(redis_client: Redis, job_id: str, **fields: Any) -> None:
+    fields["updated_at"] = datetime.utcnow().isoformat()
+    mapping = {k: ("" if v is None else v) for k, v in fields.items()}
+    await redis_client.hset(job_key(job_id), mapping=mapping)
+    await redis_client.expire(job_key(job_id), settings.report_job_ttl_seconds)
+    job = await get_job(redis_client, job_id)
+    await redis_client.publish(events_channel(job_id), json.dumps(job, ensure_ascii=False, default=str))
+
+
+async def submit_report_job(
+    redis_client: Redis, couple_id: str, month: str, *, save: bool = False, name: str | None = None
+) -> dict[str, Any]:
+    """요약 작업을 등록합니다. 같은 작업이 대기/실행 중이면 새로 만들지 않고 기존 작업을 반환합니다."""
+    dedup_key = _dedup_key(couple_id, month, save, name)
+    job_id = uuid.uuid4().hex
+    claimed = await redis_client.set(dedup_key, job_id, nx=True, ex=settings.report_job_ttl_seconds)
+    if not claimed:
+        existing_id = await redis_client.get(dedup_key)
+        existing = await get_job(redis_client, existing_id) if existing_id else None
+        if existing and existing["status"] in PENDING_STATUSES:
+            return existing
+        # 완료됐거나 만료된 작업의 dedup 키가 남아 있으면 새 작업으로 교체
+        await redis_client.set(dedup_key, job_id, ex=settings.report_job_ttl_seconds)
+
+    now = datetime.utcnow().isoformat()
+    await redis_client.hset(
+        job_key(job_id),
+        mapping={
+            "job_id": job_id,
+            "status": "queued",
+            "couple_id": couple_id,
+            "month": month,
+            "save": "1" if save else "0",
+            "name": name or "",
+            "attempts": 0,
+            "dedup_key": dedup_key,
+            "created_at": now,
+            "updated_at": now,
+        },
+    )
+    await redis_client.expire(job_key(job_id), settings.report_job_ttl_seconds)
+    await redis_client.lpush(QUEUE_KEY, job_id)
+    return await get_job(redis_client, job_id) or {}
+
+
+async def _run_job(redis_client: Redis, job_id: str) -> None:
+    job = await get_job(redis_client, job_id)
+    if not job or job["status"] in TERMINAL_STATUSES:
+        return
+
+    attempts = job["attempts"] + 1
+    now = time.time()
+    await _update_job(redis_client, job_id, status="running", attempts=attempts, started_at=now, claimed_at=now)
+    db = MongoConnectionManager.get_database()
+    try:
+        report = await get_or_build_monthly_report(db, job["couple_id"], job["month"], include_summary=True)
+        saved_report_id = None
+        if job["save"]:
+            saved = await save_report(db, job["couple_id"], job["month"], report, job["name"])
+            saved_report_id = saved["id"]
+    except Exception as exc:
+        logger.warning("리포트 요약 작업 실패 (job=%s, 시도 %d): %s", job_id, attempts, exc)
+        error = getattr(exc, "detail", None) or str(exc)
+        if attempts < settings.report_job_max_attempts:
+            delay = settings.report_job_retry_backoff_seconds * (2 ** (attempts - 1))
+            await _update_job(redis_client, job_id, status="retrying", error=error)
+            await redis_client.zadd(DELAYED_KEY, {job_id: time.time() + delay})
+        else:
+            await _update_job(redis_client, job_id, status="failed", error=error)
+            await redis_client.delete(job["dedup_key"])
+        return
+
+    await _update_job(
+        redis_client,
+        job_id,
+        status="succeeded",
+        error=None,
+        result=json.dumps(report, ensure_ascii=False, default=str),
+        saved_report_id=saved_report_id,
+    )
+    await redis_client.delete(job["dedup_key"])
+
+
+async def _promote_due_jobs(redis_client: Redis) -> None:
+    """재시도 대기 시간이 지난 작업을 대기열로 되돌립니다."""
+    due = await redis_client.zrangebyscore(DELAYED_KEY, 0, time.time())
+    for job_id in due:
+        # 여러 워커가 동시에 옮기지 않도록 ZREM 성공한 워커만 대기열에 넣는다
+        if await redis_client.zrem(DELAYED_KEY, job_id):
+            await redis_client.lpush(QUEUE_KEY, job_id)
+
+
+async def _return_to_queue(redis_client: Redis, job_id: str) -> bool:
+    """처리 중 목록의 작업을 대기열 맨 앞(다음에 꺼낼 위치)으로 되돌립니다."""
+    if not await redis_client.lrem(PROCESSING_KEY, 1, job_id):
+        return False
+    await redis_client.hdel(job_key(job_id), "claimed_at")
+    await redis_client.rpush(QUEUE_KEY, job_id)
+    return True
+
+
+async def requeue_stale_jobs(redis_client: Redis) -> int:
+    """
+    처리 중 목록에 visibility timeout 이상 머문 작업(워커 비정상 종료)을 대기열로 복구합니다.
+
+    `claimed_at`이 없는 작업은 다른 워커가 방금 꺼내 아직 실행을 시작하지 않았을 수 있으므로
+    처음 본 시각을 기록해 두고, 그때부터 timeout이 지난 뒤에 복구합니다.
+    """
+    restored = 0
+    now = time.time()
+    for job_id in await redis_client.lrange(PROCESSING_KEY, 0, -1):
+        key = job_key(job_id)
+        claimed_at = await redis_client.hget(key, "claimed_at")
+        if claimed_at is None:
+            if await redis_client.exists(key):
+                await redis_client.hsetnx(key, "claimed_at", now)
+            else:
+                # 만료된 작업은 처리할 것이 없으므로 목록에서만 제거
+                await redis_client.lrem(PROCESSING_KEY, 1, job_id)
+            continue
+        if now - float(claimed_at) < settings.report_job_visibility_timeout_seconds:
+            continue
+        if await _return_to_queue(redis_client, job_id):
+            restored += 1
+    return restored
+
+
+async def _process_claimed(redis_client: Redis, job_id: str) -> None:
+    """처리 중 목록으로 옮긴 작업을 실행하고 목록에서 뺍니다."""
+    try:
+        await _run_job(redis_client, job_id)
+    except asyncio.CancelledError:
+        # 종료 중 취소: running 상태로 남지 않게 대기열로 되돌려 다른 워커가 이어서 처리
+        try:
+            if await _return_to_queue(redis_client, job_id):
+                job = await get_job(redis_client, job_id)
+                if job and job["status"] == "running":
+                    await _update_job(redis_client, job_id, status="queued")
+        except Exception as exc:
+            # 처리 중 목록에 남은 작업은 requeue_stale_jobs가 복구
+            logger.warning("취소된 리포트 작업 반환 실패 (job=%s): %s", job_id, exc)
+        raise
+    await redis_client.lrem(PROCESSING_KEY, 1, job_id)
+    await redis_client.hdel(job_key(job_id), "claimed_at")
+
+
+class ReportJobWorkerPool(WorkerPool):
+    """lifespan에서 시작/종료되는 리포트 요약 워커 풀 (0번 워커가 주기적으로 멈춘 작업을 복구)"""
+
+    async def _worker(self, index: int) -> None:
+        redis_client = RedisConnectionManager.get_client()
+        next_requeue_at = 0.0
+        while True:
+            try:
+                if index == 0 and time.monotonic() >= next_requeue_at:
+                    next_requeue_at = time.monotonic() + settings.report_job_requeue_check_seconds
+                    restored = await requeue_stale_jobs(redis_client)
+                    if restored:
+                        logger.info("처리 중이던 리포트 작업 %d건을 대기열로 복구", restored)
+                await _promote_due_jobs(redis_client)
+                job_id = await redis_client.brpoplpush(QUEUE_KEY, PROCESSING_KEY, timeout=1)
+                if not job_id:
+                    continue
+                await _process_claimed(redis_client, job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("리포트 작업 워커 오류: %s", exc)
+                await asyncio.sleep(settings.report_job_retry_backoff_seconds)
+
+
+report_job_workers = ReportJobWorkerPool(settings.report_job_workers)
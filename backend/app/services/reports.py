@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections import Counter
+import asyncio
 from datetime import datetime
 
 from bson import ObjectId
@@ -8,77 +8,62 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from .challenges import get_progress
 from .llm import generate_report_summary
+from .monthly_rollups import get_rollup
 
 VISITS_COL = "visits"
 COUPLES_COL = "couples"
 PLANS_COL = "plans"
+SAVED_REPORTS_COL = "saved_reports"
+REPORT_SNAPSHOTS_COL = "report_snapshots"
+
+TOP_TAGS = 3
 
 
 def _month_key(dt: datetime) -> str:
     return dt.strftime("%Y-%m")
 
 
+def is_closed_month(month: str) -> bool:
+    """이미 지나간 달인지 여부 (지난 달의 방문 기록은 더 이상 바뀌지 않음)"""
+    return month < _month_key(datetime.utcnow())
+
+
+async def _plan_emotion_goals(db: AsyncIOMotorDatabase, couple_id: ObjectId) -> list[str]:
+    goals = await db[PLANS_COL].distinct(
+        "emotion_goal", {"couple_id": couple_id, "emotion_goal": {"$nin": [None, "", "미정"]}}
+    )
+    return sorted(goals)
+
+
 async def build_monthly_report(db: AsyncIOMotorDatabase, couple_id: str, month: str, *, include_summary: bool = False) -> dict:
     """
     월별 리포트 생성
     
-    데이터 출처: visits 컬렉션
-    - visit_count: 해당 월의 visits 문서 개수 (created_at 기준)
-    - top_tags: visits 문서의 tags 필드에서 가장 많이 나온 상위 3개 태그
+    데이터 출처: monthly_rollups 컬렉션 (해당 월 created_at 기준 방문 집계 문서 하나)
+    - visit_count: 해당 월의 visits 문서 개수
+    - top_tags: visits 문서의 tags 필드에서 가장 많이 나온 상위 3개 태그 (동점이면 태그 이름순)
     - emotion_stats: visits 문서의 emotion 필드에서 감정별 카운트
-    - notes: visits 문서의 memo 필드 (LLM 요약 생성 시 사용)
+    - notes: visits 문서의 memo 필드 (최근 5개, LLM 요약 생성 시 사용)
+
+    월간 집계, 챌린지 진행도, 커플 선호도, 플랜 감정 목표 조회는 동시에 실행합니다.
     """
-    start = datetime.fromisoformat(f"{month}-01")
-    if start.month == 12:
-        end = start.replace(year=start.year + 1, month=1)
-    else:
-        end = start.replace(month=start.month + 1)
-
-    # visits 컬렉션에서 해당 월의 방문 기록 조회 (created_at 기준)
-    cursor = db[VISITS_COL].find(
-        {
-            "couple_id": ObjectId(couple_id),
-            "created_at": {"$gte": start, "$lt": end},
-        }
+    couple_obj_id = ObjectId(couple_id)
+    rollup, challenges, couple_doc, plan_emotion_goals = await asyncio.gather(
+        get_rollup(db, couple_obj_id, month),
+        get_progress(db, couple_id),
+        db[COUPLES_COL].find_one({"_id": couple_obj_id}, {"preferences": 1}),
+        _plan_emotion_goals(db, couple_obj_id),
     )
-    visit_count = 0
-    tag_counter: Counter[str] = Counter()  # 태그별 카운트 (visits.tags 필드)
-    emotion_counter: Counter[str] = Counter()  # 감정별 카운트 (visits.emotion 필드)
-    notes = []  # 메모 수집 (visits.memo 필드)
-    async for doc in cursor:
-        visit_count += 1
-        # visits 문서의 tags 필드에서 태그 수집
-        for tag in doc.get("tags", []):
-            tag_counter[tag] += 1
-        # visits 문서의 emotion 필드에서 감정 수집
-        emotion = doc.get("emotion")
-        if emotion:
-            emotion_counter[emotion] += 1
-        # visits 문서의 memo 필드에서 메모 수집 (LLM 요약 생성 시 사용)
-        memo = doc.get("memo")
-        if memo:
-            notes.append(memo)
-
-    # 상위 3개 태그 추출 (인기 태그)
-    top_tags = [tag for tag, _ in tag_counter.most_common(3)]
-    # 감정별 통계 딕셔너리 (감정 분포)
-    emotion_stats = dict(emotion_counter)
-    challenges = await get_progress(db, couple_id)
-
-    couple_doc = await db[COUPLES_COL].find_one({"_id": ObjectId(couple_id)}) or {}
-    preferences = couple_doc.get("preferences", {})
+    visit_count = rollup["visit_count"]
+    top_tags = [tag for tag, _ in sorted(rollup["tags"].items(), key=lambda item: (-item[1], item[0]))[:TOP_TAGS]]
+    emotion_stats = dict(rollup["emotions"])
+    notes = rollup["notes"]
+
+    preferences = (couple_doc or {}).get("preferences", {})
     preferred_tags = preferences.get("tags", [])
     preferred_emotion_goals = preferences.get("emotion_goals", [])
     preferred_budget = preferences.get("budget", "medium")
 
-    plan_cursor = db[PLANS_COL].find({"couple_id": ObjectId(couple_id)})
-    plan_emotion_goals_set: set[str] = set()
-    async for plan in plan_cursor:
-        goal = plan.get("emotion_goal")
-        if goal and goal != "미정":
-            plan_emotion_goals_set.add(goal)
-    plan_emotion_goals = sorted(plan_emotion_goals_set)
-
     summary_text = ""
     if include_summary:
         summary_text = await generate_report_summary(
@@ -92,7 +77,7 @@ async def build_monthly_report(db: AsyncIOMotorDatabase, couple_id: str, month:
                 "couple_emotion_goals": preferred_emotion_goals,
                 "couple_budget": preferred_budget,
                 "plan_emotion_goals": plan_emotion_goals,
-                "notes": "; ".join(notes[:5]),
+                "notes": "; ".join(notes),
             }
         )
 
@@ -108,3 +93,78 @@ async def build_monthly_report(db: AsyncIOMotorDatabase, couple_id: str, month:
         "plan_emotion_goals": plan_emotion_goals,
         "summary": summary_text,
     }
+
+
+async def get_report_snapshot(db: AsyncIOMotorDatabase, couple_id: str, month: str) -> dict | None:
+    """미리 생성해 둔 월간 리포트(요약 포함) 조회"""
+    doc = await db[REPORT_SNAPSHOTS_COL].find_one(
+        {"couple_id": ObjectId(couple_id), "month": month}, {"_id": 0, "report": 1}
+    )
+    return doc["report"] if doc else None
+
+
+async def store_report_snapshot(db: AsyncIOMotorDatabase, couple_id: str, month: str, report: dict) -> None:
+    now = datetime.utcnow()
+    await db[REPORT_SNAPSHOTS_COL].update_one(
+        {"couple_id": ObjectId(couple_id), "month": month},
+        {"$set": {"report": report, "updated_at": now}, "$setOnInsert": {"created_at": now}},
+        upsert=True,
+    )
+
+
+async def get_or_build_monthly_report(
+    db: AsyncIOMotorDatabase, couple_id: str, month: str, *, include_summary: bool = False
+) -> dict:
+    """
+    지난 달 리포트는 스냅샷이 있으면 그대로 반환하고, 없으면 생성합니다.
+
+    요약까지 생성한 지난 달 리포트는 스냅샷으로 저장하여 다음 조회부터 DB 읽기 한 번으로 끝납니다.
+    이번 달 리포트는 방문 기록이 계속 바뀌므로 항상 새로 계산합니다.
+    """
+    closed = is_closed_month(month)
+    if closed:
+        snapshot = await get_report_snapshot(db, couple_id, month)
+        if snapshot and (snapshot.get("summary") or not include_summary):
+            return snapshot
+
+    report = await build_monthly_report(db, couple_id, month, include_summary=include_summary)
+    if closed and include_summary and report.get("summary"):
+        await store_report_snapshot(db, couple_id, month, report)
+    return report
+
+
+def normalize_saved_report(doc: dict) -> dict:
+    doc = {**doc}
+    doc["_id"] = str(doc["_id"])
+    doc["couple_id"] = str(doc["couple_id"])
+    # id 필드를 명시적으로 추가하여 프론트엔드에서 사용할 수 있도록 함
+    doc["id"] = doc["_id"]
+    # name 필드가 없으면 기본값 설정
+    if "name" not in doc or not doc["name"]:
+        doc["name"] = f"{doc.get('month', '')} 리포트"
+    return doc
+
+
+async def save_report(db: AsyncIOMotorDatabase, couple_id: str, month: str, report: dict, name: str | None = None) -> dict:
+    """
+    리포트를 saved_reports 컬렉션에 저장합니다.
+
+    날짜별로 여러 리포트를 저장할 수 있도록 항상 새 문서를 생성합니다.
+    """
+    report = {**report}
+    # 이름이 제공되면 추가, 없으면 기본값 사용
+    if name is not None:
+        report["name"] = name
+    elif "name" not in report:
+        report["name"] = f"{month} 리포트"
+
+    now = datetime.utcnow()
+    doc = {
+        "couple_id": ObjectId(couple_id),
+        **report,
+        "created_at": now,
+        "updated_at": now,
+    }
+    result = await db[SAVED_REPORTS_COL].insert_one(doc)
+    doc["_id"] = result.inserted_id
+    return normalize_saved_report(doc)
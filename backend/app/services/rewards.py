@@ -4,10 +4,12 @@ from datetime import datetime
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from .catalog_cache import challenge_catalog
+from .leaderboard import record_total
 
 COUPLES_COL = "couples"
-VISITS_COL = "visits"
-CHALLENGE_PLACES_COL = "challenge_places"
 
 
 async def grant_rewards(
@@ -15,88 +17,50 @@ async def grant_rewards(
 ) -> dict[str, int | list[str]]:
     """
     챌린지 완료 시 포인트와 배지를 지급합니다.
-    
+
+    호출부(add_visit)가 위치 인증·별점·리뷰 완료를 확인한 뒤 호출합니다.
+    장소 보상 정보는 카탈로그 캐시에서 읽고, 지급은 "배지가 아직 없는 커플"을 조건으로 한
+    find_one_and_update 한 번으로 처리하므로 동시에 리뷰를 제출해도 중복 지급되지 않습니다.
+
     Args:
         db: MongoDB 데이터베이스
         couple_id: 커플 ID
         challenge_place_id: 챌린지 장소 ID
-    
+
     Returns:
-        지급된 포인트와 배지 정보
+        지급 후(또는 이미 지급된 경우 현재) 포인트와 배지 정보
     """
-    # 챌린지 장소 정보 조회
-    try:
-        place_obj_id = ObjectId(challenge_place_id)
-    except Exception:
+    place = await challenge_catalog.place(db, challenge_place_id)
+    if not place:
         return {"points": 0, "badges": []}
-    
-    place_doc = await db[CHALLENGE_PLACES_COL].find_one({"_id": place_obj_id})
-    if not place_doc:
-        return {"points": 0, "badges": []}
-    
-    points_reward = place_doc.get("points_reward", 500)
-    badge_reward = place_doc.get("badge_reward", "")
-    
-    # 위치 인증, 별점, 리뷰가 모두 완료된 방문 기록 확인
+
     try:
         couple_obj_id = ObjectId(couple_id)
     except Exception:
         return {"points": 0, "badges": []}
-    
-    # 보상 지급 전 최종 검증: 위치 인증, 별점, 리뷰가 모두 완료되었는지 확인
-    completed_visit = await db[VISITS_COL].find_one({
-        "couple_id": couple_obj_id,
-        "challenge_place_id": place_obj_id,
-        "location_verified": True,
-        "review_completed": True,
-        "rating": {"$ne": None},
-        "memo": {"$ne": ""}
-    })
-    
-    # 커플 정보 조회
-    couple_doc = await db[COUPLES_COL].find_one({"_id": couple_obj_id})
-    if not couple_doc:
-        return {"points": 0, "badges": []}
-    
-    if not completed_visit:
-        # 조건을 만족하지 않으면 지급하지 않음
-        current_points = couple_doc.get("points", 0)
-        current_badges = couple_doc.get("badges", [])
-        return {"points": current_points, "badges": current_badges}
-    
-    # 이미 보상을 받았는지 확인: 커플의 배지 목록에 해당 배지가 있는지 확인
-    current_badges = couple_doc.get("badges", [])
-    
-    # 배지가 이미 있으면 이미 보상을 받은 것으로 간주
-    if badge_reward and badge_reward in current_badges:
-        current_points = couple_doc.get("points", 0)
-        return {"points": current_points, "badges": current_badges}
-    
-    # 포인트 및 배지 지급
-    current_points = couple_doc.get("points", 0)
-    
-    new_points = current_points + points_reward
-    new_badges = current_badges.copy()
-    
-    # 배지가 이미 있는지 확인하고 없으면 추가
-    if badge_reward and badge_reward not in new_badges:
-        new_badges.append(badge_reward)
-    
-    # 커플 정보 업데이트
-    await db[COUPLES_COL].update_one(
-        {"_id": couple_obj_id},
-        {
-            "$set": {
-                "points": new_points,
-                "badges": new_badges,
-                "updated_at": datetime.utcnow()
-            }
-        }
-    )
-    
-    return {"points": new_points, "badges": new_badges}
-
 
+    points_reward = place.get("points_reward", 500)
+    badge_reward = place.get("badge_reward", "")
 
+    # 배지가 이미 있으면 이미 보상을 받은 것으로 간주 (배지가 없는 장소는 조건 없이 포인트만 지급)
+    query: dict = {"_id": couple_obj_id}
+    update: dict = {"$inc": {"points": points_reward}, "$set": {"updated_at": datetime.utcnow()}}
+    if badge_reward:
+        query["badges"] = {"$ne": badge_reward}
+        update["$addToSet"] = {"badges": badge_reward}
 
+    couple_doc = await db[COUPLES_COL].find_one_and_update(
+        query,
+        update,
+        projection={"points": 1, "badges": 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    if couple_doc:
+        await record_total(couple_id, couple_doc["points"])
+        return {"points": couple_doc["points"], "badges": couple_doc.get("badges", [])}
 
+    # 이미 지급되었거나 커플이 없는 경우: 현재 상태 반환
+    couple_doc = await db[COUPLES_COL].find_one({"_id": couple_obj_id}, {"points": 1, "badges": 1})
+    if not couple_doc:
+        return {"points": 0, "badges": []}
+    return {"points": couple_doc.get("points", 0), "badges": couple_doc.get("badges", [])}
@@ -0,0 +1,138 @@
+"""
+방문 이벤트 소비자
+
+lifespan에서 시작되는 워커가 방문 문서의 outbox(visit_events)를 비우며 파생 데이터를 갱신합니다.
+
+- challenge_counters: 커플별 태그/감정 누적 카운터
+- challenge_rules: 규칙별 진행 문서
+- monthly_rollups: 커플별 월간 방문 집계
+- leaderboard: 지역/월별 리더보드 (리뷰가 완료된 챌린지 방문)
+- report_snapshots: 지난 달 방문이 바뀌면 저장된 월간 리포트 스냅샷 삭제
+
+이벤트는 최소 한 번 전달되므로 핸들러는 모두 event_id 기준으로 멱등하게 동작합니다.
+한 이벤트의 핸들러가 실패하면 그 문서의 임대가 끝난 뒤 이벤트 전체를 다시 처리합니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ..core.config import settings
+from ..db.mongo import MongoConnectionManager
+from . import challenge_counters, challenge_rules, monthly_rollups
+from .catalog_cache import challenge_catalog
+from .leaderboard import record_visit_points
+from .reports import REPORT_SNAPSHOTS_COL, is_closed_month
+from .visit_events import ack, claim_pending, release
+from .worker_pool import WorkerPool
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[AsyncIOMotorDatabase, dict], Awaitable[None]]
+
+
+async def _update_counters(db: AsyncIOMotorDatabase, event: dict) -> None:
+    await challenge_counters.record_visit_change(
+        db, event["couple_id"], event["before"], event["after"], event_id=event["event_id"]
+    )
+
+
+async def _update_rule_progress(db: AsyncIOMotorDatabase, event: dict) -> None:
+    await challenge_rules.record_visit_change(
+        db, event["couple_id"], event["before"], event["after"], event_id=event["event_id"]
+    )
+
+
+async def _update_monthly_rollup(db: AsyncIOMotorDatabase, event: dict) -> None:
+    await monthly_rollups.record_visit_change(
+        db, event["couple_id"], event["visit_id"], event["before"], event["after"], event_id=event["event_id"]
+    )
+
+
+async def _update_leaderboard(db: AsyncIOMotorDatabase, event: dict) -> None:
+    before, after = event["before"] or {}, event["after"] or {}
+    place_id = after.get("challenge_place_id")
+    if not place_id or not after.get("review_completed") or before.get("review_completed"):
+        return
+    place = await challenge_catalog.place(db, str(place_id))
+    if not place:
+        return
+    await record_visit_points(
+        str(event["couple_id"]),
+        place.get("points_reward", 500),
+        place.get("address"),
+        # 월은 방문 기록 생성 시각이 아니라 리뷰가 완료되어 보상이 지급된 시각(이벤트 시각) 기준
+        event.get("created_at"),
+        event_id=event["event_id"],
+    )
+
+
+async def _invalidate_report_snapshots(db: AsyncIOMotorDatabase, event: dict) -> None:
+    months = {
+        snapshot["created_at"].strftime("%Y-%m")
+        for snapshot in (event["before"], event["after"])
+        if snapshot and isinstance(snapshot.get("created_at"), datetime)
+    }
+    closed = [month for month in months if is_closed_month(month)]
+    if closed:
+        await db[REPORT_SNAPSHOTS_COL].delete_many({"couple_id": event["couple_id"], "month": {"$in": closed}})
+
+
+HANDLERS: list[tuple[str, EventHandler]] = [
+    ("challenge_counters", _update_counters),
+    ("challenge_rules", _update_rule_progress),
+    ("monthly_rollups", _update_monthly_rollup),
+    ("leaderboard", _update_leaderboard),
+    ("report_snapshots", _invalidate_report_snapshots),
+]
+
+
+async def dispatch(db: AsyncIOMotorDatabase, event: dict) -> None:
+    """이벤트 하나를 모든 핸들러에 전달 (실패한 핸들러의 예외는 그대로 전달)"""
+    for _name, handler in HANDLERS:
+        await handler(db, event)
+
+
+async def process_next(db: AsyncIOMotorDatabase, lease_seconds: float) -> bool:
+    """
+    대기 중인 이벤트가 있는 방문 문서 하나를 처리합니다.
+
+    Returns:
+        처리할 문서를 가져왔는지 여부 (없으면 False)
+    """
+    doc = await claim_pending(db, lease_seconds)
+    if doc is None:
+        return False
+    for event in doc.get("outbox") or []:
+        try:
+            await dispatch(db, event)
+        except Exception as exc:
+            # 임대가 끝날 때까지 이 문서는 다시 가져가지 않으므로 임대 시간이 재시도 간격이 됨
+            logger.warning("방문 이벤트 처리 실패 (event=%s): %s", event.get("event_id"), exc)
+            return True
+        await ack(db, doc["_id"], event["event_id"])
+    await release(db, doc["_id"])
+    return True
+
+
+class VisitEventWorkerPool(WorkerPool):
+    """lifespan에서 시작/종료되는 방문 이벤트 워커 풀"""
+
+    async def _worker(self, index: int) -> None:
+        db = MongoConnectionManager.get_database()
+        while True:
+            try:
+                if not await process_next(db, settings.visit_event_lease_seconds):
+                    await asyncio.sleep(settings.visit_event_poll_seconds)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("방문 이벤트 워커 오류: %s", exc)
+                await asyncio.sleep(settings.visit_event_poll_seconds)
+
+
+visit_event_workers = VisitEventWorkerPool(settings.visit_event_workers)
@@ -0,0 +1,156 @@
+"""
+방문 기록 도메인 이벤트 (outbox)
+
+방문 기록을 쓰는 모든 경로는 같은 쓰기 안에서 변경 이벤트를 문서의 `outbox` 배열에 넣습니다.
+MongoDB가 단일 노드(트랜잭션 없음)로 운영되므로 별도 컬렉션 대신 방문 문서 자체를 outbox로 사용하며,
+단일 문서 쓰기는 원자적이므로 "방문 기록은 바뀌었는데 이벤트는 없는" 상태가 생기지 않습니다.
+
+    visits 문서: {..., outbox: [<이벤트>, ...], outbox_pending: true, outbox_lease_until: <datetime>}
+    이벤트: {event_id, type, couple_id, visit_id, before: {<EVENT_FIELDS>}, after: {<EVENT_FIELDS>}, created_at}
+
+- 생성: 새 문서에 이벤트를 담아 삽입 (`with_created_event`)
+- 수정: 집계 파이프라인 업데이트로 변경 전 값(`$tags` 등)을 읽어 이벤트를 만든 뒤 같은 단계에서 필드를 갱신
+  (`updated_event_pipeline`). 위치 인증 여부만 바꾸는 쓰기는 파생 데이터에 영향이 없어 이벤트를 만들지 않습니다.
+- 소비: 워커가 `claim_pending`으로 문서를 임대(lease)하고, 처리한 이벤트를 `ack`로 제거합니다.
+  처리 도중 워커가 죽으면 임대가 만료된 뒤 다시 전달되므로(at-least-once) 핸들러는 event_id로 중복을 걸러야 합니다.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+VISITS_COL = "visits"
+
+VISIT_CREATED = "visit.created"
+VISIT_UPDATED = "visit.updated"
+
+# 파생 데이터(카운터, 규칙 진행도, 리더보드, 월별 집계) 계산에 필요한 필드만 이벤트에 담음
+EVENT_FIELDS = ("tags", "emotion", "memo", "review_completed", "challenge_place_id", "created_at")
+
+# 카운터/진행 문서에 남기는 처리한 event_id 수 (재전달 중복 확인용)
+APPLIED_EVENTS_KEPT = 200
+PENDING_EVENTS_FACET = "pending_events"
+
+
+def _snapshot(doc: dict | None) -> dict | None:
+    if doc is None:
+        return None
+    return {name: doc.get(name) for name in EVENT_FIELDS}
+
+
+def with_created_event(doc: dict, now: datetime) -> dict:
+    """새 방문 문서에 생성 이벤트를 담아 반환 (_id가 없으면 새로 부여)"""
+    doc.setdefault("_id", ObjectId())
+    event = {
+        "event_id": ObjectId(),
+        "type": VISIT_CREATED,
+        "couple_id": doc["couple_id"],
+        "visit_id": doc["_id"],
+        "before": None,
+        "after": _snapshot(doc),
+        "created_at": now,
+    }
+    doc["outbox"] = [event]
+    doc["outbox_pending"] = True
+    return doc
+
+
+def updated_event_pipeline(set_fields: dict, now: datetime) -> list[dict]:
+    """
+    set_fields를 적용하면서 변경 이벤트를 outbox에 추가하는 업데이트 파이프라인
+
+    첫 단계는 현재 문서 값으로 before를 만들고, after는 바뀌는 필드만 새 값으로 바꿉니다.
+    값은 `$literal`로 감싸 "$"로 시작하는 사용자 입력이 필드 경로로 해석되지 않게 합니다.
+    """
+    after = {
+        name: {"$literal": set_fields[name]} if name in set_fields else f"${name}" for name in EVENT_FIELDS
+    }
+    event = {
+        "event_id": {"$literal": ObjectId()},
+        "type": VISIT_UPDATED,
+        "couple_id": "$couple_id",
+        "visit_id": "$_id",
+        "before": {name: f"${name}" for name in EVENT_FIELDS},
+        "after": after,
+        "created_at": {"$literal": now},
+    }
+    return [
+        {
+            "$set": {
+                "outbox": {"$concatArrays": [{"$ifNull": ["$outbox", []]}, [event]]},
+                "outbox_pending": True,
+            }
+        },
+        {"$set": {name: {"$literal": value} for name, value in set_fields.items()}},
+    ]
+
+
+async def claim_pending(db: AsyncIOMotorDatabase, lease_seconds: float) -> dict | None:
+    """처리할 이벤트가 있는 방문 문서 하나를 임대합니다. (다른 워커는 임대가 끝날 때까지 가져가지 않음)"""
+    now = datetime.utcnow()
+    return await db[VISITS_COL].find_one_and_update(
+        {
+            "outbox_pending": True,
+            "$or": [{"outbox_lease_until": None}, {"outbox_lease_until": {"$lte": now}}],
+        },
+        {"$set": {"outbox_lease_until": now + timedelta(seconds=lease_seconds)}},
+        projection={"outbox": 1},
+        return_document=ReturnDocument.AFTER,
+    )
+
+
+async def ack(db: AsyncIOMotorDatabase, visit_id: ObjectId, event_id: ObjectId) -> None:
+    """처리를 마친 이벤트를 outbox에서 제거"""
+    await db[VISITS_COL].update_one({"_id": visit_id}, {"$pull": {"outbox": {"event_id": event_id}}})
+
+
+async def release(db: AsyncIOMotorDatabase, visit_id: ObjectId) -> None:
+    """임대를 풀고, 남은 이벤트가 없으면 outbox 필드를 정리합니다."""
+    result = await db[VISITS_COL].update_one(
+        {"_id": visit_id, "outbox": {"$size": 0}},
+        {"$unset": {"outbox": "", "outbox_pending": "", "outbox_lease_until": ""}},
+    )
+    if result.matched_count == 0:
+        # 처리하는 동안 새 이벤트가 추가됨: 바로 다시 가져갈 수 있게 임대만 해제
+        await db[VISITS_COL].update_one({"_id": visit_id}, {"$unset": {"outbox_lease_until": ""}})
+
+
+def pending_events_facet() -> dict[str, list[dict]]:
+    """
+    파생 데이터 재생성 집계의 `$facet`에 더하는 항목: 집계한 방문 문서들의 아직 처리되지 않은 이벤트 ID
+
+    집계와 같은 읽기에서 모으므로 재생성 결과에 들어간 변경의 이벤트만 처리한 것으로 기록됩니다.
+    (ID를 따로 먼저 읽으면 그 사이 저장된 방문은 집계에 들어가고 처리 기록에서는 빠져, 워커가 한 번 더 반영함)
+    """
+    return {
+        PENDING_EVENTS_FACET: [
+            {"$match": {"outbox_pending": True}},
+            {"$unwind": "$outbox"},
+            {"$group": {"_id": None, "event_ids": {"$push": "$outbox.event_id"}}},
+        ]
+    }
+
+
+def facet_event_ids(result: dict) -> list[ObjectId]:
+    """`pending_events_facet` 결과에서 처리한 것으로 기록할 이벤트 ID 목록을 꺼냄"""
+    groups = result.get(PENDING_EVENTS_FACET) or [{}]
+    return groups[0].get("event_ids", [])[-APPLIED_EVENTS_KEPT:]
+
+
+def applied_guard(event_id: ObjectId | None) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    event_id를 한 번만 반영하기 위한 (조건, $push) 쌍
+
+    파생 문서의 `applied_events`에 이미 있는 이벤트면 갱신 조건에 맞지 않아 다시 반영되지 않습니다.
+    event_id가 없으면(직접 호출) 빈 조건을 반환합니다.
+    """
+    if event_id is None:
+        return {}, {}
+    return (
+        {"applied_events": {"$ne": event_id}},
+        {"applied_events": {"$each": [event_id], "$slice": -APPLIED_EVENTS_KEPT}},
+    )
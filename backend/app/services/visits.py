@@ -5,12 +5,20 @@ from datetime import datetime
 from bson import ObjectId
 from fastapi import HTTPException, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from .pagination import DEFAULT_PAGE_SIZE, paginate
+from .visit_events import updated_event_pipeline, with_created_event
 
 VISITS_COL = "visits"
 
+NOT_VERIFIED_DETAIL = "챌린지 장소는 위치 인증이 필요합니다. 먼저 위치 인증을 완료해주세요."
+ALREADY_REVIEWED_DETAIL = "이미 리뷰가 작성된 챌린지입니다."
+
 
 def _normalize(doc: dict) -> dict:
-    doc = {**doc}
+    doc = {key: value for key, value in doc.items() if not key.startswith("outbox")}
     doc["id"] = str(doc.pop("_id"))
     doc["couple_id"] = str(doc["couple_id"])
     doc["user_id"] = str(doc["user_id"])
@@ -23,8 +31,8 @@ def _normalize(doc: dict) -> dict:
     return doc
 
 
-async def add_visit(db: AsyncIOMotorDatabase, couple_id: str, user_id: str, payload: dict) -> dict:
-    now = datetime.utcnow()
+def _parse_ids(payload: dict) -> tuple[ObjectId | None, ObjectId | None]:
+    """payload의 plan_id, challenge_place_id를 ObjectId로 변환 (형식이 잘못되면 400)"""
     try:
         plan_id = ObjectId(payload["plan_id"]) if payload.get("plan_id") else None
     except Exception as exc:
@@ -36,123 +44,275 @@ async def add_visit(db: AsyncIOMotorDatabase, couple_id: str, user_id: str, payl
             challenge_place_id = ObjectId(payload["challenge_place_id"])
         except Exception as exc:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 챌린지 장소 ID") from exc
-    
+    return plan_id, challenge_place_id
+
+
+def _review_update(payload: dict, now: datetime) -> dict:
+    """
+    챌린지 방문 기록에 기록할 리뷰 필드 (위치 인증, 별점, 리뷰 텍스트가 모두 있어야 완료)
+
+    완료되면 reviewed_at(보상 지급 시각)을 함께 기록합니다. (월별 리더보드 재구성 기준)
+    """
     rating = payload.get("rating")
     memo = payload.get("memo", "")
+    update = {
+        "rating": rating,
+        "memo": memo,
+        "emotion": payload.get("emotion"),
+        "tags": payload.get("tags", []),
+        "review_completed": bool(rating is not None and memo.strip()),
+    }
+    if update["review_completed"]:
+        update["reviewed_at"] = now
+    return update
+
+
+def _new_visit_doc(couple_id: str, user_id: str, plan_id: ObjectId | None, payload: dict, now: datetime) -> dict:
+    """일반 장소 방문 기록 문서"""
+    return {
+        "couple_id": ObjectId(couple_id),
+        "user_id": ObjectId(user_id),
+        "plan_id": plan_id,
+        "place_id": payload.get("place_id"),
+        "place_name": payload.get("place_name"),
+        "visited_at": payload.get("visited_at", now.isoformat()),
+        "emotion": payload.get("emotion"),
+        "tags": payload.get("tags", []),
+        "memo": payload.get("memo", ""),
+        "rating": payload.get("rating"),
+        "challenge_place_id": None,
+        "location_verified": False,
+        "review_completed": False,
+        "created_at": now,
+    }
+
+
+async def add_visit(db: AsyncIOMotorDatabase, couple_id: str, user_id: str, payload: dict) -> dict:
+    """
+    방문 기록 생성 또는 챌린지 장소 리뷰 기록
+
+    태그/감정 카운터, 챌린지 진행도 등 파생 데이터는 같은 쓰기에 담긴 방문 이벤트를
+    백그라운드 워커가 반영합니다. (visit_events, visit_event_workers)
+    """
+    now = datetime.utcnow()
+    plan_id, challenge_place_id = _parse_ids(payload)
     
-    # 챌린지 장소인 경우 실제로 위치 인증이 완료되었는지 DB에서 확인
-    location_verified = False
     if challenge_place_id:
+        # 챌린지 장소: 위치 인증되었고 아직 리뷰가 완료되지 않은 방문 기록에만 리뷰를 기록 (조건 확인과 갱신을 한 번에)
         couple_obj_id = ObjectId(couple_id)
-        # DB에서 실제 위치 인증 완료 여부 확인
-        existing_verified_visit = await db[VISITS_COL].find_one({
-            "couple_id": couple_obj_id,
-            "challenge_place_id": challenge_place_id,
-            "location_verified": True
-        })
+        update_data = _review_update(payload, now)
+        existing_visit = await db[VISITS_COL].find_one_and_update(
+            {
+                "couple_id": couple_obj_id,
+                "challenge_place_id": challenge_place_id,
+                "location_verified": True,
+                "review_completed": {"$ne": True},
+            },
+            updated_event_pipeline(update_data, now),
+            return_document=ReturnDocument.BEFORE,
+        )
         
-        if not existing_verified_visit:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="챌린지 장소는 위치 인증이 필요합니다. 먼저 위치 인증을 완료해주세요."
+        if not existing_visit:
+            # 조건에 맞는 기록이 없을 때만 원인을 확인해 안내
+            verified_visit = await db[VISITS_COL].find_one(
+                {"couple_id": couple_obj_id, "challenge_place_id": challenge_place_id, "location_verified": True},
+                {"_id": 1},
             )
-        
-        location_verified = True
-        
-        # 기존 위치 인증 기록이 있으면 업데이트, 없으면 새로 생성
-        if existing_verified_visit.get("review_completed", False):
-            # 이미 리뷰가 완료된 경우 중복 방지
+            if verified_visit:
+                # 이미 리뷰가 완료된 경우 중복 방지
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=ALREADY_REVIEWED_DETAIL
+                )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 리뷰가 작성된 챌린지입니다."
+                detail=NOT_VERIFIED_DETAIL
             )
-    
-    # 리뷰와 별점이 모두 작성되었는지 확인
-    # 위치 인증, 별점, 리뷰 텍스트가 모두 있어야 완료
-    review_completed = bool(location_verified and rating is not None and memo.strip())
-    
-    if challenge_place_id:
-        # 챌린지 장소인 경우 기존 방문 기록 업데이트
-        couple_obj_id = ObjectId(couple_id)
-        existing_visit = await db[VISITS_COL].find_one({
-            "couple_id": couple_obj_id,
-            "challenge_place_id": challenge_place_id,
-            "location_verified": True
-        })
         
-        if existing_visit:
-            # 기존 방문 기록 업데이트
-            update_data = {
-                "rating": rating,
-                "memo": memo,
-                "emotion": payload.get("emotion"),
-                "tags": payload.get("tags", []),
-                "review_completed": review_completed,
-            }
-            
-            result = await db[VISITS_COL].update_one(
-                {"_id": existing_visit["_id"]},
-                {"$set": update_data}
-            )
-            
-            if result.modified_count > 0:
-                # 업데이트된 문서 조회
-                updated_doc = await db[VISITS_COL].find_one({"_id": existing_visit["_id"]})
-                doc = updated_doc
-            else:
-                doc = existing_visit
-        else:
-            # 기존 기록이 없으면 새로 생성 (이론적으로는 발생하지 않아야 함)
-            doc = {
-                "couple_id": couple_obj_id,
-                "user_id": ObjectId(user_id),
-                "plan_id": plan_id,
-                "place_id": payload.get("place_id"),
-                "place_name": payload.get("place_name"),
-                "visited_at": payload.get("visited_at", now.isoformat()),
-                "emotion": payload.get("emotion"),
-                "tags": payload.get("tags", []),
-                "memo": memo,
-                "rating": rating,
-                "challenge_place_id": challenge_place_id,
-                "location_verified": location_verified,
-                "review_completed": review_completed,
-                "created_at": now,
-            }
-            result = await db[VISITS_COL].insert_one(doc)
-            doc["_id"] = result.inserted_id
+        # 응답용 문서는 변경 전 문서에 갱신 내용을 합쳐 만든다
+        doc = {**existing_visit, **update_data}
+        
+        # 리뷰 완료 시 보상 지급 (위치 인증, 별점, 리뷰 모두 완료된 경우)
+        if doc["review_completed"]:
+            from .rewards import grant_rewards
+            await grant_rewards(db, couple_id, str(challenge_place_id))
     else:
         # 일반 장소인 경우 새로 생성
-        doc = {
-            "couple_id": ObjectId(couple_id),
-            "user_id": ObjectId(user_id),
-            "plan_id": plan_id,
-            "place_id": payload.get("place_id"),
-            "place_name": payload.get("place_name"),
-            "visited_at": payload.get("visited_at", now.isoformat()),
-            "emotion": payload.get("emotion"),
-            "tags": payload.get("tags", []),
-            "memo": memo,
-            "rating": rating,
-            "challenge_place_id": challenge_place_id,
-            "location_verified": location_verified,
-            "review_completed": review_completed,
-            "created_at": now,
-        }
-        result = await db[VISITS_COL].insert_one(doc)
-        doc["_id"] = result.inserted_id
-    
-    # 리뷰 완료 시 보상 지급 (위치 인증, 별점, 리뷰 모두 완료된 경우)
-    if review_completed and challenge_place_id:
-        from .rewards import grant_rewards
-        await grant_rewards(db, couple_id, str(challenge_place_id))
+        doc = with_created_event(_new_visit_doc(couple_id, user_id, plan_id, payload, now), now)
+        await db[VISITS_COL].insert_one(doc)
     
     return _normalize(doc)
 
 
-async def list_visits(db: AsyncIOMotorDatabase, couple_id: str, limit: int = 50) -> list[dict]:
-    cursor = db[VISITS_COL].find({"couple_id": ObjectId(couple_id)}).sort("visited_at", -1).limit(limit)
-    items: list[dict] = []
+def _bulk_result(client_key: str, outcome: str, detail: str | None = None, visit: dict | None = None) -> dict:
+    return {
+        "client_key": client_key,
+        "status": outcome,
+        "detail": detail,
+        "visit": _normalize(visit) if visit else None,
+    }
+
+
+async def add_visits_bulk(db: AsyncIOMotorDatabase, couple_id: str, user_id: str, items: list[dict]) -> list[dict]:
+    """
+    여러 방문 기록을 한 번에 등록합니다. (오프라인에서 쌓인 체크인 동기화용)
+
+    - 항목마다 client_key가 있어야 하며, 이미 처리된 키는 다시 쓰지 않고 기존 기록을 돌려줍니다. (재전송 안전)
+    - 검증은 조회 두 번(이미 처리된 키, 위치 인증된 챌린지 방문 기록)으로 모아서 하고,
+      저장은 `bulk_write` 한 번으로 합니다.
+    - 보상은 리뷰가 완료된 챌린지 장소마다 한 번만 평가합니다.
+
+    Returns:
+        요청 순서대로 [{client_key, status, detail, visit}]
+        status: created(일반 방문 생성) / reviewed(챌린지 리뷰 기록) / duplicate(이미 처리된 키) / rejected(검증 실패)
+    """
+    now = datetime.utcnow()
+    couple_obj_id = ObjectId(couple_id)
+    results: dict[int, dict] = {}
+
+    processed: dict[str, dict] = {}
+    cursor = db[VISITS_COL].find(
+        # $exists를 함께 주어야 client_key 부분 인덱스를 사용
+        {"couple_id": couple_obj_id, "client_key": {"$in": [item["client_key"] for item in items], "$exists": True}}
+    )
     async for doc in cursor:
-        items.append(_normalize(doc))
-    return items
+        processed[doc["client_key"]] = doc
+
+    # 1단계: 키 중복, ID 형식 검증
+    accepted: list[tuple[int, ObjectId | None, ObjectId | None]] = []
+    seen_keys: set[str] = set()
+    for index, item in enumerate(items):
+        key = item["client_key"]
+        if key in processed:
+            results[index] = _bulk_result(key, "duplicate", visit=processed[key])
+            continue
+        if key in seen_keys:
+            results[index] = _bulk_result(key, "duplicate", detail="같은 요청에 중복된 client_key입니다.")
+            continue
+        seen_keys.add(key)
+        try:
+            plan_id, challenge_place_id = _parse_ids(item)
+        except HTTPException as exc:
+            results[index] = _bulk_result(key, "rejected", detail=exc.detail)
+            continue
+        accepted.append((index, plan_id, challenge_place_id))
+
+    # 2단계: 챌린지 리뷰 대상 방문 기록을 한 번에 조회
+    challenge_ids = {place_id for _, _, place_id in accepted if place_id}
+    verified: dict[ObjectId, dict] = {}
+    if challenge_ids:
+        cursor = db[VISITS_COL].find(
+            {"couple_id": couple_obj_id, "challenge_place_id": {"$in": list(challenge_ids)}, "location_verified": True}
+        )
+        async for doc in cursor:
+            current = verified.get(doc["challenge_place_id"])
+            if current is None or current.get("review_completed"):
+                verified[doc["challenge_place_id"]] = doc
+
+    operations: list[InsertOne | UpdateOne] = []
+    planned: list[tuple[int, dict | None, dict]] = []  # (항목 위치, 변경 전 문서, 변경 후 문서)
+    reviewed_places: set[ObjectId] = set()
+    for index, plan_id, challenge_place_id in accepted:
+        item = items[index]
+        key = item["client_key"]
+        if challenge_place_id is None:
+            doc = with_created_event({**_new_visit_doc(couple_id, user_id, plan_id, item, now), "client_key": key}, now)
+            operations.append(InsertOne(doc))
+            planned.append((index, None, doc))
+            continue
+        existing = verified.get(challenge_place_id)
+        if existing is None:
+            results[index] = _bulk_result(key, "rejected", detail=NOT_VERIFIED_DETAIL)
+            continue
+        if existing.get("review_completed") or challenge_place_id in reviewed_places:
+            results[index] = _bulk_result(key, "rejected", detail=ALREADY_REVIEWED_DETAIL)
+            continue
+        reviewed_places.add(challenge_place_id)
+        update_data = {**_review_update(item, now), "client_key": key}
+        operations.append(
+            UpdateOne({"_id": existing["_id"], "review_completed": {"$ne": True}}, updated_event_pipeline(update_data, now))
+        )
+        planned.append((index, existing, {**existing, **update_data}))
+
+    # 3단계: 한 번에 저장
+    failed: dict[int, dict] = {}
+    if operations:
+        try:
+            result = await db[VISITS_COL].bulk_write(operations, ordered=False)
+            matched_count = result.matched_count
+        except BulkWriteError as exc:
+            failed = {error["index"]: error for error in exc.details.get("writeErrors", [])}
+            matched_count = exc.details.get("nMatched", 0)
+        updates = [op_index for op_index, (_, before, _) in enumerate(planned) if before is not None and op_index not in failed]
+        if matched_count < len(updates):
+            # 조회 이후 다른 요청이 먼저 리뷰를 기록한 경우: 이번 client_key가 실제로 기록된 문서만 성공으로 처리
+            applied_keys = {
+                doc["client_key"]
+                async for doc in db[VISITS_COL].find(
+                    {"_id": {"$in": [planned[i][1]["_id"] for i in updates]}}, {"client_key": 1}
+                )
+            }
+            for op_index in updates:
+                if planned[op_index][2]["client_key"] not in applied_keys:
+                    failed[op_index] = {"code": None}
+
+    changes: list[tuple[dict | None, dict]] = []  # 저장에 성공한 (변경 전 문서, 변경 후 문서)
+    for op_index, (index, before, after) in enumerate(planned):
+        key = items[index]["client_key"]
+        error = failed.get(op_index)
+        if error is None:
+            results[index] = _bulk_result(key, "created" if before is None else "reviewed", visit=after)
+            changes.append((before, after))
+        elif error.get("code") == 11000:
+            # 같은 client_key를 다른 요청이 먼저 저장함
+            results[index] = _bulk_result(key, "duplicate")
+        elif before is not None:
+            results[index] = _bulk_result(key, "rejected", detail=ALREADY_REVIEWED_DETAIL)
+        else:
+            results[index] = _bulk_result(key, "rejected", detail=error.get("errmsg", "저장에 실패했습니다."))
+
+    # 리뷰가 완료된 챌린지 장소마다 보상을 한 번씩 평가
+    completed_places = {after["challenge_place_id"] for before, after in changes if after.get("review_completed")}
+    if completed_places:
+        from .rewards import grant_rewards
+        for place_id in completed_places:
+            await grant_rewards(db, couple_id, str(place_id))
+
+    return [results[index] for index in range(len(items))]
+
+
+async def get_challenge_visit_flags(db: AsyncIOMotorDatabase, couple_id: str) -> dict[str, dict[str, bool]]:
+    """
+    커플의 챌린지 장소별 위치 인증/리뷰 완료 여부를 한 번의 집계로 조회합니다.
+
+    Returns:
+        {challenge_place_id: {"location_verified": bool, "review_completed": bool}}
+        (방문 기록이 없는 장소는 포함되지 않음)
+    """
+    pipeline = [
+        {"$match": {"couple_id": ObjectId(couple_id), "challenge_place_id": {"$ne": None}}},
+        {
+            "$group": {
+                "_id": "$challenge_place_id",
+                "location_verified": {"$max": {"$eq": ["$location_verified", True]}},
+                "review_completed": {"$max": {"$eq": ["$review_completed", True]}},
+            }
+        },
+    ]
+    flags: dict[str, dict[str, bool]] = {}
+    async for doc in db[VISITS_COL].aggregate(pipeline):
+        flags[str(doc["_id"])] = {
+            "location_verified": doc["location_verified"],
+            "review_completed": doc["review_completed"],
+        }
+    return flags
+
+
+async def list_visits(
+    db: AsyncIOMotorDatabase, couple_id: str, limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+) -> tuple[list[dict], str | None]:
+    """최근 방문 기록 한 페이지 (visited_at 내림차순)와 다음 페이지 커서"""
+    docs, next_cursor = await paginate(
+        db[VISITS_COL], {"couple_id": ObjectId(couple_id)}, "visited_at", -1, limit, cursor
+    )
+    return [_normalize(doc) for doc in docs], next_cursor
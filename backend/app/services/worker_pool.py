@@ -0,0 +1,43 @@
+"""
+lifespan에서 시작/종료되는 백그라운드 워커 풀
+
+하위 클래스는 `_worker(index)`만 구현합니다. 앱 lifespan은 프로세스 안에서 여러 번 열릴 수 있고
+(TestClient를 매번 새로 만드는 테스트 등) 각각 다른 이벤트 루프에서 실행되므로,
+작업은 자신을 만든 루프에서만 취소/대기하고 이미 닫힌 루프의 작업은 버립니다.
+"""
+from __future__ import annotations
+
+import abc
+import asyncio
+
+from ..core.config import settings
+
+
+class WorkerPool(abc.ABC):
+    """워커 `size`개를 실행하는 풀 (`BACKGROUND_WORKERS_ENABLED=false`이면 시작하지 않음)"""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        if self.size <= 0 or not settings.background_workers_enabled:
+            return
+        loop = asyncio.get_running_loop()
+        # 끝난 작업과 이전 lifespan(다른 루프)에서 남은 작업은 버림
+        self._tasks = [task for task in self._tasks if not task.done() and task.get_loop() is loop]
+        if self._tasks:
+            return
+        self._tasks = [loop.create_task(self._worker(index)) for index in range(self.size)]
+
+    async def stop(self) -> None:
+        loop = asyncio.get_running_loop()
+        tasks = [task for task in self._tasks if task.get_loop() is loop]
+        self._tasks = []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @abc.abstractmethod
+    async def _worker(self, index: int) -> None:
+        """워커 하나의 실행 루프 (취소될 때까지 반복)"""
@@ -0,0 +1,54 @@
+"""
+오프라인 부하 테스트용 가짜 LLM 서버 실행 스크립트 (Gemini REST 호환)
+
+API 서버 환경 변수를 아래처럼 지정하면 실제 Gemini 대신 이 서버를 호출합니다.
+    GEMINI_BASE_URL=http://localhost:8100
+    GEMINI_API_KEY=fake
+
+지연/오류 비율은 FAKE_LLM_* 환경 변수 또는 아래 옵션으로 조정합니다.
+
+사용법:
+    python backend/scripts/fake_llm_server.py --latency-ms 1500 --distribution lognormal --error-rate 0.05
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+import uvicorn
+
+from app.core.config import settings
+from app.services.fake_llm import LATENCY_DISTRIBUTIONS, FakeLLMConfig, create_fake_llm_app
+
+
+def main() -> None:
+    defaults = FakeLLMConfig.from_settings()
+    parser = argparse.ArgumentParser(description="Gemini 호환 가짜 LLM 서버")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=settings.fake_llm_port)
+    parser.add_argument("--distribution", choices=LATENCY_DISTRIBUTIONS, default=defaults.latency_distribution)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms, help="지연 중앙값 (ms)")
+    parser.add_argument("--spread", type=float, default=defaults.latency_spread, help="lognormal sigma / uniform ±비율")
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="503/429 응답 비율 (0~1)")
+    parser.add_argument("--malformed-rate", type=float, default=defaults.malformed_rate, help="JSON이 아닌 응답 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args()
+
+    config = FakeLLMConfig(
+        latency_distribution=args.distribution,
+        latency_ms=args.latency_ms,
+        latency_spread=args.spread,
+        error_rate=args.error_rate,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed,
+    )
+    print(f"🤖 가짜 LLM 서버 시작: http://{args.host}:{args.port} ({config})")
+    uvicorn.run(create_fake_llm_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+챌린지 장소 GeoJSON location 마이그레이션 스크립트
+
+latitude/longitude만 저장된 기존 challenge_places 문서에 location(GeoJSON Point)을 채우고
+/challenges/nearby가 사용하는 2dsphere 인덱스를 만듭니다. 여러 번 실행해도 안전합니다.
+
+사용법:
+    python backend/scripts/migrate_challenge_locations.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from app.core.config import settings
+from app.db.init import ensure_indexes
+from app.db.mongo import MongoConnectionManager
+from app.services.challenge_places import backfill_challenge_place_locations
+
+
+async def main() -> None:
+    db = MongoConnectionManager.get_client()[settings.mongodb_db]
+    try:
+        modified = await backfill_challenge_place_locations(db)
+        print(f"🔄 location 추가: {modified}건")
+        await ensure_indexes(db)
+    finally:
+        await MongoConnectionManager.close()
+    print("✅ 마이그레이션 완료")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,65 @@
+"""
+지난 달 월간 리포트(AI 요약 포함) 일괄 사전 생성 스크립트
+
+월이 끝난 뒤 실행하면 해당 월에 방문 기록이 있는 모든 커플의 리포트를 미리 생성해
+`report_snapshots`에 저장합니다. 이미 생성된 커플은 건너뛰므로 중단 후 재실행해도 이어서 진행됩니다.
+
+사용법:
+    python backend/scripts/pregenerate_monthly_reports.py               # 지난 달
+    python backend/scripts/pregenerate_monthly_reports.py --month 2025-04 --concurrency 2 --rate 20
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from app.core.config import settings
+from app.db.mongo import MongoConnectionManager
+from app.services.report_batch import pregenerate_monthly_reports
+
+
+def previous_month() -> str:
+    first_of_month = datetime.utcnow().replace(day=1)
+    return (first_of_month - timedelta(days=1)).strftime("%Y-%m")
+
+
+def print_progress(run: dict) -> None:
+    print(f"  진행: {run['done']}/{run['total']} (실패 {len(run['failed'])})")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="지난 달 월간 리포트 일괄 사전 생성")
+    parser.add_argument("--month", default=previous_month(), help="대상 월 (YYYY-MM, 기본값: 지난 달)")
+    parser.add_argument("--concurrency", type=int, default=settings.report_pregen_concurrency, help="동시 생성 수")
+    parser.add_argument("--rate", type=float, default=settings.report_pregen_rate_per_minute, help="분당 LLM 호출 수 (0이면 제한 없음)")
+    args = parser.parse_args()
+
+    db = MongoConnectionManager.get_client()[settings.mongodb_db]
+    print(f"📊 {args.month} 리포트 사전 생성 시작 (동시 {args.concurrency}, 분당 {args.rate})")
+    try:
+        run = await pregenerate_monthly_reports(
+            db,
+            args.month,
+            concurrency=args.concurrency,
+            rate_per_minute=args.rate,
+            on_progress=print_progress,
+        )
+    finally:
+        await MongoConnectionManager.close()
+
+    print(f"✅ 완료: {run['done']}/{run['total']}")
+    if run["failed"]:
+        print(f"⚠️ 실패 {len(run['failed'])}건 (다시 실행하면 재시도합니다)")
+        for item in run["failed"]:
+            print(f"  - {item['couple_id']}: {item['error']}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,44 @@
+"""
+커플별 태그/감정 누적 카운터(challenge_counters) 재생성 스크립트
+
+방문 기록을 집계해 카운터 문서를 다시 만듭니다. 기능 도입 전 데이터를 채우거나
+카운터가 어긋났을 때 실행합니다. (커플 하나씩 교체하므로 서비스 중 실행해도 됩니다)
+
+사용법:
+    python backend/scripts/rebuild_challenge_counters.py                 # 방문 기록이 있는 모든 커플
+    python backend/scripts/rebuild_challenge_counters.py --couple-id <id>
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from app.core.config import settings
+from app.db.mongo import MongoConnectionManager
+from app.services.challenge_counters import VISITS_COL, rebuild_counters
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="챌린지 태그/감정 카운터 재생성")
+    parser.add_argument("--couple-id", help="특정 커플만 재생성")
+    args = parser.parse_args()
+
+    db = MongoConnectionManager.get_client()[settings.mongodb_db]
+    try:
+        couple_ids = [args.couple_id] if args.couple_id else await db[VISITS_COL].distinct("couple_id")
+        print(f"🔄 카운터 재생성 대상: {len(couple_ids)}커플")
+        for index, couple_id in enumerate(couple_ids, start=1):
+            doc = await rebuild_counters(db, couple_id)
+            print(f"  [{index}/{len(couple_ids)}] {couple_id}: 태그 {len(doc['tags'])}종, 감정 {len(doc['emotions'])}종")
+    finally:
+        await MongoConnectionManager.close()
+    print("✅ 재생성 완료")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,39 @@
+"""
+커플 리더보드(Redis sorted set) 재생성 스크립트
+
+MongoDB의 커플 포인트와 리뷰 완료된 챌린지 방문 기록으로 전체/지역별/월별 보드를 다시 만듭니다.
+기능 도입 전 데이터를 채우거나 Redis 데이터가 유실·어긋났을 때 실행합니다.
+(보드마다 임시 키에 채운 뒤 교체하므로 서비스 중 실행해도 됩니다)
+
+사용법:
+    python backend/scripts/rebuild_leaderboards.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from app.core.config import settings
+from app.db.mongo import MongoConnectionManager
+from app.db.redis import RedisConnectionManager
+from app.services.leaderboard import rebuild_leaderboards
+
+
+async def main() -> None:
+    db = MongoConnectionManager.get_client()[settings.mongodb_db]
+    try:
+        boards = await rebuild_leaderboards(db)
+        for key, count in sorted(boards.items()):
+            print(f"  {key}: {count}커플")
+    finally:
+        await MongoConnectionManager.close()
+        await RedisConnectionManager.close()
+    print(f"✅ 리더보드 {len(boards)}개 재생성 완료")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+"""
+커플별 월간 방문 집계(monthly_rollups) 재생성 스크립트
+
+방문 기록을 집계해 (커플, 월)마다 집계 문서를 다시 만듭니다. 기능 도입 전 데이터를 채우거나
+집계가 어긋났을 때 실행합니다. (문서 하나씩 교체하므로 서비스 중 실행해도 됩니다)
+
+사용법:
+    python backend/scripts/rebuild_monthly_rollups.py                       # 방문 기록이 있는 모든 커플/월
+    python backend/scripts/rebuild_monthly_rollups.py --month 2025-04
+    python backend/scripts/rebuild_monthly_rollups.py --couple-id <id>
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from app.core.config import settings
+from app.db.mongo import MongoConnectionManager
+from app.services.monthly_rollups import rebuild_rollup, rollup_targets
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="월간 방문 집계 재생성")
+    parser.add_argument("--couple-id", help="특정 커플만 재생성")
+    parser.add_argument("--month", help="특정 월(YYYY-MM)만 재생성")
+    args = parser.parse_args()
+
+    db = MongoConnectionManager.get_client()[settings.mongodb_db]
+    try:
+        targets = await rollup_targets(db, args.couple_id, args.month)
+        print(f"🔄 월간 집계 재생성 대상: {len(targets)}건")
+        for index, (couple_id, month) in enumerate(targets, start=1):
+            doc = await rebuild_rollup(db, couple_id, month)
+            print(f"  [{index}/{len(targets)}] {couple_id} {month}: 방문 {doc['visit_count']}건, 태그 {len(doc['tags'])}종")
+    finally:
+        await MongoConnectionManager.close()
+    print("✅ 재생성 완료")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,132 @@
+"""
+챌린지 리뷰 등록(add_visit)의 조건부 단일 갱신 테스트 (DB 불필요)
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from backend.app.services import visits
+
+COUPLE_ID = ObjectId()
+PLACE_ID = ObjectId()
+
+
+def _evaluate(expr: Any, doc: dict) -> Any:
+    """테스트에 쓰이는 집계 식만 계산 ($literal, $concatArrays, $ifNull, "$필드")"""
+    if isinstance(expr, str) and expr.startswith("$"):
+        return doc.get(expr[1:])
+    if isinstance(expr, list):
+        return [_evaluate(item, doc) for item in expr]
+    if isinstance(expr, dict):
+        if "$literal" in expr:
+            return expr["$literal"]
+        if "$concatArrays" in expr:
+            return [item for part in expr["$concatArrays"] for item in _evaluate(part, doc)]
+        if "$ifNull" in expr:
+            value, default = expr["$ifNull"]
+            value = _evaluate(value, doc)
+            return _evaluate(default, doc) if value is None else value
+        return {key: _evaluate(value, doc) for key, value in expr.items()}
+    return expr
+
+
+class _FakeVisits:
+    def __init__(self, docs: list[dict]) -> None:
+        self.docs = docs
+        self.calls: list[str] = []
+
+    def _match(self, query: dict) -> dict | None:
+        for doc in self.docs:
+            if all(
+                doc.get(key) != value["$ne"] if isinstance(value, dict) else doc.get(key) == value
+                for key, value in query.items()
+            ):
+                return doc
+        return None
+
+    async def find_one_and_update(self, query: dict, update: list[dict], **_kwargs: Any) -> dict | None:
+        self.calls.append("find_one_and_update")
+        doc = self._match(query)
+        if doc is None:
+            return None
+        before = dict(doc)
+        for stage in update:
+            doc.update({key: _evaluate(value, doc) for key, value in stage["$set"].items()})
+        return before
+
+    async def find_one(self, query: dict, _projection: dict | None = None) -> dict | None:
+        self.calls.append("find_one")
+        return self._match(query)
+
+
+@pytest.fixture
+def hooks(monkeypatch: pytest.MonkeyPatch) -> list[tuple]:
+    grants: list[tuple] = []
+
+    async def fake_grant_rewards(_db, couple_id: str, place_id: str) -> dict:
+        grants.append(("grant", place_id))
+        return {}
+
+    monkeypatch.setattr("backend.app.services.rewards.grant_rewards", fake_grant_rewards)
+    return grants
+
+
+def _visit(**fields: Any) -> dict:
+    return {
+        "_id": ObjectId(),
+        "couple_id": COUPLE_ID,
+        "user_id": ObjectId(),
+        "challenge_place_id": PLACE_ID,
+        "tags": [],
+        "emotion": None,
+        "location_verified": True,
+        "review_completed": False,
+        **fields,
+    }
+
+
+def _review(db: dict) -> dict:
+    payload = {"challenge_place_id": str(PLACE_ID), "rating": 5, "memo": "야경이 예뻤어요", "tags": ["야경"], "emotion": "설렘"}
+    return asyncio.run(visits.add_visit(db, str(COUPLE_ID), str(ObjectId()), payload))
+
+
+def test_review_is_written_in_one_round_trip(hooks: list[tuple]):
+    collection = _FakeVisits([_visit()])
+    result = _review({visits.VISITS_COL: collection})
+
+    assert collection.calls == ["find_one_and_update"]
+    assert result["review_completed"] is True
+    assert result["tags"] == ["야경"]
+    assert "outbox" not in result
+    assert hooks == [("grant", str(PLACE_ID))]
+
+    # 같은 쓰기에서 변경 전후 값을 담은 이벤트가 outbox에 추가됨
+    stored = collection.docs[0]
+    assert stored["outbox_pending"] is True
+    (event,) = stored["outbox"]
+    assert event["type"] == "visit.updated"
+    assert event["visit_id"] == stored["_id"] and event["couple_id"] == COUPLE_ID
+    assert event["before"]["tags"] == [] and event["before"]["review_completed"] is False
+    assert event["after"]["tags"] == ["야경"] and event["after"]["emotion"] == "설렘"
+    assert event["after"]["review_completed"] is True
+
+
+@pytest.mark.parametrize(
+    ("docs", "detail"),
+    [
+        ([], "위치 인증이 필요합니다"),
+        ([_visit(location_verified=False)], "위치 인증이 필요합니다"),
+        ([_visit(review_completed=True)], "이미 리뷰가 작성된"),
+    ],
+)
+def test_invalid_reviews_are_rejected(hooks: list[tuple], docs: list[dict], detail: str):
+    collection = _FakeVisits(docs)
+    with pytest.raises(HTTPException) as exc_info:
+        _review({visits.VISITS_COL: collection})
+    assert detail in exc_info.value.detail
+    assert hooks == []
@@ -0,0 +1,126 @@
+"""
+일괄 체크인(add_visits_bulk) 검증과 단일 bulk_write 테스트 (DB 불필요)
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from bson import ObjectId
+
+from backend.app.services import visits
+
+COUPLE_ID = ObjectId()
+PLACE_ID = ObjectId()
+REVIEWED_PLACE_ID = ObjectId()
+
+
+class _Cursor:
+    def __init__(self, docs: list[dict]) -> None:
+        self._docs = iter(docs)
+
+    def __aiter__(self) -> "_Cursor":
+        return self
+
+    async def __anext__(self) -> dict:
+        try:
+            return next(self._docs)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class _FakeVisits:
+    def __init__(self, docs: list[dict]) -> None:
+        self.docs = docs
+        self.bulk_writes: list[list] = []
+
+    def find(self, query: dict, _projection: dict | None = None) -> _Cursor:
+        def matches(doc: dict) -> bool:
+            for key, value in query.items():
+                if isinstance(value, dict):
+                    if doc.get(key) not in value["$in"]:
+                        return False
+                elif doc.get(key) != value:
+                    return False
+            return True
+
+        return _Cursor([doc for doc in self.docs if matches(doc)])
+
+    async def bulk_write(self, operations: list, ordered: bool = True) -> Any:
+        self.bulk_writes.append(operations)
+
+        class _Result:
+            matched_count = sum(1 for op in operations if type(op).__name__ == "UpdateOne")
+
+        return _Result()
+
+
+@pytest.fixture
+def hooks(monkeypatch: pytest.MonkeyPatch) -> dict[str, list]:
+    calls: dict[str, list] = {"grants": []}
+
+    async def fake_grant_rewards(_db, couple_id: str, place_id: str) -> dict:
+        calls["grants"].append(place_id)
+        return {}
+
+    monkeypatch.setattr("backend.app.services.rewards.grant_rewards", fake_grant_rewards)
+    return calls
+
+
+def _verified_visit(place_id: ObjectId, **fields: Any) -> dict:
+    return {
+        "_id": ObjectId(),
+        "couple_id": COUPLE_ID,
+        "user_id": ObjectId(),
+        "place_id": "",
+        "challenge_place_id": place_id,
+        "tags": [],
+        "location_verified": True,
+        "review_completed": False,
+        **fields,
+    }
+
+
+def test_bulk_checkin_reports_each_item_and_writes_once(hooks: dict[str, list]):
+    collection = _FakeVisits(
+        [
+            _verified_visit(PLACE_ID),
+            _verified_visit(REVIEWED_PLACE_ID, review_completed=True),
+            {**_verified_visit(None), "client_key": "k-old", "place_id": "cafe-0"},
+        ]
+    )
+    review = {"place_id": "", "challenge_place_id": str(PLACE_ID), "rating": 5, "memo": "좋았어요", "tags": ["야경"]}
+    items = [
+        {"client_key": "k1", "place_id": "cafe-1", "tags": ["카페"]},
+        {"client_key": "k2", **review},
+        {"client_key": "k3", **review},
+        {"client_key": "k4", "place_id": "", "challenge_place_id": str(REVIEWED_PLACE_ID), "rating": 4, "memo": "또"},
+        {"client_key": "k5", "place_id": "", "challenge_place_id": str(ObjectId()), "rating": 4, "memo": "미인증"},
+        {"client_key": "k6", "place_id": "x", "plan_id": "not-an-id"},
+        {"client_key": "k1", "place_id": "cafe-1"},
+        {"client_key": "k-old", "place_id": "cafe-0"},
+    ]
+
+    results = asyncio.run(visits.add_visits_bulk({visits.VISITS_COL: collection}, str(COUPLE_ID), str(ObjectId()), items))
+
+    assert [(r["client_key"], r["status"]) for r in results] == [
+        ("k1", "created"),
+        ("k2", "reviewed"),
+        ("k3", "rejected"),
+        ("k4", "rejected"),
+        ("k5", "rejected"),
+        ("k6", "rejected"),
+        ("k1", "duplicate"),
+        ("k-old", "duplicate"),
+    ]
+    assert results[1]["visit"]["review_completed"] is True
+    assert results[7]["visit"]["place_id"] == "cafe-0"
+    assert len(collection.bulk_writes) == 1 and len(collection.bulk_writes[0]) == 2
+    # 새 기록은 생성 이벤트를 담아 삽입하고, 리뷰는 이벤트를 추가하는 파이프라인 업데이트로 기록
+    insert, review_update = collection.bulk_writes[0]
+    assert insert._doc["outbox"][0]["type"] == "visit.created"
+    assert insert._doc["outbox"][0]["after"]["tags"] == ["카페"]
+    assert isinstance(review_update._doc, list)
+    assert "outbox" not in results[0]["visit"]
+    assert hooks["grants"] == [str(PLACE_ID)]
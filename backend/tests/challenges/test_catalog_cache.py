@@ -0,0 +1,82 @@
+"""
+챌린지 카탈로그 캐시의 버전 기반 재적재 테스트 (DB 불필요)
+"""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backend.app.core.config import settings
+from backend.app.db.redis import RedisConnectionManager
+from backend.app.services import catalog_cache
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, int] = {}
+
+    async def get(self, key: str) -> str | None:
+        value = self.values.get(key)
+        return None if value is None else str(value)
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+
+@pytest.fixture
+def loads(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    redis = _FakeRedis()
+    monkeypatch.setattr(RedisConnectionManager, "get_client", classmethod(lambda cls: redis))
+    monkeypatch.setattr(settings, "challenge_catalog_check_seconds", 0.0)
+    calls: list[int] = []
+
+    async def fake_places(_db, active_only: bool = True):
+        calls.append(1)
+        return [
+            {"id": "p1", "name": "남산", "active": True},
+            {"id": "p2", "name": "폐쇄", "active": False},
+        ]
+
+    async def fake_categories(_db, active_only: bool = True):
+        return [{"id": "c1", "name": "야경", "active": True}]
+
+    monkeypatch.setattr(catalog_cache, "list_challenge_places", fake_places)
+    monkeypatch.setattr(catalog_cache, "list_challenge_categories", fake_categories)
+    monkeypatch.setattr(catalog_cache, "challenge_catalog", catalog_cache.ChallengeCatalog())
+    return calls
+
+
+def test_reads_are_served_from_memory_until_version_changes(loads: list[int]) -> None:
+    catalog = catalog_cache.challenge_catalog
+
+    async def scenario() -> None:
+        assert [p["id"] for p in await catalog.places(None)] == ["p1"]
+        assert (await catalog.place(None, "p2"))["active"] is False
+        assert len(await catalog.categories(None)) == 1
+        assert len(loads) == 1
+
+        # 다른 파드의 관리자 쓰기: 버전만 바뀌어도 다음 조회 때 재적재
+        await RedisConnectionManager.get_client().incr(catalog_cache.CATALOG_VERSION_KEY)
+        await catalog.places(None)
+        assert len(loads) == 2
+        await catalog.places(None)
+        assert len(loads) == 2
+
+        # 현재 파드의 관리자 쓰기는 즉시 무효화
+        await catalog_cache.bump_catalog_version()
+        await catalog.places(None)
+        assert len(loads) == 3
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_cold_reads_load_once(loads: list[int]) -> None:
+    catalog = catalog_cache.challenge_catalog
+
+    async def scenario() -> None:
+        await asyncio.gather(*(catalog.places(None) for _ in range(10)))
+
+    asyncio.run(scenario())
+    assert len(loads) == 1
@@ -0,0 +1,33 @@
+"""
+챌린지 카운터 증감 계산 및 필드 이름 이스케이프 테스트 (DB 불필요)
+"""
+from backend.app.db.keys import escape_key, unescape_key
+from backend.app.services.challenge_counters import counter_delta
+
+
+def test_new_visit_increments_tags_and_emotion():
+    delta = counter_delta(None, {"tags": ["야경", "카페", "야경"], "emotion": "힐링"})
+    assert delta == {"tags.야경": 2, "tags.카페": 1, "emotions.힐링": 1}
+
+
+def test_update_only_applies_difference():
+    before = {"tags": ["야경", "카페"], "emotion": "설렘"}
+    after = {"tags": ["카페", "산책"], "emotion": "힐링"}
+    assert counter_delta(before, after) == {
+        "tags.야경": -1,
+        "tags.산책": 1,
+        "emotions.설렘": -1,
+        "emotions.힐링": 1,
+    }
+
+
+def test_unchanged_visit_has_no_delta():
+    visit = {"tags": ["카페"], "emotion": None}
+    assert counter_delta(visit, dict(visit)) == {}
+
+
+def test_special_characters_are_escaped():
+    delta = counter_delta(None, {"tags": ["a.b", "$x", "100%"]})
+    assert set(delta) == {"tags.a%2Eb", "tags.%24x", "tags.100%25"}
+    for raw in ("a.b", "$x", "100%", "%2E"):
+        assert unescape_key(escape_key(raw)) == raw
@@ -0,0 +1,89 @@
+"""
+챌린지 규칙 컴파일/평가 테스트 (DB 불필요)
+"""
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from backend.app.services.challenge_rules import (
+    CHALLENGE_DEFINITIONS,
+    backfill_pipeline,
+    compile_criteria,
+    compile_rule,
+    evaluate,
+)
+
+CATEGORY = ObjectId()
+PLACE = ObjectId()
+
+
+def _rule(criteria, **extra):
+    return compile_rule({"_id": "r", "title": "t", "criteria": criteria, "revision": 2, **extra})
+
+
+def test_default_rules_read_from_counters_only():
+    for definition in CHALLENGE_DEFINITIONS:
+        rule = _rule(definition["criteria"])
+        assert rule.tracked == []
+
+
+def test_composite_rule_evaluation():
+    root, leaves = compile_criteria(
+        {"all": [{"tag": "카페", "count": 3}, {"any": [{"emotion": "설렘", "count": 2}, {"place": str(PLACE)}]}]}
+    )
+    cafe, excited, place = leaves
+
+    assert evaluate(root, {cafe.key: 5, excited.key: 1}) == (4, 5, False)
+    assert evaluate(root, {cafe.key: 3, place.key: 1}) == (4, 4, True)
+
+
+def test_leaf_matches_incrementally_and_requires_review_for_places():
+    rule = _rule({"category": str(CATEGORY), "tag": "야경"})
+    [leaf] = rule.tracked
+    visit = {"tags": ["야경"], "challenge_place_id": PLACE, "review_completed": True}
+
+    assert leaf.matches(visit, CATEGORY)
+    assert not leaf.matches({**visit, "review_completed": False}, CATEGORY)
+    assert not leaf.matches(visit, ObjectId())
+    assert not leaf.matches(None, CATEGORY)
+
+
+def test_time_window_tracks_all_leaves_and_filters_backfill():
+    rule = _rule({"tag": "벚꽃"}, starts_at=datetime(2025, 3, 1), ends_at=datetime(2025, 5, 1))
+
+    assert len(rule.tracked) == 1
+    assert rule.in_window(datetime(2025, 4, 10))
+    assert not rule.in_window(datetime(2025, 5, 1))
+    assert not rule.in_window(None)
+
+    couple_id = ObjectId()
+    pipeline = backfill_pipeline(rule, couple_id)
+    assert pipeline[0] == {
+        "$match": {"couple_id": couple_id, "created_at": {"$gte": datetime(2025, 3, 1), "$lt": datetime(2025, 5, 1)}}
+    }
+    assert set(pipeline[-1]["$facet"]["counts"][-1]["$group"]) == {"_id", rule.tracked[0].key}
+
+
+def test_category_backfill_looks_up_places():
+    rule = _rule({"category": str(CATEGORY), "count": 2})
+    pipeline = backfill_pipeline(rule, ObjectId())
+    assert [next(iter(stage)) for stage in pipeline] == ["$match", "$facet"]
+    assert [next(iter(stage)) for stage in pipeline[-1]["$facet"]["counts"]] == ["$lookup", "$set", "$group"]
+
+
+@pytest.mark.parametrize(
+    "criteria",
+    [
+        {},
+        {"all": []},
+        {"all": [{"tag": "a"}], "tag": "b"},
+        {"count": 3},
+        {"tag": "a", "count": 0},
+        {"tag": "a", "color": "red"},
+        {"place": "not-an-object-id"},
+    ],
+)
+def test_invalid_criteria_rejected(criteria):
+    with pytest.raises(ValueError):
+        compile_criteria(criteria)
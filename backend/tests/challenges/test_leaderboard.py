@@ -0,0 +1,179 @@
+"""
+커플 리더보드 키 구성과 순위 조회 테스트 (DB 불필요)
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Any
+
+import pytest
+from bson import ObjectId
+
+from backend.app.db.redis import RedisConnectionManager
+from backend.app.services import leaderboard, visit_event_workers
+
+
+class _FakePipeline:
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, tuple]] = []
+
+    async def __aenter__(self) -> "_FakePipeline":
+        return self
+
+    async def __aexit__(self, *_exc: Any) -> None:
+        return None
+
+    def __getattr__(self, name: str):
+        return lambda *args: self._ops.append((name, args))
+
+    async def execute(self) -> list[Any]:
+        return [await getattr(self._redis, name)(*args) for name, args in self._ops]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.ttls: dict[str, int] = {}
+        self.strings: dict[str, Any] = {}
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    def _ordered(self, key: str) -> list[tuple[str, float]]:
+        # ZREVRANGE와 같이 점수 내림차순, 동점이면 멤버 역순
+        return sorted(self.zsets.get(key, {}).items(), key=lambda item: (item[1], item[0]), reverse=True)
+
+    async def zadd(self, key: str, mapping: dict[str, float], gt: bool = False) -> None:
+        zset = self.zsets.setdefault(key, {})
+        for member, score in mapping.items():
+            if not gt or score > zset.get(member, float("-inf")):
+                zset[member] = score
+
+    async def zincrby(self, key: str, amount: float, member: str) -> float:
+        zset = self.zsets.setdefault(key, {})
+        zset[member] = zset.get(member, 0) + amount
+        return zset[member]
+
+    async def set(self, key: str, value: Any, nx: bool = False, ex: int | None = None) -> bool | None:
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value
+        return True
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.strings.pop(key, None)
+            self.zsets.pop(key, None)
+
+    async def expire(self, key: str, ttl: int) -> None:
+        self.ttls[key] = ttl
+
+    async def zrevrange(self, key: str, start: int, end: int, withscores: bool = False) -> list:
+        return self._ordered(key)[start : end + 1]
+
+    async def zrevrank(self, key: str, member: str) -> int | None:
+        members = [m for m, _ in self._ordered(key)]
+        return members.index(member) if member in members else None
+
+    async def zscore(self, key: str, member: str) -> float | None:
+        return self.zsets.get(key, {}).get(member)
+
+    async def zcard(self, key: str) -> int:
+        return len(self.zsets.get(key, {}))
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedis:
+    redis = _FakeRedis()
+    monkeypatch.setattr(RedisConnectionManager, "get_client", classmethod(lambda cls: redis))
+    return redis
+
+
+def test_region_is_city_level():
+    assert leaderboard.region_of("경기도 수원시 팔달구 남문로 92") == "수원시"
+    assert leaderboard.region_of("서울특별시 강남구 테헤란로") == "서울특별시"
+    assert leaderboard.region_of("") is None
+
+
+def test_board_key_requires_scope_argument():
+    assert leaderboard.board_key("month", month="2024-05") == "leaderboard:month:2024-05"
+    with pytest.raises(ValueError):
+        leaderboard.board_key("region")
+    with pytest.raises(ValueError):
+        leaderboard.board_key("weekly")
+
+
+def test_grants_update_all_boards_and_rank_queries(fake_redis: _FakeRedis):
+    address = "경기도 수원시 영통구 광교호수로"
+    may = datetime(2024, 5, 4)
+
+    async def scenario() -> None:
+        for index in range(6):
+            await leaderboard.record_total(f"c{index}", (index + 1) * 500)
+            await leaderboard.record_visit_points(f"c{index}", (index + 1) * 500, address, may)
+        await leaderboard.record_total("c0", 750)
+        await leaderboard.record_visit_points("c0", 250, "서울특별시 마포구", datetime(2024, 6, 1))
+
+        global_key = leaderboard.board_key("global")
+        suwon_key = leaderboard.board_key("region", region="수원시")
+        may_key = leaderboard.board_key("month", month="2024-05")
+
+        assert [e["couple_id"] for e in await leaderboard.top(global_key, 3)] == ["c5", "c4", "c3"]
+        assert await leaderboard.rank_of(global_key, "c0") == {"rank": 6, "couple_id": "c0", "score": 750}
+        assert await leaderboard.rank_of(suwon_key, "c0") == {"rank": 6, "couple_id": "c0", "score": 500}
+        assert await leaderboard.board_size(may_key) == 6
+        assert fake_redis.ttls[may_key] == leaderboard.MONTH_BOARD_TTL_SECONDS
+
+        nearby = await leaderboard.around(suwon_key, "c2", radius=1)
+        assert [(e["rank"], e["couple_id"]) for e in nearby] == [(3, "c3"), (4, "c2"), (5, "c1")]
+        assert await leaderboard.around(suwon_key, "unknown") == []
+
+    asyncio.run(scenario())
+
+
+def test_redelivered_visit_event_is_counted_once(fake_redis: _FakeRedis):
+    event_id = ObjectId()
+    may = datetime(2024, 5, 4)
+
+    async def scenario() -> list[bool]:
+        return [
+            await leaderboard.record_visit_points("c0", 500, "경기도 수원시", may, event_id=event_id)
+            for _ in range(2)
+        ]
+
+    assert asyncio.run(scenario()) == [True, False]
+    assert fake_redis.zsets[leaderboard.board_key("month", month="2024-05")] == {"c0": 500}
+    assert fake_redis.zsets[leaderboard.board_key("region", region="수원시")] == {"c0": 500}
+
+
+def test_stale_total_does_not_lower_global_score(fake_redis: _FakeRedis):
+    async def scenario() -> None:
+        await leaderboard.record_total("c0", 1000)
+        # 먼저 지급된 보상의 합계가 늦게 도착
+        await leaderboard.record_total("c0", 500)
+
+    asyncio.run(scenario())
+    assert fake_redis.zsets[leaderboard.board_key("global")] == {"c0": 1000}
+
+
+def test_month_board_uses_review_completion_time(fake_redis: _FakeRedis, monkeypatch: pytest.MonkeyPatch):
+    place_id = ObjectId()
+
+    async def fake_place(_db, _place_id: str) -> dict:
+        return {"_id": place_id, "points_reward": 500, "address": "경기도 수원시"}
+
+    monkeypatch.setattr(visit_event_workers.challenge_catalog, "place", fake_place)
+    snapshot = {"challenge_place_id": place_id, "review_completed": False, "created_at": datetime(2024, 5, 30)}
+    event = {
+        "event_id": ObjectId(),
+        "couple_id": ObjectId(),
+        "before": snapshot,
+        "after": {**snapshot, "review_completed": True},
+        "created_at": datetime(2024, 6, 2),
+    }
+
+    asyncio.run(visit_event_workers._update_leaderboard({}, event))
+    assert leaderboard.board_key("month", month="2024-06") in fake_redis.zsets
+    assert leaderboard.board_key("month", month="2024-05") not in fake_redis.zsets
@@ -0,0 +1,54 @@
+"""
+GPS 궤적 일괄 위치 인증의 장소 매칭 테스트 (DB 불필요)
+"""
+import random
+from datetime import datetime, timedelta, timezone
+
+from backend.app.services.geolocation import calculate_distance
+from backend.app.services.location_traces import GeofenceGrid, match_trace
+
+START = datetime(2024, 5, 4, 12, 0)
+
+PLACES = [
+    {"id": "hwaseong", "name": "수원 화성", "latitude": 37.2871, "longitude": 127.0118},
+    {"id": "market", "name": "남문시장", "latitude": 37.2780, "longitude": 127.0170},
+    {"id": "gwanggyo", "name": "광교호수공원", "latitude": 37.2833, "longitude": 127.0653},
+]
+
+
+def test_trace_hits_record_first_entry_and_closest_distance():
+    points = [
+        {"latitude": 37.2820, "longitude": 127.0150, "recorded_at": START + timedelta(minutes=30)},
+        {"latitude": 37.2871, "longitude": 127.0118, "recorded_at": START + timedelta(minutes=40)},
+        {"latitude": 37.2950, "longitude": 127.0100, "recorded_at": START},
+    ]
+    hits = match_trace(PLACES, points)
+
+    assert set(hits) == {"hwaseong", "market"}
+    assert hits["hwaseong"].first_seen_at == START
+    assert hits["hwaseong"].distance_meters == 0
+    assert hits["market"].first_seen_at == START + timedelta(minutes=30)
+
+
+def test_timezone_aware_points_are_normalized_to_utc():
+    kst = timezone(timedelta(hours=9))
+    points = [
+        {"latitude": 37.2833, "longitude": 127.0653, "recorded_at": datetime(2024, 5, 4, 21, 0, tzinfo=kst)},
+        {"latitude": 37.2833, "longitude": 127.0653, "recorded_at": START + timedelta(hours=1)},
+    ]
+    assert match_trace(PLACES, points)["gwanggyo"].first_seen_at == START
+
+
+def test_grid_matches_brute_force():
+    rng = random.Random(7)
+    places = [
+        {"id": str(i), "latitude": 37.2 + rng.random() * 0.2, "longitude": 126.9 + rng.random() * 0.2}
+        for i in range(200)
+    ]
+    grid = GeofenceGrid(places, 1000)
+    for _ in range(200):
+        lat, lon = 37.2 + rng.random() * 0.2, 126.9 + rng.random() * 0.2
+        expected = {
+            p["id"] for p in places if calculate_distance(lat, lon, p["latitude"], p["longitude"]) <= 1000
+        }
+        assert {p["id"] for p, _ in grid.within(lat, lon)} == expected
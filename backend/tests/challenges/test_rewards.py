@@ -0,0 +1,77 @@
+"""
+보상 지급의 조건부 단일 업데이트 테스트 (DB 불필요)
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from bson import ObjectId
+
+from backend.app.services import rewards
+
+COUPLE_ID = ObjectId()
+PLACE = {"id": "p1", "points_reward": 500, "badge_reward": "🏯", "address": "경기도 수원시 팔달구"}
+
+
+class _FakeCouples:
+    def __init__(self) -> None:
+        self.doc = {"_id": COUPLE_ID, "points": 100, "badges": ["🌸"]}
+        self.updates = 0
+
+    def _matches(self, query: dict) -> bool:
+        if query["_id"] != self.doc["_id"]:
+            return False
+        return "badges" not in query or query["badges"]["$ne"] not in self.doc["badges"]
+
+    async def find_one_and_update(self, query: dict, update: dict, **_kwargs: Any) -> dict | None:
+        # 실제 MongoDB처럼 조건 확인과 갱신 사이에 다른 요청이 끼어들 수 없음
+        if not self._matches(query):
+            return None
+        self.updates += 1
+        self.doc["points"] += update["$inc"]["points"]
+        for badge in update.get("$addToSet", {}).values():
+            if badge not in self.doc["badges"]:
+                self.doc["badges"].append(badge)
+        return dict(self.doc, badges=list(self.doc["badges"]))
+
+    async def find_one(self, query: dict, _projection: dict | None = None) -> dict | None:
+        return dict(self.doc) if query["_id"] == self.doc["_id"] else None
+
+
+@pytest.fixture
+def couples(monkeypatch: pytest.MonkeyPatch) -> _FakeCouples:
+    collection = _FakeCouples()
+    grants: list[tuple] = []
+
+    async def fake_place(_db, place_id: str) -> dict | None:
+        return PLACE if place_id == PLACE["id"] else None
+
+    async def fake_record_total(*args: Any) -> None:
+        grants.append(args)
+
+    monkeypatch.setattr(rewards.challenge_catalog, "place", fake_place)
+    monkeypatch.setattr(rewards, "record_total", fake_record_total)
+    collection.grants = grants
+    return collection
+
+
+def test_concurrent_grants_award_once(couples: _FakeCouples):
+    db = {rewards.COUPLES_COL: couples}
+
+    async def scenario() -> list[dict]:
+        return await asyncio.gather(*(rewards.grant_rewards(db, str(COUPLE_ID), "p1") for _ in range(5)))
+
+    results = asyncio.run(scenario())
+
+    assert couples.updates == 1
+    assert couples.doc == {"_id": COUPLE_ID, "points": 600, "badges": ["🌸", "🏯"]}
+    assert all(result == {"points": 600, "badges": ["🌸", "🏯"]} for result in results)
+    assert couples.grants == [(str(COUPLE_ID), 600)]
+
+
+def test_unknown_place_grants_nothing(couples: _FakeCouples):
+    result = asyncio.run(rewards.grant_rewards({rewards.COUPLES_COL: couples}, str(COUPLE_ID), "missing"))
+    assert result == {"points": 0, "badges": []}
+    assert couples.updates == 0
@@ -0,0 +1,132 @@
+"""
+방문 이벤트 outbox 소비와 멱등 처리 테스트 (DB 불필요)
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Any
+
+import pytest
+from bson import ObjectId
+
+from backend.app.services import challenge_counters, visit_event_workers, visit_events
+
+COUPLE_ID = ObjectId()
+
+
+class _UpdateResult:
+    def __init__(self, matched_count: int) -> None:
+        self.matched_count = matched_count
+
+
+class _FakeVisits:
+    def __init__(self, docs: list[dict]) -> None:
+        self.docs = docs
+
+    def _get(self, visit_id: ObjectId) -> dict:
+        return next(doc for doc in self.docs if doc["_id"] == visit_id)
+
+    async def find_one_and_update(self, query: dict, update: dict, **_kwargs: Any) -> dict | None:
+        now = datetime.utcnow()
+        for doc in self.docs:
+            lease = doc.get("outbox_lease_until")
+            if doc.get("outbox_pending") and (lease is None or lease <= now):
+                doc.update(update["$set"])
+                return {"_id": doc["_id"], "outbox": list(doc["outbox"])}
+        return None
+
+    async def update_one(self, query: dict, update: dict) -> _UpdateResult:
+        doc = self._get(query["_id"])
+        if "outbox" in query and len(doc.get("outbox", [])) != query["outbox"]["$size"]:
+            return _UpdateResult(0)
+        if "$pull" in update:
+            event_id = update["$pull"]["outbox"]["event_id"]
+            doc["outbox"] = [event for event in doc["outbox"] if event["event_id"] != event_id]
+        for key in update.get("$unset", {}):
+            doc.pop(key, None)
+        return _UpdateResult(1)
+
+
+class _FakeCounters:
+    def __init__(self) -> None:
+        self.doc: dict = {"_id": COUPLE_ID, "tags": {}, "emotions": {}, "applied_events": []}
+
+    async def update_one(self, query: dict, update: dict) -> _UpdateResult:
+        guard = query.get("applied_events")
+        if guard and guard["$ne"] in self.doc["applied_events"]:
+            return _UpdateResult(0)
+        for path, value in update["$inc"].items():
+            group, key = path.split(".", 1)
+            self.doc[group][key] = self.doc[group].get(key, 0) + value
+        if "$push" in update:
+            self.doc["applied_events"].extend(update["$push"]["applied_events"]["$each"])
+        return _UpdateResult(1)
+
+
+def _created_visit(tags: list[str]) -> dict:
+    doc = {"couple_id": COUPLE_ID, "tags": tags, "emotion": None, "created_at": datetime(2024, 5, 3)}
+    return visit_events.with_created_event(doc, datetime.utcnow())
+
+
+@pytest.fixture
+def delivered(monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+    events: list[dict] = []
+
+    async def record(_db, event: dict) -> None:
+        events.append(event)
+
+    monkeypatch.setattr(visit_event_workers, "HANDLERS", [("record", record)])
+    return events
+
+
+def test_events_are_dispatched_acked_and_outbox_cleared(delivered: list[dict]):
+    visit = _created_visit(["카페"])
+    visit["outbox"].append({**visit["outbox"][0], "event_id": ObjectId(), "type": "visit.updated"})
+    collection = _FakeVisits([visit])
+    db = {visit_events.VISITS_COL: collection}
+
+    async def scenario() -> list[bool]:
+        return [await visit_event_workers.process_next(db, 30) for _ in range(2)]
+
+    assert asyncio.run(scenario()) == [True, False]
+    assert [event["type"] for event in delivered] == ["visit.created", "visit.updated"]
+    assert delivered[0]["after"]["tags"] == ["카페"] and delivered[0]["before"] is None
+    assert not any(key.startswith("outbox") for key in visit)
+
+
+def test_failed_event_stays_leased_until_redelivery(monkeypatch: pytest.MonkeyPatch):
+    attempts: list[ObjectId] = []
+
+    async def flaky(_db, event: dict) -> None:
+        attempts.append(event["event_id"])
+        if len(attempts) == 1:
+            raise RuntimeError("redis down")
+
+    monkeypatch.setattr(visit_event_workers, "HANDLERS", [("flaky", flaky)])
+    visit = _created_visit([])
+    db = {visit_events.VISITS_COL: _FakeVisits([visit])}
+
+    assert asyncio.run(visit_event_workers.process_next(db, 30)) is True
+    assert len(visit["outbox"]) == 1
+    # 임대 중에는 다른 워커가 가져가지 않음
+    assert asyncio.run(visit_event_workers.process_next(db, 30)) is False
+
+    visit["outbox_lease_until"] = datetime(2000, 1, 1)
+    assert asyncio.run(visit_event_workers.process_next(db, 30)) is True
+    assert len(attempts) == 2 and attempts[0] == attempts[1]
+    assert "outbox" not in visit
+
+
+def test_redelivered_event_updates_counters_once():
+    counters = _FakeCounters()
+    db = {challenge_counters.COUNTERS_COL: counters}
+    event = _created_visit(["야경", "카페"])["outbox"][0]
+
+    async def scenario() -> None:
+        for _ in range(2):
+            await visit_event_workers._update_counters(db, event)
+
+    asyncio.run(scenario())
+    assert counters.doc["tags"] == {"야경": 1, "카페": 1}
+    assert counters.doc["applied_events"] == [event["event_id"]]
@@ -10,6 +10,7 @@ import pytest
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from backend.app.core.config import settings  # noqa: E402
 from backend.app.db import init  # noqa: E402
 from backend.app.db.mongo import MongoConnectionManager  # noqa: E402
 from backend.app.db.redis import RedisConnectionManager  # noqa: E402
@@ -42,6 +43,12 @@ class _DummyRedisClient:
         return None
 
 
+@pytest.fixture(autouse=True)
+def disable_background_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """TestClient lifespan에서 리포트 작업 등 백그라운드 워커를 띄우지 않음"""
+    monkeypatch.setattr(settings, "background_workers_enabled", False)
+
+
 @pytest.fixture(autouse=True)
 def stub_infrastructure(monkeypatch: pytest.MonkeyPatch) -> None:
     """
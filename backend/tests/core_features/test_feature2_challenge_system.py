@@ -109,3 +109,35 @@ async def test_visit_checkin_api_exists():
     except Exception:
         pass
 
+
+
+@pytest.mark.asyncio
+async def test_challenge_status_api_exists():
+    """챌린지 상태 조회 API: 장소별 위치 인증/리뷰 완료 여부가 포함된 응답 확인"""
+    signup_payload = {
+        "email": "challenge-status@example.com",
+        "password": "testpassword123",
+        "nickname": "상태유저"
+    }
+    await _request("POST", "/api/auth/signup", json=signup_payload)
+    
+    login_payload = {
+        "email": "challenge-status@example.com",
+        "password": "testpassword123"
+    }
+    login_response = await _request("POST", "/api/auth/login", json=login_payload)
+    assert login_response.status_code == 200, f"로그인 실패: {login_response.status_code}"
+    access_token = login_response.json()["access_token"]
+    
+    response = await _request(
+        "GET", "/api/challenges/status", headers={"Authorization": f"Bearer {access_token}"}
+    )
+    assert response.status_code == 200, f"예상치 못한 상태 코드: {response.status_code}"
+    
+    data = response.json()
+    assert data["points"] >= 0
+    for place in data["challenge_places"]:
+        assert isinstance(place["location_verified"], bool)
+        assert isinstance(place["review_completed"], bool)
+        # 리뷰 완료는 위치 인증 이후에만 가능
+        assert not place["review_completed"] or place["location_verified"]
@@ -0,0 +1,172 @@
+"""
+커서 페이지네이션 테스트 (DB 불필요)
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from backend.app.services.pagination import decode_cursor, encode_cursor, paginate
+
+
+class _FakeCursor:
+    def __init__(self, docs: list[dict]) -> None:
+        self.docs = docs
+        self.sort_spec: list | None = None
+        self.limit_value: int | None = None
+
+    def sort(self, spec: list) -> "_FakeCursor":
+        self.sort_spec = spec
+        return self
+
+    def limit(self, value: int) -> "_FakeCursor":
+        self.limit_value = value
+        return self
+
+    async def to_list(self, length: int) -> list[dict]:
+        return self.docs[: self.limit_value]
+
+
+class _FakeCollection:
+    def __init__(self, docs: list[dict]) -> None:
+        self.docs = docs
+        self.queries: list[dict] = []
+        self.cursor: _FakeCursor | None = None
+
+    def find(self, query: dict) -> _FakeCursor:
+        self.queries.append(query)
+        self.cursor = _FakeCursor(self.docs)
+        return self.cursor
+
+
+_COMPARE = {
+    "$gt": lambda a, b: a > b,
+    "$gte": lambda a, b: a >= b,
+    "$lt": lambda a, b: a < b,
+    "$lte": lambda a, b: a <= b,
+}
+
+
+def _matches(doc: dict, query: dict) -> bool:
+    """페이지네이션이 만드는 조건만 평가하는 간이 MongoDB 매처 (null은 필드 없음과 같고 범위 비교에서 제외)"""
+    for key, cond in query.items():
+        if key == "$and":
+            if not all(_matches(doc, sub) for sub in cond):
+                return False
+        elif key == "$or":
+            if not any(_matches(doc, sub) for sub in cond):
+                return False
+        else:
+            value = doc.get(key)
+            if not isinstance(cond, dict):
+                if value != cond:
+                    return False
+                continue
+            for op, operand in cond.items():
+                if op == "$ne":
+                    if value == operand:
+                        return False
+                elif value is None or not _COMPARE[op](value, operand):
+                    return False
+    return True
+
+
+class _QueryingCollection:
+    """find 조건과 정렬(null은 오름차순에서 맨 앞)을 실제로 적용하는 가짜 컬렉션"""
+
+    def __init__(self, docs: list[dict]) -> None:
+        self.docs = docs
+
+    def find(self, query: dict) -> _FakeCursor:
+        collection = self
+
+        class _Cursor(_FakeCursor):
+            async def to_list(self, length: int) -> list[dict]:
+                (field, direction), _ = self.sort_spec
+                matched = [doc for doc in collection.docs if _matches(doc, query)]
+                matched.sort(
+                    key=lambda doc: (doc.get(field) is not None, doc.get(field) or 0, doc["_id"]),
+                    reverse=direction < 0,
+                )
+                return matched[: self.limit_value]
+
+        return _Cursor([])
+
+
+@pytest.mark.parametrize("direction", [1, -1])
+def test_pages_cross_between_null_and_set_sort_keys(direction: int) -> None:
+    # 날짜 없는 플랜과 날짜 있는 플랜이 섞여 있어도 모든 문서를 한 번씩 돌려줌
+    docs = [{"_id": ObjectId(), "date": None if i % 3 == 0 else datetime(2024, 5, i)} for i in range(1, 11)]
+    docs.append({"_id": ObjectId()})  # 필드 없음도 null과 같이 정렬
+    collection = _QueryingCollection(docs)
+
+    async def read_all() -> list[dict]:
+        seen: list[dict] = []
+        cursor = None
+        while True:
+            page, cursor = await paginate(collection, {}, "date", direction, limit=2, cursor=cursor)
+            seen.extend(page)
+            if cursor is None:
+                return seen
+
+    seen = asyncio.run(read_all())
+    assert sorted(doc["_id"] for doc in seen) == sorted(doc["_id"] for doc in docs)
+    dated = [doc["date"] for doc in seen if doc.get("date") is not None]
+    assert dated == sorted(dated, reverse=direction < 0)
+    nulls_first = seen[0].get("date") is None
+    assert nulls_first is (direction > 0)
+
+
+def test_cursor_round_trip_keeps_datetime_and_id() -> None:
+    doc_id = ObjectId()
+    when = datetime(2024, 5, 3, 12, 30)
+    assert decode_cursor(encode_cursor(when, doc_id)) == (when, doc_id)
+    assert decode_cursor(encode_cursor("2024-05-03", doc_id)) == ("2024-05-03", doc_id)
+
+
+def test_invalid_cursor_is_rejected() -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor("not-a-cursor")
+    assert exc_info.value.status_code == 400
+
+
+def test_paginate_reads_one_extra_and_returns_next_cursor() -> None:
+    docs = [{"_id": ObjectId(), "created_at": datetime(2024, 5, 10 - i)} for i in range(3)]
+    collection = _FakeCollection(docs)
+
+    page, next_cursor = asyncio.run(paginate(collection, {"couple_id": 1}, "created_at", -1, limit=2))
+
+    assert page == docs[:2]
+    assert collection.cursor.sort_spec == [("created_at", -1), ("_id", -1)]
+    assert collection.cursor.limit_value == 3
+    assert decode_cursor(next_cursor) == (docs[1]["created_at"], docs[1]["_id"])
+
+    asyncio.run(paginate(collection, {"couple_id": 1}, "created_at", -1, limit=2, cursor=next_cursor))
+    last = docs[1]
+    assert collection.queries[-1] == {
+        "$and": [
+            {"couple_id": 1},
+            {
+                "$or": [
+                    {
+                        "$and": [
+                            {"created_at": {"$lte": last["created_at"]}},
+                            {"$or": [{"created_at": {"$lt": last["created_at"]}}, {"_id": {"$lt": last["_id"]}}]},
+                        ]
+                    },
+                    {"created_at": None},
+                ]
+            },
+        ]
+    }
+
+
+def test_last_page_has_no_cursor() -> None:
+    docs = [{"_id": ObjectId(), "date": "2024-05-01"}]
+    page, next_cursor = asyncio.run(paginate(_FakeCollection(docs), {}, "date", 1, limit=5))
+    assert page == docs
+    assert next_cursor is None
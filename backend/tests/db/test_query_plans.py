@@ -0,0 +1,289 @@
+"""
+핫 쿼리 실행 계획 테스트
+
+ensure_indexes로 인덱스를 만든 임시 데이터베이스에 데이터를 넣고,
+서비스/라우터가 실제로 보내는 쿼리의 explain() 결과에
+COLLSCAN(컬렉션 전체 스캔)이나 SORT(메모리 정렬) 단계가 있으면 실패합니다.
+
+로컬 MongoDB에 연결할 수 없으면 건너뜁니다.
+"""
+from datetime import datetime, timedelta
+from typing import Any, Iterator
+
+import pytest
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from backend.app.core.config import settings
+from backend.app.db.init import ensure_indexes
+from backend.app.services.monthly_rollups import rollup_pipeline
+from backend.app.services.visit_events import pending_events_facet
+
+COUPLE_ID = ObjectId()
+PLACE_ID = ObjectId()
+CATEGORY_ID = ObjectId()
+MONTH_START = datetime(2024, 5, 1)
+MONTH_END = datetime(2024, 6, 1)
+
+FORBIDDEN_STAGES = {"COLLSCAN", "SORT"}
+
+# (이름, explain 대상 명령) — 각 서비스 함수가 보내는 쿼리와 같은 모양
+HOT_QUERIES: list[tuple[str, dict[str, Any]]] = [
+    (
+        "verify_location: 챌린지 방문 기록 조회",
+        {"find": "visits", "filter": {"couple_id": COUPLE_ID, "challenge_place_id": PLACE_ID}, "limit": 1},
+    ),
+    (
+        "add_visit: 리뷰 전 위치 인증 방문 기록 조회",
+        {
+            "find": "visits",
+            "filter": {
+                "couple_id": COUPLE_ID,
+                "challenge_place_id": PLACE_ID,
+                "location_verified": True,
+                "review_completed": {"$ne": True},
+            },
+            "limit": 1,
+        },
+    ),
+    (
+        "grant_rewards: 배지 미보유 커플 조건부 지급",
+        {"find": "couples", "filter": {"_id": COUPLE_ID, "badges": {"$ne": "🏯"}}, "limit": 1},
+    ),
+    (
+        "get_challenge_visit_flags: 챌린지 상태 집계",
+        {
+            "aggregate": "visits",
+            "pipeline": [
+                {"$match": {"couple_id": COUPLE_ID, "challenge_place_id": {"$ne": None}}},
+                {
+                    "$group": {
+                        "_id": "$challenge_place_id",
+                        "location_verified": {"$max": {"$eq": ["$location_verified", True]}},
+                        "review_completed": {"$max": {"$eq": ["$review_completed", True]}},
+                    }
+                },
+            ],
+            "cursor": {},
+        },
+    ),
+    (
+        "rebuild_rollup: 월간 방문 집계 재생성",
+        {
+            "aggregate": "visits",
+            "pipeline": rollup_pipeline(COUPLE_ID, MONTH_START, MONTH_END),
+            "cursor": {},
+        },
+    ),
+    (
+        "build_monthly_report: 플랜 감정 목표",
+        {
+            "distinct": "plans",
+            "key": "emotion_goal",
+            "query": {"couple_id": COUPLE_ID, "emotion_goal": {"$nin": [None, "", "미정"]}},
+        },
+    ),
+    (
+        "pregenerate_monthly_reports: 월별 대상 커플",
+        {"distinct": "visits", "key": "couple_id", "query": {"created_at": {"$gte": MONTH_START, "$lt": MONTH_END}}},
+    ),
+    (
+        "list_visits: 최근 방문 기록",
+        {"find": "visits", "filter": {"couple_id": COUPLE_ID}, "sort": {"visited_at": -1, "_id": -1}, "limit": 51},
+    ),
+    (
+        "list_visits: 커서 이후 페이지",
+        {
+            "find": "visits",
+            "filter": {
+                "$and": [
+                    {"couple_id": COUPLE_ID},
+                    {
+                        "$or": [
+                            {
+                                "$and": [
+                                    {"visited_at": {"$lte": MONTH_START + timedelta(days=10)}},
+                                    {
+                                        "$or": [
+                                            {"visited_at": {"$lt": MONTH_START + timedelta(days=10)}},
+                                            {"_id": {"$lt": PLACE_ID}},
+                                        ]
+                                    },
+                                ]
+                            },
+                            {"visited_at": None},
+                        ]
+                    },
+                ]
+            },
+            "sort": {"visited_at": -1, "_id": -1},
+            "limit": 51,
+        },
+    ),
+    (
+        "rebuild_counters: 태그/감정 카운터 재집계",
+        {
+            "aggregate": "visits",
+            "pipeline": [
+                {"$match": {"couple_id": COUPLE_ID}},
+                {
+                    "$facet": {
+                        "tags": [{"$unwind": "$tags"}, {"$group": {"_id": "$tags", "n": {"$sum": 1}}}],
+                        **pending_events_facet(),
+                    }
+                },
+            ],
+            "cursor": {},
+        },
+    ),
+    (
+        "get_saved_reports: 저장된 리포트 목록",
+        {"find": "saved_reports", "filter": {"couple_id": COUPLE_ID}, "sort": {"created_at": -1, "_id": -1}, "limit": 51},
+    ),
+    (
+        "list_bookmarks: 북마크 목록",
+        {"find": "bookmarks", "filter": {"couple_id": COUPLE_ID}, "sort": {"created_at": -1, "_id": -1}, "limit": 51},
+    ),
+    (
+        "list_plans: 데이트 일정 목록",
+        {"find": "plans", "filter": {"couple_id": COUPLE_ID}, "sort": {"date": 1, "_id": 1}, "limit": 51},
+    ),
+    (
+        "list_challenge_places: 활성 챌린지 장소",
+        {"find": "challenge_places", "filter": {"active": True}, "sort": {"created_at": 1}},
+    ),
+    (
+        "list_challenge_places: 카테고리별 활성 챌린지 장소",
+        {"find": "challenge_places", "filter": {"active": True, "category_id": CATEGORY_ID}, "sort": {"created_at": 1}},
+    ),
+    (
+        "list_nearby_challenge_places: 반경 내 활성 챌린지 장소",
+        {
+            "aggregate": "challenge_places",
+            "pipeline": [
+                {
+                    "$geoNear": {
+                        "near": {"type": "Point", "coordinates": [127.0, 37.28]},
+                        "key": "location",
+                        "distanceField": "distance_meters",
+                        "maxDistance": 3000,
+                        "query": {"active": True},
+                        "spherical": True,
+                    }
+                },
+                {"$limit": 50},
+            ],
+            "cursor": {},
+        },
+    ),
+    (
+        "list_challenge_categories: 활성 카테고리",
+        {"find": "challenge_categories", "filter": {"active": True}, "sort": {"created_at": 1}},
+    ),
+    (
+        "claim_pending: 처리할 방문 이벤트",
+        {
+            "find": "visits",
+            "filter": {
+                "outbox_pending": True,
+                "$or": [{"outbox_lease_until": None}, {"outbox_lease_until": {"$lte": MONTH_END}}],
+            },
+            "limit": 1,
+        },
+    ),
+    (
+        "load_rules: 활성 챌린지 규칙",
+        {"find": "challenge_rules", "filter": {"active": True}, "sort": {"created_at": 1}},
+    ),
+]
+
+
+def _plan_stages(node: Any) -> Iterator[str]:
+    """explain 결과에서 선택된 계획의 단계 이름을 모두 꺼냅니다. (rejectedPlans 제외)"""
+    if isinstance(node, dict):
+        if isinstance(node.get("stage"), str):
+            yield node["stage"]
+        for key, value in node.items():
+            if key != "rejectedPlans":
+                yield from _plan_stages(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _plan_stages(item)
+
+
+async def _seed(db) -> None:
+    other_couple = ObjectId()
+    visits = []
+    for index in range(40):
+        couple_id = COUPLE_ID if index % 2 == 0 else other_couple
+        created_at = MONTH_START + timedelta(days=index % 28)
+        visits.append(
+            {
+                "couple_id": couple_id,
+                "challenge_place_id": PLACE_ID if index % 4 == 0 else None,
+                "location_verified": index % 3 == 0,
+                "review_completed": index % 5 == 0,
+                "rating": 4 if index % 5 == 0 else None,
+                "memo": "좋았어요" if index % 5 == 0 else "",
+                "tags": ["카페"],
+                "emotion": "설렘",
+                "visited_at": created_at,
+                "created_at": created_at,
+            }
+        )
+    await db["visits"].insert_many(visits)
+    await db["saved_reports"].insert_many(
+        [{"couple_id": COUPLE_ID, "month": f"2024-{m:02d}", "created_at": datetime(2024, m, 1)} for m in range(1, 6)]
+    )
+    await db["bookmarks"].insert_many([{"couple_id": COUPLE_ID, "created_at": MONTH_START + timedelta(days=d)} for d in range(5)])
+    await db["plans"].insert_many([{"couple_id": COUPLE_ID, "date": MONTH_START + timedelta(days=d)} for d in range(5)])
+    await db["challenge_places"].insert_many(
+        [
+            {
+                "active": d % 2 == 0,
+                "category_id": CATEGORY_ID,
+                "location": {"type": "Point", "coordinates": [127.0 + d * 0.01, 37.28]},
+                "created_at": MONTH_START + timedelta(days=d),
+            }
+            for d in range(6)
+        ]
+    )
+    await db["challenge_categories"].insert_many(
+        [{"active": True, "created_at": MONTH_START + timedelta(days=d)} for d in range(3)]
+    )
+    await db["challenge_rules"].insert_many(
+        [{"_id": f"rule_{d}", "active": True, "created_at": MONTH_START + timedelta(days=d)} for d in range(3)]
+    )
+
+
+@pytest.fixture
+async def seeded_db():
+    client = AsyncIOMotorClient(settings.mongodb_uri, serverSelectionTimeoutMS=2000)
+    try:
+        await client.admin.command("ping")
+    except Exception as exc:
+        client.close()
+        pytest.skip(f"MongoDB에 연결할 수 없습니다: {exc}")
+
+    db = client[f"{settings.mongodb_db}_query_plans"]
+    await client.drop_database(db.name)
+    try:
+        await ensure_indexes(db)
+        await _seed(db)
+        yield db
+    finally:
+        await client.drop_database(db.name)
+        client.close()
+
+
+@pytest.mark.asyncio
+async def test_hot_queries_use_indexes(seeded_db):
+    """핫 쿼리가 모두 인덱스로 조회·정렬되는지 확인"""
+    failures = []
+    for name, command in HOT_QUERIES:
+        explain = await seeded_db.command({"explain": command, "verbosity": "queryPlanner"})
+        bad = FORBIDDEN_STAGES.intersection(_plan_stages(explain))
+        if bad:
+            failures.append(f"{name}: {sorted(bad)}")
+
+    assert not failures, "인덱스를 타지 않는 쿼리:\n" + "\n".join(failures)
@@ -0,0 +1,70 @@
+"""
+지역명 자동완성 테스트
+- 자모 분해 및 prefix trie 매칭/정렬 검증
+- GET /api/geo/autocomplete 응답 형식 확인
+"""
+import time
+
+import httpx
+import pytest
+from asgi_lifespan import LifespanManager
+
+from backend.app.main import app
+from backend.app.services.autocomplete import AutocompleteEntry, PrefixTrie, decompose
+
+
+def _trie() -> PrefixTrie:
+    return PrefixTrie(
+        [
+            AutocompleteEntry(name="강남역", kind="region", popularity=95, latitude=37.4979, longitude=127.0276),
+            AutocompleteEntry(name="강남구청", kind="region", popularity=40),
+            AutocompleteEntry(name="강릉", kind="region", popularity=60),
+            AutocompleteEntry(name="수원 남문시장", kind="challenge", popularity=55),
+            AutocompleteEntry(name="닭갈비 골목", kind="place", popularity=10),
+        ]
+    )
+
+
+def test_decompose_splits_syllables_into_jamo():
+    assert decompose("강남") == "ㄱㅏㅇㄴㅏㅁ"
+    assert decompose("과 자") == "ㄱㅗㅏㅈㅏ"
+    assert decompose("닭") == "ㄷㅏㄹㄱ"
+
+
+def test_partial_syllable_prefix_matches():
+    trie = _trie()
+    assert [e.name for e in trie.search("강나")] == ["강남역", "강남구청"]
+    assert [e.name for e in trie.search("강남ㅇ")] == ["강남역"]
+    assert [e.name for e in trie.search("달")] == ["닭갈비 골목"]
+
+
+def test_results_are_ranked_by_popularity():
+    assert [e.name for e in _trie().search("강")] == ["강남역", "강릉", "강남구청"]
+
+
+def test_word_start_and_exact_lookup():
+    trie = _trie()
+    assert [e.name for e in trie.search("남문")] == ["수원 남문시장"]
+    assert trie.lookup("강남 역").name == "강남역"
+    assert trie.lookup("강남") is None
+    assert trie.search("없는지명") == []
+
+
+def test_search_is_sub_millisecond():
+    entries = [AutocompleteEntry(name=f"장소{i}번길 카페", kind="place", popularity=i) for i in range(5000)]
+    trie = PrefixTrie(entries)
+    started = time.perf_counter()
+    for _ in range(1000):
+        trie.search("장소12")
+    assert (time.perf_counter() - started) / 1000 < 0.001
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_endpoint_returns_suggestions():
+    async with LifespanManager(app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client:
+            response = await client.get("/api/geo/autocomplete", params={"q": "광ㄱ"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["query"] == "광ㄱ"
+    assert any(s["name"] == "광교역" for s in data["suggestions"])
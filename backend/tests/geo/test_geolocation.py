@@ -0,0 +1,73 @@
+"""
+벡터화된 거리 계산 유틸리티 테스트 (DB 불필요)
+"""
+import random
+
+import numpy as np
+
+from backend.app.services.geolocation import (
+    bounding_box,
+    bounding_box_mask,
+    calculate_distance,
+    equirectangular_one_to_many,
+    haversine_matrix,
+    haversine_one_to_many,
+    is_within_radius,
+    within_radius_mask,
+)
+
+SUWON = (37.2636, 127.0286)
+
+
+def _random_points(rng: random.Random, center: tuple[float, float], spread: float, n: int):
+    lats = [center[0] + rng.uniform(-spread, spread) for _ in range(n)]
+    lons = [center[1] + rng.uniform(-spread, spread) for _ in range(n)]
+    return lats, lons
+
+
+def test_one_to_many_and_matrix_match_scalar_haversine():
+    rng = random.Random(1)
+    lats, lons = _random_points(rng, SUWON, 0.5, 50)
+    distances = haversine_one_to_many(*SUWON, lats, lons)
+    expected = [calculate_distance(*SUWON, lat, lon) for lat, lon in zip(lats, lons)]
+    np.testing.assert_allclose(distances, expected, rtol=1e-12, atol=1e-6)
+
+    matrix = haversine_matrix(lats[:5], lons[:5], lats, lons)
+    assert matrix.shape == (5, 50)
+    for i in range(5):
+        np.testing.assert_allclose(matrix[i], haversine_one_to_many(lats[i], lons[i], lats, lons), atol=1e-6)
+
+
+def test_equirectangular_error_bound():
+    rng = random.Random(2)
+    lats, lons = _random_points(rng, SUWON, 0.3, 500)
+    exact = haversine_one_to_many(*SUWON, lats, lons)
+    approx = equirectangular_one_to_many(*SUWON, lats, lons)
+    assert exact.max() < 50_000
+    assert np.all(np.abs(approx - exact) <= exact * 3e-5)
+
+
+def test_bounding_box_never_drops_points_in_radius():
+    rng = random.Random(3)
+    for center in (SUWON, (0.0, 179.99), (-60.0, -179.995), (89.99, 10.0)):
+        lats, lons = _random_points(rng, center, 0.05, 2000)
+        lats = np.clip(lats, -90, 90)
+        lons = (np.asarray(lons) + 180) % 360 - 180
+        inside = haversine_one_to_many(*center, lats, lons) <= 2000
+        assert not np.any(inside & ~bounding_box_mask(*center, lats, lons, 2000))
+
+
+def test_bounding_box_covers_circle():
+    min_lat, min_lon, max_lat, max_lon = bounding_box(*SUWON, 1000)
+    assert min_lat < SUWON[0] < max_lat and min_lon < SUWON[1] < max_lon
+    assert calculate_distance(*SUWON, max_lat, SUWON[1]) >= 999.999
+    assert bounding_box(0.0, 179.999, 1000)[1::2] == (-180.0, 180.0)
+
+
+def test_within_radius_mask_matches_is_within_radius():
+    rng = random.Random(4)
+    lats, lons = _random_points(rng, SUWON, 0.02, 1000)
+    mask = within_radius_mask(*SUWON, lats, lons, radius_meters=1000)
+    expected = [is_within_radius(*SUWON, lat, lon, radius_meters=1000) for lat, lon in zip(lats, lons)]
+    assert mask.tolist() == expected
+    assert 0 < mask.sum() < len(lats)
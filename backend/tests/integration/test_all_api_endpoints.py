@@ -211,6 +211,16 @@ async def test_reports_endpoint():
     assert response.status_code == 200
     data = response.json()
     assert "month" in data or "visit_count" in data
+    
+    # AI 요약 비동기 작업 등록 및 상태 조회
+    response = await _request("POST", "/api/reports/jobs", headers=headers)
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] in {"queued", "running", "retrying", "succeeded", "failed"}
+    
+    response = await _request("GET", f"/api/reports/jobs/{job['job_id']}", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["job_id"] == job["job_id"]
 
 
 @pytest.mark.asyncio
@@ -62,7 +62,9 @@ def configure_journey(monkeypatch: pytest.MonkeyPatch) -> Callable[[], None]:
     async def fake_get_or_create_couple(_db: Any, user_id: str) -> dict[str, Any]:
         return {"_id": "couple-1", "members": [user_id]}
 
-    async def fake_build_monthly_report(_db: Any, couple_id: str, month: str) -> dict[str, Any]:
+    async def fake_build_monthly_report(
+        _db: Any, couple_id: str, month: str, include_summary: bool = False
+    ) -> dict[str, Any]:
         return {
             "month": month,
             "visit_count": 5,
@@ -105,7 +107,7 @@ def configure_journey(monkeypatch: pytest.MonkeyPatch) -> Callable[[], None]:
     monkeypatch.setattr(reports, "build_monthly_report", fake_build_monthly_report)
     monkeypatch.setattr(users, "get_user_by_id", fake_get_user_by_id)
     monkeypatch.setattr(reports_route, "get_or_create_couple", fake_get_or_create_couple)
-    monkeypatch.setattr(reports_route, "build_monthly_report", fake_build_monthly_report)
+    monkeypatch.setattr(reports_route, "get_or_build_monthly_report", fake_build_monthly_report)
 
     def cleanup() -> None:
         app.dependency_overrides.clear()
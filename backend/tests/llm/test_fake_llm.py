@@ -0,0 +1,90 @@
+"""
+가짜 LLM 서버가 Gemini 호출 경로와 호환되는지 확인하는 테스트
+"""
+from __future__ import annotations
+
+import random
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from backend.app.core.config import settings
+from backend.app.services import llm
+from backend.app.services.fake_llm import FakeLLMConfig, create_fake_llm_app, sample_latency
+
+# conftest의 mock_llm_service가 교체하기 전의 실제 Gemini 호출 함수
+_REAL_INVOKE_GEMINI = llm._invoke_gemini
+
+
+@pytest.fixture
+def use_fake_llm(monkeypatch: pytest.MonkeyPatch):
+    def _use(config: FakeLLMConfig) -> None:
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=create_fake_llm_app(config)),
+            base_url="http://fake-llm",
+        )
+        monkeypatch.setattr(llm, "_invoke_gemini", _REAL_INVOKE_GEMINI)
+        monkeypatch.setattr(llm.GeminiClientManager, "client", client)
+        monkeypatch.setattr(settings, "gemini_api_key", "fake")
+        monkeypatch.setattr(settings, "llm_cache_enabled", False)
+
+    return _use
+
+
+async def test_itinerary_through_fake_server_matches_contract(use_fake_llm):
+    use_fake_llm(FakeLLMConfig(latency_distribution="fixed", latency_ms=0, seed=1))
+
+    suggestions = await llm.generate_itinerary_suggestions(
+        {"emotion": "설렘", "preferences": "카페, 야경", "location": "성수동", "additional_context": ""}
+    )
+
+    assert len(suggestions) == 3
+    for item in suggestions:
+        assert item["title"] and item["description"]
+        assert len(item["suggested_places"]) == 3
+        assert item["tips"]
+    assert "성수동" in suggestions[0]["title"]
+
+
+async def test_report_summary_through_fake_server(use_fake_llm):
+    use_fake_llm(FakeLLMConfig(latency_distribution="fixed", latency_ms=0, seed=1))
+
+    summary = await llm.generate_report_summary({"month": "2025-04", "visit_count": 3})
+
+    assert summary
+
+
+async def test_injected_errors_surface_as_bad_gateway(use_fake_llm):
+    use_fake_llm(FakeLLMConfig(latency_distribution="fixed", latency_ms=0, error_rate=1.0, seed=1))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await llm.generate_report_summary({"month": "2025-04", "visit_count": 3})
+    assert exc_info.value.status_code == 502
+
+
+async def test_malformed_responses_fail_itinerary_parsing(use_fake_llm):
+    use_fake_llm(FakeLLMConfig(latency_distribution="fixed", latency_ms=0, malformed_rate=1.0, seed=1))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await llm.generate_itinerary_suggestions({"emotion": "설렘", "preferences": "카페", "location": "성수동"})
+    assert "파싱 실패" in exc_info.value.detail
+
+
+def test_latency_distributions():
+    rng = random.Random(7)
+    assert sample_latency(FakeLLMConfig(latency_distribution="fixed", latency_ms=250), rng) == 0.25
+
+    uniform = FakeLLMConfig(latency_distribution="uniform", latency_ms=1000, latency_spread=0.2)
+    samples = [sample_latency(uniform, rng) for _ in range(200)]
+    assert all(0.8 <= s <= 1.2 for s in samples)
+
+    lognormal = FakeLLMConfig(latency_distribution="lognormal", latency_ms=1000, latency_spread=0.5)
+    samples = sorted(sample_latency(lognormal, rng) for _ in range(2000))
+    assert 0.85 < samples[len(samples) // 2] < 1.15
+    assert samples[-1] > 1.5
+
+
+def test_unknown_distribution_rejected():
+    with pytest.raises(ValueError):
+        FakeLLMConfig(latency_distribution="pareto")
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from backend.app.core.config import settings
+from backend.app.db.redis import RedisConnectionManager
+from backend.app.services import llm, llm_cache
+
+
+class _FakePipeline:
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, tuple]] = []
+
+    async def __aenter__(self) -> "_FakePipeline":
+        return self
+
+    async def __aexit__(self, *_exc: Any) -> None:
+        return None
+
+    def rpush(self, key: str, value: str) -> None:
+        self._ops.append(("rpush", (key, value)))
+
+    def ltrim(self, key: str, start: int, end: int) -> None:
+        self._ops.append(("ltrim", (key, start, end)))
+
+    def expire(self, key: str, ttl: int) -> None:
+        self._ops.append(("expire", (key, ttl)))
+
+    async def execute(self) -> None:
+        for op, args in self._ops:
+            if op == "rpush":
+                self._redis.lists.setdefault(args[0], []).append(args[1])
+            elif op == "ltrim":
+                key, start, _end = args
+                self._redis.lists[key] = self._redis.lists[key][start:]
+            else:
+                self._redis.ttls[args[0]] = args[1]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.lists: dict[str, list[str]] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def llen(self, key: str) -> int:
+        return len(self.lists.get(key, []))
+
+    async def lindex(self, key: str, index: int) -> str | None:
+        items = self.lists.get(key, [])
+        return items[index] if index < len(items) else None
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedis:
+    redis = _FakeRedis()
+    monkeypatch.setattr(RedisConnectionManager, "get_client", classmethod(lambda cls: redis))
+    return redis
+
+
+def test_cache_key_is_canonical() -> None:
+    a = llm_cache.make_key("report", "m", {"month": "2025-04", "notes": " 메모 "})
+    b = llm_cache.make_key("report", "m", {"notes": "메모", "month": "2025-04"})
+    c = llm_cache.make_key("report", "other-model", {"notes": "메모", "month": "2025-04"})
+    assert a == b
+    assert a != c
+
+
+def test_itinerary_cache_collects_variants_before_serving(monkeypatch: pytest.MonkeyPatch, fake_redis: _FakeRedis) -> None:
+    monkeypatch.setattr(settings, "llm_cache_itinerary_variants", 2)
+    calls = 0
+
+    async def fake_invoke(_prompt: str, kind: str) -> tuple[str, str]:
+        nonlocal calls
+        calls += 1
+        text = f'[{{"title": "코스 {calls}", "description": "", "suggested_places": [], "tips": []}}]'
+        return text, llm.llm_router.preferred_model(kind)
+
+    monkeypatch.setattr(llm, "_invoke", fake_invoke)
+    payload = {"emotion": "설렘", "preferences": "카페, 야경", "location": "홍대", "additional_context": ""}
+    reordered = {**payload, "preferences": "야경, 카페"}
+
+    async def run() -> list:
+        results = [await llm.generate_itinerary_suggestions(payload) for _ in range(2)]
+        results += [await llm.generate_itinerary_suggestions(reordered) for _ in range(5)]
+        return results
+
+    results = asyncio.run(run())
+    assert calls == 2
+    assert {r[0]["title"] for r in results} <= {"코스 1", "코스 2"}
+    (key,) = fake_redis.lists
+    assert fake_redis.ttls[key] == settings.llm_cache_ttl_seconds
+
+
+def test_report_summary_is_cached(monkeypatch: pytest.MonkeyPatch, fake_redis: _FakeRedis) -> None:
+    calls = 0
+
+    async def fake_invoke(_prompt: str, kind: str) -> tuple[str, str]:
+        nonlocal calls
+        calls += 1
+        return " 요약입니다. ", llm.llm_router.preferred_model(kind)
+
+    monkeypatch.setattr(llm, "_invoke", fake_invoke)
+    payload = {"month": "2025-04", "visit_count": 3, "top_tags": ["카페"], "emotion_stats": {"설렘": 2}}
+
+    async def run() -> list[str]:
+        return [await llm.generate_report_summary(payload) for _ in range(3)]
+
+    assert asyncio.run(run()) == ["요약입니다."] * 3
+    assert calls == 1
+
+
+def test_fallback_model_answer_is_not_cached(monkeypatch: pytest.MonkeyPatch, fake_redis: _FakeRedis) -> None:
+    calls = 0
+
+    async def fake_invoke(_prompt: str, _kind: str) -> tuple[str, str]:
+        nonlocal calls
+        calls += 1
+        return "대체 모델 요약", "fallback-model"
+
+    monkeypatch.setattr(llm, "_invoke", fake_invoke)
+    payload = {"month": "2025-04", "visit_count": 3, "top_tags": ["카페"], "emotion_stats": {"설렘": 2}}
+
+    async def run() -> list[str]:
+        return [await llm.generate_report_summary(payload) for _ in range(2)]
+
+    assert asyncio.run(run()) == ["대체 모델 요약"] * 2
+    assert calls == 2
+    assert fake_redis.lists == {}
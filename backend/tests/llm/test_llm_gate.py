@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from backend.app.services.llm_gate import LLMConcurrencyGate
+
+
+def test_gate_limits_concurrency_and_records_wait() -> None:
+    gate = LLMConcurrencyGate("test", max_concurrency=2, max_queue=10, queue_timeout=5)
+    peak = 0
+
+    async def call() -> None:
+        nonlocal peak
+        async with gate.slot():
+            peak = max(peak, gate.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def run() -> None:
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(run())
+    snapshot = gate.snapshot()
+    assert peak == 2
+    assert snapshot["completed"] == 6
+    assert snapshot["in_flight"] == 0 and snapshot["queue_depth"] == 0
+    assert snapshot["wait_seconds"]["count"] == 6
+
+
+def test_gate_rejects_when_queue_is_full() -> None:
+    gate = LLMConcurrencyGate("test", max_concurrency=1, max_queue=1, queue_timeout=5)
+
+    async def call() -> None:
+        async with gate.slot():
+            await asyncio.sleep(0.05)
+
+    async def run() -> list:
+        return await asyncio.gather(*(call() for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(run())
+    rejected = [r for r in results if isinstance(r, HTTPException)]
+    assert len(rejected) == 1 and rejected[0].status_code == 503
+    assert gate.snapshot()["rejected"] == 1
+
+
+def test_gate_times_out_waiting_callers() -> None:
+    gate = LLMConcurrencyGate("test", max_concurrency=1, max_queue=5, queue_timeout=0.01)
+
+    async def hold() -> None:
+        async with gate.slot():
+            await asyncio.sleep(0.1)
+
+    async def run() -> None:
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException):
+            async with gate.slot():
+                pass
+        await holder
+
+    asyncio.run(run())
+    assert gate.snapshot()["timed_out"] == 1
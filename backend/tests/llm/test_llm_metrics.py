@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import HTTPException
+
+from backend.app.core.config import settings
+from backend.app.services import llm
+from backend.app.services.llm_metrics import LLMMetrics, record_usage
+
+
+@pytest.fixture
+def metrics(monkeypatch: pytest.MonkeyPatch) -> LLMMetrics:
+    fresh = LLMMetrics(sample_size=10)
+    monkeypatch.setattr(llm, "llm_metrics", fresh)
+    monkeypatch.setattr(settings, "llm_cache_enabled", False)
+    monkeypatch.setattr(settings, "llm_sample_rate", 0.0)
+    return fresh
+
+
+async def test_records_tokens_latency_and_provider(monkeypatch, metrics):
+    async def fake_gemini(prompt: str) -> str:
+        record_usage(120, 40)
+        return '[{"title": "코스", "description": "", "suggested_places": [], "tips": []}]'
+
+    monkeypatch.setattr(llm, "_invoke_gemini", fake_gemini)
+    await llm.generate_itinerary_suggestions({"emotion": "설렘", "preferences": "카페", "location": "성수동"})
+
+    stats = metrics.snapshot()["itinerary"]
+    assert stats["outcomes"] == {"ok": 1}
+    assert stats["cache_misses"] == 1
+    assert stats["latency_seconds"]["count"] == 1
+    assert stats["prompt_tokens"]["sum"] == 120
+    assert stats["output_tokens"]["sum"] == 40
+    assert metrics.recent_samples() == []  # 정상 호출은 샘플링 비율(0)에 따름
+
+
+async def test_parse_failure_is_counted_and_sampled(monkeypatch, metrics):
+    async def fake_gemini(prompt: str) -> str:
+        return "JSON이 아닌 응답"
+
+    monkeypatch.setattr(llm, "_invoke_gemini", fake_gemini)
+    with pytest.raises(HTTPException):
+        await llm.generate_itinerary_suggestions({"emotion": "설렘", "preferences": "카페", "location": "성수동"})
+
+    assert metrics.snapshot()["itinerary"]["outcomes"] == {"parse_error": 1}
+    [sample] = metrics.recent_samples(outcome="parse_error")
+    assert sample["provider"] == "gemini"
+    assert sample["output"] == "JSON이 아닌 응답"
+    assert sample["prompt_chars"] > 0
+    assert sample["tokens_estimated"] is True
+
+
+async def test_provider_error_is_counted(monkeypatch, metrics):
+    async def fake_gemini(prompt: str) -> str:
+        raise HTTPException(status_code=502, detail="down")
+
+    monkeypatch.setattr(llm, "_invoke_gemini", fake_gemini)
+    with pytest.raises(HTTPException):
+        await llm.generate_report_summary({"month": "2025-04"})
+
+    assert metrics.snapshot()["report"]["outcomes"] == {"error": 1}
+    assert metrics.recent_samples(kind="report")[0]["error"] == "down"
+
+
+async def test_cache_hit_is_counted(monkeypatch, metrics):
+    async def cached(_key: str, _variants: int) -> str:
+        return "캐시된 요약"
+
+    monkeypatch.setattr(llm.llm_cache, "get_cached", cached)
+    assert await llm.generate_report_summary({"month": "2025-04"}) == "캐시된 요약"
+
+    stats = metrics.snapshot()["report"]
+    assert (stats["cache_hits"], stats["cache_misses"]) == (1, 0)
+    assert stats["latency_seconds"]["count"] == 0
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from backend.app.core.config import settings
+from backend.app.services import llm
+from backend.app.services.llm_gate import LLMConcurrencyGate
+from backend.app.services.llm_router import LLMProvider, LLMRouter
+
+
+def _provider(name: str, delay: float = 0.0, fail: bool = False) -> LLMProvider:
+    async def call(prompt: str) -> str:
+        await asyncio.sleep(delay)
+        if fail:
+            raise HTTPException(status_code=502, detail=f"{name} down")
+        return f"{name}:{prompt}"
+
+    gate = LLMConcurrencyGate(name, max_concurrency=2, max_queue=2, queue_timeout=1.0)
+    return LLMProvider(name, f"{name}-model", gate, call)
+
+
+@pytest.fixture
+def route(monkeypatch: pytest.MonkeyPatch):
+    def _route(itinerary: str, hedge_after: float = 0.0) -> None:
+        monkeypatch.setattr(settings, "llm_route_itinerary", itinerary)
+        monkeypatch.setattr(settings, "llm_hedge_after_seconds", hedge_after)
+
+    return _route
+
+
+async def test_uses_configured_order_without_observations(route):
+    route("ollama,gemini")
+    router = LLMRouter([_provider("gemini"), _provider("ollama")])
+
+    text, provider = await router.invoke("hi", "itinerary")
+
+    assert (text, provider.name) == ("ollama:hi", "ollama")
+    assert router.preferred_model("itinerary") == "ollama-model"
+
+
+async def test_fails_over_and_demotes_erroring_provider(route):
+    route("ollama,gemini")
+    ollama = _provider("ollama", fail=True)
+    router = LLMRouter([_provider("gemini"), ollama])
+
+    text, provider = await router.invoke("hi", "itinerary")
+
+    assert provider.name == "gemini"
+    assert ollama.errors == 1
+    for _ in range(5):
+        await router.invoke("hi", "itinerary")
+    assert router.candidates("itinerary")[0].name == "gemini"
+
+
+async def test_routes_away_from_slow_provider(route):
+    route("ollama,gemini")
+    ollama, gemini = _provider("ollama"), _provider("gemini")
+    ollama.latency_ewma, gemini.latency_ewma = 5.0, 0.5
+    router = LLMRouter([gemini, ollama])
+
+    assert [p.name for p in router.candidates("itinerary")] == ["gemini", "ollama"]
+
+
+async def test_hedges_slow_primary(route):
+    route("ollama,gemini", hedge_after=0.02)
+    ollama = _provider("ollama", delay=1.0)
+    router = LLMRouter([_provider("gemini"), ollama])
+
+    text, provider = await asyncio.wait_for(router.invoke("hi", "itinerary"), timeout=0.5)
+
+    assert provider.name == "gemini"
+    await asyncio.sleep(0)
+    assert ollama.errors == 0  # 취소된 호출은 오류로 세지 않음
+    assert ollama.gate.in_flight == 0
+
+
+async def test_raises_last_error_when_all_fail(route):
+    route("ollama,gemini")
+    router = LLMRouter([_provider("gemini", fail=True), _provider("ollama", fail=True)])
+
+    with pytest.raises(HTTPException) as exc_info:
+        await router.invoke("hi", "itinerary")
+    assert exc_info.value.status_code == 502
+
+
+async def test_unknown_route_defaults_to_gemini(route):
+    route("unknown")
+    router = LLMRouter([_provider("gemini"), _provider("ollama")])
+
+    _text, provider = await router.invoke("hi", "itinerary")
+    assert provider.name == "gemini"
+
+
+async def test_default_route_uses_mocked_gemini():
+    suggestions = await llm.generate_itinerary_suggestions({"emotion": "설렘", "preferences": "카페", "location": "성수동"})
+    assert suggestions
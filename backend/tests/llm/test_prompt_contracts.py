@@ -51,8 +51,8 @@ def test_itinerary_prompt_contract(monkeypatch: pytest.MonkeyPatch, itinerary_pa
     ]
     """
 
-    async def fake_invoke(_template: Any, _payload: dict[str, Any]) -> str:
-        return sample_response
+    async def fake_invoke(_template: Any, kind: str) -> tuple[str, str]:
+        return sample_response, llm.llm_router.preferred_model(kind)
 
     monkeypatch.setattr(llm, "_invoke", fake_invoke)
 
@@ -66,8 +66,8 @@ def test_itinerary_prompt_contract(monkeypatch: pytest.MonkeyPatch, itinerary_pa
 def test_report_prompt_contract(monkeypatch: pytest.MonkeyPatch) -> None:
     sample_summary = "이번 달에는 방문 횟수가 늘어났고, 서로의 취향을 더 잘 이해하게 되었어요. 다음 달에는 새로운 활동에 도전해 보세요."
 
-    async def fake_invoke(_template: Any, _payload: dict[str, Any]) -> str:
-        return sample_summary
+    async def fake_invoke(_template: Any, kind: str) -> tuple[str, str]:
+        return sample_summary, llm.llm_router.preferred_model(kind)
 
     monkeypatch.setattr(llm, "_invoke", fake_invoke)
 
@@ -0,0 +1,75 @@
+"""
+템플릿 코스 생성기와 LLM 마감 경쟁 테스트 (DB 불필요)
+"""
+from __future__ import annotations
+
+import asyncio
+
+from fastapi import HTTPException
+
+from backend.app.services.course_templates import build_template_courses, race_llm_with_template
+from backend.app.services.weather import WeatherCondition, get_weather_based_suggestions
+
+PLACES = [{"place_name": f"장소{i}", "category_name": "cafe"} for i in range(1, 8)]
+LLM_COURSES = [{"title": "LLM 코스", "description": "", "suggested_places": [], "tips": []}]
+
+
+def _template(places=PLACES):
+    return build_template_courses(
+        places,
+        get_weather_based_suggestions(WeatherCondition.RAINY),
+        "3~8만원",
+        location="성수동",
+        emotion="설렘",
+    )
+
+
+def test_template_builds_three_distinct_courses():
+    courses = _template()
+
+    assert len(courses) == 3
+    assert courses[0]["suggested_places"] == ["장소1", "장소4", "장소7"]
+    assert courses[1]["suggested_places"][0] == "장소2"
+    assert all(c["title"].startswith("성수동") for c in courses)
+    assert all(c["tips"] for c in courses)
+    assert courses[0]["estimated_total_cost"] == 45000
+    assert courses == _template()  # 결정적
+
+
+def test_template_reuses_places_when_few():
+    courses = _template(PLACES[:2])
+
+    assert len(courses) == 3
+    assert all(len(c["suggested_places"]) == 2 for c in courses)
+
+
+async def test_race_returns_llm_when_fast():
+    async def fast():
+        return LLM_COURSES
+
+    suggestions, source = await race_llm_with_template(fast(), _template(), deadline=1.0)
+    assert (suggestions, source) == (LLM_COURSES, "llm")
+
+
+async def test_race_returns_template_after_deadline_and_keeps_llm_running():
+    finished = asyncio.Event()
+
+    async def slow():
+        await asyncio.sleep(0.1)
+        finished.set()
+        return LLM_COURSES
+
+    template = _template()
+    suggestions, source = await race_llm_with_template(slow(), template, deadline=0.01)
+    assert (suggestions, source) == (template, "template")
+
+    await asyncio.wait_for(finished.wait(), timeout=1.0)
+
+
+async def test_race_falls_back_on_llm_error():
+    async def failing():
+        raise HTTPException(status_code=503, detail="busy")
+
+    template = _template()
+    suggestions, source = await race_llm_with_template(failing(), template, deadline=1.0)
+    assert (suggestions, source) == (template, "template")
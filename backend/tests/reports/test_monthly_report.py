@@ -0,0 +1,182 @@
+"""
+월간 방문 집계(monthly_rollups) 조회·재생성·증분 갱신 테스트 (DB 불필요)
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Any
+
+import pytest
+from bson import ObjectId
+
+from backend.app.services import monthly_rollups, reports, visit_events
+
+COUPLE_ID = ObjectId()
+MAY = datetime(2024, 5, 3)
+
+
+class _Cursor:
+    def __init__(self, docs: list[dict]) -> None:
+        self._docs = iter(docs)
+
+    def __aiter__(self) -> "_Cursor":
+        return self
+
+    async def __anext__(self) -> dict:
+        try:
+            return next(self._docs)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class _FakeVisits:
+    def __init__(self, facet: list[dict]) -> None:
+        self.facet = facet
+        self.pipelines: list[list[dict]] = []
+
+    def aggregate(self, pipeline: list[dict]) -> _Cursor:
+        self.pipelines.append(pipeline)
+        return _Cursor(self.facet)
+
+
+class _FakeRollups:
+    def __init__(self, docs: dict[str, dict] | None = None) -> None:
+        self.docs = docs or {}
+        self.reads = 0
+
+    async def find_one(self, query: dict) -> dict | None:
+        self.reads += 1
+        return self.docs.get(query["_id"])
+
+    async def replace_one(self, query: dict, doc: dict, upsert: bool = False) -> None:
+        self.docs[query["_id"]] = {"_id": query["_id"], **doc}
+
+    async def update_one(self, query: dict, update: dict) -> None:
+        doc = self.docs.get(query["_id"])
+        if doc is None:
+            return
+        guard = query.get("applied_events")
+        if guard and guard["$ne"] in doc["applied_events"]:
+            return
+        for path, value in update.get("$inc", {}).items():
+            if "." in path:
+                group, key = path.split(".", 1)
+                doc[group][key] = doc[group].get(key, 0) + value
+            else:
+                doc[path] = doc.get(path, 0) + value
+        for field, spec in update.get("$push", {}).items():
+            doc[field] = (doc.get(field, []) + spec["$each"])[spec.get("$slice", -10**6) :]
+        for field, spec in update.get("$pull", {}).items():
+            doc[field] = [item for item in doc[field] if item != spec]
+
+
+class _FakePlans:
+    async def distinct(self, key: str, query: dict) -> list[str]:
+        return ["힐링", "설렘"]
+
+
+class _FakeCouples:
+    async def find_one(self, query: dict, _projection: dict | None = None) -> dict | None:
+        return {"preferences": {"tags": ["카페"], "budget": "low"}}
+
+
+@pytest.fixture(autouse=True)
+def no_progress(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_progress(_db, couple_id: str) -> list[dict]:
+        return []
+
+    monkeypatch.setattr(reports, "get_progress", fake_progress)
+
+
+def _db(visits: _FakeVisits, rollups: _FakeRollups) -> dict[str, Any]:
+    return {
+        reports.VISITS_COL: visits,
+        reports.PLANS_COL: _FakePlans(),
+        reports.COUPLES_COL: _FakeCouples(),
+        monthly_rollups.MONTHLY_ROLLUPS_COL: rollups,
+    }
+
+
+def _rollup(**fields: Any) -> dict:
+    return {
+        "couple_id": COUPLE_ID,
+        "month": "2024-05",
+        "visit_count": 0,
+        "tags": {},
+        "emotions": {},
+        "notes": [],
+        "applied_events": [],
+        **fields,
+    }
+
+
+def test_report_is_read_from_one_rollup_document():
+    rollup_id = monthly_rollups.rollup_id(COUPLE_ID, "2024-05")
+    rollups = _FakeRollups(
+        {rollup_id: _rollup(visit_count=4, tags={"야경": 2, "카페": 2, "산책": 1, "a%2Eb": 1}, emotions={"설렘": 3})}
+    )
+    visits = _FakeVisits([])
+
+    report = asyncio.run(reports.build_monthly_report(_db(visits, rollups), str(COUPLE_ID), "2024-05"))
+
+    assert report["visit_count"] == 4
+    assert report["top_tags"] == ["야경", "카페", "a.b"]
+    assert report["emotion_stats"] == {"설렘": 3}
+    assert report["plan_emotion_goals"] == ["설렘", "힐링"]
+    assert rollups.reads == 1 and visits.pipelines == []
+
+
+def test_missing_rollup_is_built_from_visits():
+    pending_event = ObjectId()
+    facet = {
+        "count": [{"n": 2}],
+        "tags": [{"_id": "야경", "n": 2}],
+        "emotions": [{"_id": "힐링", "n": 1}],
+        "notes": [{"notes": [{"visit_id": ObjectId(), "memo": "좋았다"}]}],
+        visit_events.PENDING_EVENTS_FACET: [{"_id": None, "event_ids": [pending_event]}],
+    }
+    rollups = _FakeRollups()
+    visits = _FakeVisits([facet])
+
+    report = asyncio.run(reports.build_monthly_report(_db(visits, rollups), str(COUPLE_ID), "2024-05"))
+
+    assert (report["visit_count"], report["top_tags"], report["emotion_stats"]) == (2, ["야경"], {"힐링": 1})
+    assert len(visits.pipelines) == 1
+    stored = rollups.docs[monthly_rollups.rollup_id(COUPLE_ID, "2024-05")]
+    assert stored["tags"] == {"야경": 2} and stored["notes"][0]["memo"] == "좋았다"
+    # 같은 집계에서 읽은 처리 대기 이벤트만 처리한 것으로 기록
+    assert stored["applied_events"] == [pending_event]
+    assert visit_events.PENDING_EVENTS_FACET in visits.pipelines[0][-1]["$facet"]
+
+
+def test_visit_events_update_rollup_once_and_replace_memo():
+    rollup_id = monthly_rollups.rollup_id(COUPLE_ID, "2024-05")
+    rollups = _FakeRollups({rollup_id: _rollup()})
+    db = {monthly_rollups.MONTHLY_ROLLUPS_COL: rollups}
+    visit = visit_events.with_created_event(
+        {"couple_id": COUPLE_ID, "tags": ["카페"], "emotion": None, "memo": "", "created_at": MAY}, MAY
+    )
+    created = visit["outbox"][0]
+    reviewed = {
+        "event_id": ObjectId(),
+        "before": created["after"],
+        "after": {**created["after"], "emotion": "설렘", "memo": "첫 메모"},
+    }
+    edited = {
+        "event_id": ObjectId(),
+        "before": reviewed["after"],
+        "after": {**reviewed["after"], "memo": "고친 메모"},
+    }
+
+    async def scenario() -> None:
+        for event in (created, created, reviewed, edited, edited):
+            await monthly_rollups.record_visit_change(
+                db, COUPLE_ID, visit["_id"], event["before"], event["after"], event_id=event["event_id"]
+            )
+
+    asyncio.run(scenario())
+    doc = rollups.docs[rollup_id]
+    assert doc["visit_count"] == 1
+    assert doc["tags"] == {"카페": 1} and doc["emotions"] == {"설렘": 1}
+    assert doc["notes"] == [{"visit_id": visit["_id"], "memo": "고친 메모"}]
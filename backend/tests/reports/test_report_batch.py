@@ -0,0 +1,36 @@
+"""
+리포트 사전 생성 배치 보조 로직 테스트 (DB 불필요)
+"""
+import asyncio
+import time
+from datetime import datetime
+
+from backend.app.services.report_batch import RateLimiter
+from backend.app.services.monthly_rollups import month_range
+from backend.app.services.reports import is_closed_month
+
+
+def test_month_range_handles_december():
+    start, end = month_range("2024-12")
+    assert start == datetime(2024, 12, 1)
+    assert end == datetime(2025, 1, 1)
+
+
+def test_is_closed_month():
+    current = datetime.utcnow().strftime("%Y-%m")
+    assert not is_closed_month(current)
+    assert is_closed_month("2000-01")
+
+
+async def test_rate_limiter_spaces_calls():
+    limiter = RateLimiter(rate_per_minute=600)  # 0.1초 간격
+    started = time.monotonic()
+    await asyncio.gather(*(limiter.wait() for _ in range(4)))
+    assert time.monotonic() - started >= 0.29
+
+
+async def test_rate_limiter_disabled():
+    limiter = RateLimiter(rate_per_minute=0)
+    started = time.monotonic()
+    await asyncio.gather(*(limiter.wait() for _ in range(50)))
+    assert time.monotonic() - started < 0.05
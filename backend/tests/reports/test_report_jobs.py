@@ -0,0 +1,348 @@
+"""
+리포트 AI 요약 작업 큐 테스트 (Redis 불필요)
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from fastapi import Response
+
+from backend.app.api.routes import reports as reports_route
+from backend.app.core.config import settings
+from backend.app.schemas import ReportJobOut
+from backend.app.services import report_jobs, worker_pool
+
+COUPLE_ID = "c1"
+MONTH = "2024-05"
+
+
+class _FakeRedis:
+    """report_jobs가 쓰는 명령만 흉내 낸 Redis (decode_responses=True 기준, 리스트는 0번이 왼쪽 끝)"""
+
+    def __init__(self) -> None:
+        self.strings: dict[str, str] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.lists: dict[str, list[str]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.published: list[tuple[str, dict]] = []
+
+    async def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.strings:
+            return False
+        self.strings[key] = value
+        return True
+
+    async def get(self, key: str) -> str | None:
+        return self.strings.get(key)
+
+    async def delete(self, key: str) -> None:
+        self.strings.pop(key, None)
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.hashes)
+
+    async def expire(self, key: str, seconds: int) -> None:
+        return None
+
+    async def hset(self, key: str, mapping: dict[str, Any]) -> None:
+        self.hashes.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    async def hsetnx(self, key: str, field: str, value: Any) -> bool:
+        fields = self.hashes.setdefault(key, {})
+        if field in fields:
+            return False
+        fields[field] = str(value)
+        return True
+
+    async def hget(self, key: str, field: str) -> str | None:
+        return self.hashes.get(key, {}).get(field)
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    async def hdel(self, key: str, field: str) -> None:
+        self.hashes.get(key, {}).pop(field, None)
+
+    async def publish(self, channel: str, message: str) -> None:
+        self.published.append((channel, json.loads(message)))
+
+    async def lpush(self, key: str, value: str) -> None:
+        self.lists.setdefault(key, []).insert(0, value)
+
+    async def rpush(self, key: str, value: str) -> None:
+        self.lists.setdefault(key, []).append(value)
+
+    async def lrange(self, key: str, start: int, end: int) -> list[str]:
+        return list(self.lists.get(key, []))
+
+    async def lrem(self, key: str, count: int, value: str) -> int:
+        items = self.lists.get(key, [])
+        if value not in items:
+            return 0
+        items.remove(value)
+        return 1
+
+    async def brpoplpush(self, source: str, destination: str, timeout: int = 0) -> str | None:
+        items = self.lists.get(source)
+        if not items:
+            return None
+        value = items.pop()
+        self.lists.setdefault(destination, []).insert(0, value)
+        return value
+
+    async def zadd(self, key: str, mapping: dict[str, float]) -> None:
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zrangebyscore(self, key: str, low: float, high: float) -> list[str]:
+        return [member for member, score in self.zsets.get(key, {}).items() if low <= score <= high]
+
+    async def zrem(self, key: str, member: str) -> int:
+        return int(self.zsets.get(key, {}).pop(member, None) is not None)
+
+    def job(self, job_id: str) -> dict[str, str]:
+        return self.hashes[report_jobs.job_key(job_id)]
+
+
+@pytest.fixture
+def redis() -> _FakeRedis:
+    return _FakeRedis()
+
+
+@pytest.fixture
+def builds(monkeypatch: pytest.MonkeyPatch) -> list[Exception | None]:
+    """리포트 생성 결과 대본: None이면 성공, 예외면 그 예외를 던짐 (비어 있으면 성공)"""
+    script: list[Exception | None] = []
+
+    async def fake_build(_db, couple_id: str, month: str, include_summary: bool = False) -> dict:
+        outcome = script.pop(0) if script else None
+        if outcome is not None:
+            raise outcome
+        return {"couple_id": couple_id, "month": month, "ai_summary": "요약"}
+
+    monkeypatch.setattr(report_jobs, "get_or_build_monthly_report", fake_build)
+    monkeypatch.setattr(settings, "report_job_max_attempts", 2)
+    monkeypatch.setattr(settings, "report_job_retry_backoff_seconds", 5.0)
+    return script
+
+
+async def _run_next(redis: _FakeRedis) -> str:
+    job_id = await redis.brpoplpush(report_jobs.QUEUE_KEY, report_jobs.PROCESSING_KEY)
+    await report_jobs._process_claimed(redis, job_id)
+    return job_id
+
+
+def test_duplicate_submission_returns_pending_job(redis: _FakeRedis, builds: list):
+    async def scenario() -> None:
+        first = await report_jobs.submit_report_job(redis, COUPLE_ID, MONTH)
+        second = await report_jobs.submit_report_job(redis, COUPLE_ID, MONTH)
+        assert second["job_id"] == first["job_id"]
+        assert redis.lists[report_jobs.QUEUE_KEY] == [first["job_id"]]
+
+        # 이름이 다르면 다른 작업
+        named = await report_jobs.submit_report_job(redis, COUPLE_ID, MONTH, save=True, name="5월")
+        assert named["job_id"] != first["job_id"]
+
+        # 완료된 뒤에는 새 작업을 만듦
+        await _run_next(redis)
+        again = await report_jobs.submit_report_job(redis, COUPLE_ID, MONTH)
+        assert again["job_id"] != first["job_id"] and again["status"] == "queued"
+
+    asyncio.run(scenario())
+
+
+def test_failed_attempt_is_retried_after_backoff(redis: _FakeRedis, builds: list):
+    builds.append(RuntimeError("LLM 타임아웃"))
+
+    async def scenario() -> None:
+        job = await report_jobs.submit_report_job(redis, COUPLE_ID, MONTH)
+        started = time.time()
+        await _run_next(redis)
+
+        assert redis.job(job["job_id"])["status"] == "retrying"
+        assert redis.lists[report_jobs.PROCESSING_KEY] == []
+        due_at = redis.zsets[report_jobs.DELAYED_KEY][job["job_id"]]
+        assert started + 5.0 <= due_at <= time.time() + 5.0
+
+        # 백오프가 끝나기 전에는 대기열로 옮기지 않음
+        await report_jobs._promote_due_jobs(redis)
+        assert redis.lists[report_jobs.QUEUE_KEY] == []
+
+        redis.zsets[report_jobs.DELAYED_KEY][job["job_id"]] = 0
+        await report_jobs._promote_due_jobs(redis)
+        assert redis.lists[report_jobs.QUEUE_KEY] == [job["job_id"]]
+        await _run_next(redis)
+
+        done = await report_jobs.get_job(redis, job["job_id"])
+        assert done["status"] == "succeeded" and done["attempts"] == 2 and done["error"] is None
+        assert done["result"]["ai_summary"] == "요약"
+
+    asyncio.run(scenario())
+
+
+def test_job_fails_after_max_attempts(redis: _FakeRedis, builds: list):
+    builds.extend([RuntimeError("첫 실패"), RuntimeError("마지막 실패")])
+
+    async def scenario() -> None:
+        job = await report_jobs.submit_report_job(redis, COUPLE_ID, MONTH)
+        await _run_next(redis)
+        redis.zsets[report_jobs.DELAYED_KEY][job["job_id"]] = 0
+        await report_jobs._promote_due_jobs(redis)
+        await _run_next(redis)
+
+        failed = await report_jobs.get_job(redis, job["job_id"])
+        assert failed["status"] == "failed" and failed["attempts"] == 2
+        assert failed["error"] == "마지막 실패"
+        assert redis.zsets[report_jobs.DELAYED_KEY] == {}
+        assert job["dedup_key"] not in redis.strings
+
+    asyncio.run(scenario())
+
+
+def test_status_changes_are_published(redis: _FakeRedis, builds: list):
+    async def scenario() -> str:
+        job = await report_jobs.submit_report_job(redis, COUPLE_ID, MONTH)
+        await _run_next(redis)
+        return job["job_id"]
+
+    job_id = asyncio.run(scenario())
+    assert {channel for channel, _ in redis.published} == {report_jobs.events_channel(job_id)}
+    assert [event["status"] for _, event in redis.published] == ["running", "succeeded"]
+    assert redis.published[-1][1]["result"]["month"] == MONTH
+
+
+def test_requeue_waits_a_visibility_timeout_before_restoring(redis: _FakeRedis, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "report_job_visibility_timeout_seconds", 300)
+
+    async def scenario() -> None:
+        job = await report_jobs.submit_report_job(redis, COUPLE_ID, MONTH)
+        job_id = await redis.brpoplpush(report_jobs.QUEUE_KEY, report_jobs.PROCESSING_KEY)
+        redis.lists[report_jobs.PROCESSING_KEY].append("expired-job")
+
+        # 방금 꺼낸 작업(claimed_at 없음)은 처음 본 시각만 기록하고 남겨 둠, 만료된 작업은 제거
+        assert await report_jobs.requeue_stale_jobs(redis) == 0
+        assert redis.lists[report_jobs.PROCESSING_KEY] == [job_id]
+        assert "claimed_at" in redis.job(job_id)
+
+        assert await report_jobs.requeue_stale_jobs(redis) == 0
+
+        redis.job(job_id)["claimed_at"] = str(time.time() - 301)
+        assert await report_jobs.requeue_stale_jobs(redis) == 1
+        assert redis.lists[report_jobs.QUEUE_KEY] == [job["job_id"]]
+        assert redis.lists[report_jobs.PROCESSING_KEY] == []
+        assert "claimed_at" not in redis.job(job_id)
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_job_goes_back_to_front_of_queue(redis: _FakeRedis, monkeypatch: pytest.MonkeyPatch):
+    started = asyncio.Event()
+
+    async def slow_build(*_args: Any, **_kwargs: Any) -> dict:
+        started.set()
+        await asyncio.sleep(3600)
+        return {}
+
+    monkeypatch.setattr(report_jobs, "get_or_build_monthly_report", slow_build)
+
+    async def scenario() -> None:
+        job = await report_jobs.submit_report_job(redis, COUPLE_ID, MONTH)
+        other = await report_jobs.submit_report_job(redis, "c2", MONTH)
+        job_id = await redis.brpoplpush(report_jobs.QUEUE_KEY, report_jobs.PROCESSING_KEY)
+        assert job_id == job["job_id"]
+
+        task = asyncio.create_task(report_jobs._process_claimed(redis, job_id))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert redis.lists[report_jobs.PROCESSING_KEY] == []
+        # 다음 brpoplpush가 취소된 작업을 먼저 꺼냄
+        assert redis.lists[report_jobs.QUEUE_KEY] == [other["job_id"], job_id]
+        assert redis.job(job_id)["status"] == "queued"
+        # 같은 요청을 다시 보내면 복구된 작업을 그대로 돌려받음
+        assert (await report_jobs.submit_report_job(redis, COUPLE_ID, MONTH))["job_id"] == job_id
+
+    asyncio.run(scenario())
+
+
+def test_summary_and_save_endpoints_enqueue_instead_of_calling_llm(redis: _FakeRedis, monkeypatch: pytest.MonkeyPatch):
+    async def no_llm(*_args: Any, **_kwargs: Any) -> dict:
+        raise AssertionError("요청 안에서 리포트 요약을 생성함")
+
+    async def fake_couple(_db, user_id: str) -> dict:
+        return {"_id": COUPLE_ID}
+
+    monkeypatch.setattr(reports_route, "get_or_build_monthly_report", no_llm)
+    monkeypatch.setattr(reports_route, "get_or_create_couple", fake_couple)
+    user = SimpleNamespace(id="u1")
+    response = Response()
+
+    async def scenario() -> tuple[ReportJobOut, Any]:
+        summary = await reports_route.generate_monthly_summary(month=MONTH, current_user=user, db=None, redis=redis)
+        saved = await reports_route.save_monthly_report(
+            response, month=MONTH, current_user=user, db=None, redis=redis, report_data=None, name="5월"
+        )
+        return summary, saved
+
+    summary, saved = asyncio.run(scenario())
+    assert summary.status == "queued" and not summary.save
+    assert isinstance(saved, ReportJobOut) and saved.save and saved.name == "5월"
+    assert response.status_code == 202
+    assert len(redis.lists[report_jobs.QUEUE_KEY]) == 2
+
+
+class _IdlePool(worker_pool.WorkerPool):
+    async def _worker(self, index: int) -> None:
+        await asyncio.sleep(3600)
+
+
+def test_pool_restarts_on_a_new_event_loop(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "background_workers_enabled", True)
+    pool = _IdlePool(2)
+
+    # 이전 lifespan의 루프가 작업을 정리하지 못한 채 끝난 경우 (TestClient 등)
+    old_loop = asyncio.new_event_loop()
+
+    async def start_only() -> list[asyncio.Task]:
+        pool.start()
+        return list(pool._tasks)
+
+    stale = old_loop.run_until_complete(start_only())
+
+    async def lifespan() -> list[asyncio.Task]:
+        pool.start()
+        tasks = list(pool._tasks)
+        assert len(tasks) == 2 and all(task.get_loop() is asyncio.get_running_loop() for task in tasks)
+        await pool.stop()
+        return tasks
+
+    tasks = asyncio.run(lifespan())
+    assert all(task.cancelled() for task in tasks)
+    assert pool._tasks == [] and not any(task.done() for task in stale)
+
+    for task in stale:
+        task.cancel()
+    old_loop.run_until_complete(asyncio.gather(*stale, return_exceptions=True))
+    old_loop.close()
+
+
+def test_pool_does_not_start_when_disabled():
+    pool = _IdlePool(2)
+
+    async def lifespan() -> None:
+        pool.start()
+        assert pool._tasks == []
+        await pool.stop()
+
+    asyncio.run(lifespan())
+
+
+def test_pool_without_worker_cannot_be_created():
+    with pytest.raises(TypeError):
+        worker_pool.WorkerPool(1)
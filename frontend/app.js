@@ -10,6 +10,8 @@ const state = {
   visits: [],
   report: null,
   savedReports: [],
+  // 목록별 다음 페이지 커서 (null이면 마지막 페이지)
+  nextCursors: { plans: null, bookmarks: null, visits: null, savedReports: null },
   isGeneratingReport: false,
   mapSuggestions: [],
   llmSuggestions: [],
@@ -40,6 +42,7 @@ function handleLogout() {
     state.plans = [];
     state.bookmarks = [];
     state.visits = [];
+    state.nextCursors = { plans: null, bookmarks: null, visits: null, savedReports: null };
     state.report = null;
     state.reportLoading = false;
     state.summaryLoading = false;
@@ -53,6 +56,11 @@ function handleLogout() {
 
 const MAPS_CONFIG_ENDPOINT = "/api/config/maps";
 const AUTH_ENDPOINT = "/api/auth";
+// 커서 페이지네이션 목록 API: 한 번에 읽는 개수와 다음 페이지 커서 헤더
+const LIST_PAGE_SIZE = 20;
+const NEXT_CURSOR_HEADER = "X-Next-Cursor";
+// AI 요약은 작업 큐에서 생성되므로 완료될 때까지 작업 상태를 확인하는 간격(ms)
+const REPORT_JOB_POLL_INTERVAL_MS = 1500;
 
 function select(selector) {
   return document.querySelector(selector);
@@ -90,7 +98,7 @@ function markdownToHTML(text) {
     .replace(/\n/g, '<br>');
 }
 
-async function fetchJSON(url, options = {}) {
+async function fetchResponse(url, options = {}) {
   const headers = { "Content-Type": "application/json", ...(options.headers || {}) };
   if (state.accessToken) {
     headers["Authorization"] = `Bearer ${state.accessToken}`;
@@ -115,9 +123,76 @@ async function fetchJSON(url, options = {}) {
     const detail = await response.json().catch(() => ({}));
     throw new Error(detail.detail || `요청 실패 (${response.status})`);
   }
+  return response;
+}
+
+async function fetchJSON(url, options = {}) {
+  const response = await fetchResponse(url, options);
   return response.json();
 }
 
+// 요약 작업(202 응답)이 끝날 때까지 상태를 폴링해 완료된 작업을 반환
+async function waitForReportJob(job) {
+  while (job.status !== "succeeded" && job.status !== "failed") {
+    await new Promise((resolve) => setTimeout(resolve, REPORT_JOB_POLL_INTERVAL_MS));
+    job = await fetchJSON(`/api/reports/jobs/${job.job_id}`);
+  }
+  if (job.status === "failed") {
+    throw new Error(job.error || "리포트 요약을 생성하지 못했습니다.");
+  }
+  return job;
+}
+
+// 리포트 저장: 요약이 있는 리포트는 바로 저장되고, 없으면 요약 작업이 끝난 뒤 저장된 리포트 id를 받음
+async function saveMonthlyReport(month, report = null, name = null) {
+  const options = { method: "POST" };
+  if (report) {
+    options.body = JSON.stringify({ report_data: report, name });
+  }
+  const result = await fetchJSON(`/api/reports/monthly/save?month=${month}`, options);
+  if (!result.job_id) return result;
+  const job = await waitForReportJob(result);
+  return { ...job.result, id: job.saved_report_id };
+}
+
+// 목록 API 한 페이지: 항목과 다음 페이지 커서(없으면 null)
+async function fetchPage(url, cursor = null) {
+  const params = new URLSearchParams({ limit: String(LIST_PAGE_SIZE) });
+  if (cursor) params.set("cursor", cursor);
+  const response = await fetchResponse(`${url}?${params}`);
+  return { items: await response.json(), nextCursor: response.headers.get(NEXT_CURSOR_HEADER) };
+}
+
+// 목록 첫 페이지를 읽거나(more=false), "더 보기"로 다음 페이지를 이어 붙임(more=true)
+async function loadListPage(key, url, more = false) {
+  const cursor = more ? state.nextCursors[key] : null;
+  if (more && !cursor) return;
+  const { items, nextCursor } = await fetchPage(url, cursor);
+  state[key] = more ? [...state[key], ...items] : items;
+  state.nextCursors[key] = nextCursor;
+}
+
+// 다음 페이지가 있을 때만 "더 보기" 버튼을 만듦 (누르면 다음 페이지를 읽고 다시 그림)
+function createLoadMoreButton(key, loadMore, rerender) {
+  if (!state.nextCursors[key]) return null;
+  const button = document.createElement("button");
+  button.type = "button";
+  button.className = "ghost-btn";
+  button.textContent = "더 보기";
+  button.addEventListener("click", async () => {
+    button.disabled = true;
+    button.textContent = "불러오는 중...";
+    try {
+      await loadMore();
+    } catch (error) {
+      alert(error.message);
+    } finally {
+      rerender();
+    }
+  });
+  return button;
+}
+
 // frontend/app.js
 async function initMap() {
   try {
@@ -559,6 +634,9 @@ function renderRightPanel() {
     `;
     
     savedReportsCard.innerHTML = calendarHTML;
+    // 오래된 리포트는 "더 보기"로 이어서 불러와 달력에 표시
+    const moreReportsBtn = createLoadMoreButton("savedReports", () => loadSavedReports(true), renderRightPanel);
+    if (moreReportsBtn) savedReportsCard.appendChild(moreReportsBtn);
     container.appendChild(savedReportsCard);
     
     // 달력 스타일 추가
@@ -1012,6 +1090,8 @@ function renderPlannerView() {
       actions.appendChild(delBtn);
       listWrap.appendChild(node);
     });
+    const moreBtn = createLoadMoreButton("plans", () => loadPlans(true), renderPlannerView);
+    if (moreBtn) listWrap.appendChild(moreBtn);
   }
 
   sidebar.appendChild(formCard);
@@ -1983,9 +2063,7 @@ async function handleSaveReport() {
   
   try {
     const month = state.report.month;
-    const saved = await fetchJSON(`/api/reports/monthly/save?month=${month}`, {
-      method: "POST",
-    });
+    await saveMonthlyReport(month, state.report.summary ? state.report : null);
     
     await loadSavedReports();
     renderApp();
@@ -2009,16 +2087,7 @@ async function saveReportWithName(month, name) {
   
   try {
     // 리포트 데이터 저장
-    const saved = await fetchJSON(`/api/reports/monthly/save?month=${month}`, {
-      method: "POST",
-      body: JSON.stringify({
-        ...state.report,
-        name: name,
-      }),
-      headers: {
-        "Content-Type": "application/json",
-      },
-    });
+    const saved = await saveMonthlyReport(month, state.report.summary ? state.report : null, name);
     
     // 저장 성공 시 상태 업데이트
     state.report.name = name;
@@ -2069,13 +2138,14 @@ async function saveReportWithName(month, name) {
   }
 }
 
-async function loadSavedReports() {
+async function loadSavedReports(more = false) {
   if (!state.user) return;
   try {
-    state.savedReports = await fetchJSON("/api/reports/saved");
+    await loadListPage("savedReports", "/api/reports/saved", more);
     state.savedReportsLoaded = true;
   } catch (error) {
     console.error("저장된 리포트를 불러오지 못했습니다.", error);
+    if (more) throw error;
     // 401 에러인 경우 빈 배열로 설정하고 로그인 필요 상태로 전환
     state.savedReports = [];
     state.savedReportsLoaded = true;
@@ -2308,22 +2378,19 @@ async function loadCouple() {
   }
 }
 
-async function loadPlans() {
+async function loadPlans(more = false) {
   if (!state.user) return;
-  const data = await fetchJSON("/api/planner/plans");
-  state.plans = data;
+  await loadListPage("plans", "/api/planner/plans", more);
 }
 
-async function loadBookmarks() {
+async function loadBookmarks(more = false) {
   if (!state.user) return;
-  const data = await fetchJSON("/api/bookmarks/");
-  state.bookmarks = data;
+  await loadListPage("bookmarks", "/api/bookmarks/", more);
 }
 
-async function loadVisits() {
+async function loadVisits(more = false) {
   if (!state.user) return;
-  const data = await fetchJSON("/api/visits/");
-  state.visits = data;
+  await loadListPage("visits", "/api/visits/", more);
 }
 
 async function loadReport(month) {
@@ -2350,21 +2417,17 @@ async function loadReportSummary(month) {
   state.summaryLoading = true;
   renderApp();
   try {
-    const data = await fetchJSON(`/api/reports/monthly/summary?month=${month || new Date().toISOString().slice(0, 7)}`, {
+    const job = await fetchJSON(`/api/reports/monthly/summary?month=${month || new Date().toISOString().slice(0, 7)}`, {
           method: "POST",
     });
+    const data = (await waitForReportJob(job)).result;
     state.report = data;
     
     // 리포트 요약 생성 후 자동으로 DB에 저장 (이미 생성된 리포트 데이터 전달하여 중복 LLM 호출 방지)
     try {
       const defaultName = `${month || new Date().toISOString().slice(0, 7)} 리포트`;
-      const saved = await fetchJSON(`/api/reports/monthly/save?month=${month || new Date().toISOString().slice(0, 7)}`, {
-        method: "POST",
-        body: JSON.stringify({
-          ...data,
-          name: defaultName,
-        }),  // 이미 생성된 리포트 데이터 전달
-      });
+      // 이미 생성된 리포트 데이터 전달
+      await saveMonthlyReport(month || new Date().toISOString().slice(0, 7), data, defaultName);
       // 리포트 상태에 이름 추가
       state.report.name = defaultName;
       // 저장된 리포트 목록 새로고침
@@ -2924,7 +2987,7 @@ async function loadReportsSettings(container) {
           📊
         </div>
         <h2 class="section-title" style="margin: 0;">저장된 리포트</h2>
-        <span class="inline-chip" style="margin-left: auto; background: var(--accent-soft); color: var(--accent); font-weight: 600;">${state.savedReports.length}개</span>
+        <span class="inline-chip" style="margin-left: auto; background: var(--accent-soft); color: var(--accent); font-weight: 600;">${state.savedReports.length}${state.nextCursors.savedReports ? "+" : ""}개</span>
       </div>
       <div class="stack" style="max-height: 500px; overflow-y: auto; gap: 0.75rem;">
         ${state.savedReports.map(report => {
@@ -2975,6 +3038,9 @@ async function loadReportsSettings(container) {
       handleDeleteReport(reportId);
     });
   });
+
+  const moreBtn = createLoadMoreButton("savedReports", () => loadSavedReports(true), () => loadReportsSettings(container));
+  if (moreBtn) container.querySelector(".settings-card")?.appendChild(moreBtn);
 }
 
 // 계정 설정 핸들러